@@ -9,6 +9,10 @@ class AsymmetricAlgo(Enum):
     DSA = 'dsa'
     ECC = 'ecc'
     DH = 'dh'
+    ED25519 = 'ed25519'
+    ED448 = 'ed448'
+    X25519 = 'x25519'
+    ECDH = 'ecdh'
 
 class SymmetricAlgo(Enum):
     AES = 'aes'
@@ -17,6 +21,11 @@ class SymmetricAlgo(Enum):
     RC2 = 'rc2'
     RC4 = 'rc4'
     BLOWFISH = 'blowfish'
+    CAST_128 = 'cast-128'
+    TWOFISH = 'twofish'
+    CHACHA20 = 'chacha20'
+    CHACHA20_POLY1305 = 'chacha20-poly1305'
+    SALSA20 = 'salsa20'
 
 class MetricType(Enum):
     FILESIZE_TIME = 'filesize_time'
@@ -5,149 +5,1493 @@ RSA (Rivest-Shamir-Adleman)
 DSA (Digital Signature Algorithm)
 DH (Diffie-Hellman)
 ECC (Elliptic Curve Cryptography)
+EdDSA (Ed25519 and Ed448 signatures)
+X25519 (Curve25519 key agreement)
+ECDH (Elliptic Curve Diffie-Hellman on the NIST curves)
 """
 import os
 import time
 import csv
+import sys
+import queue
+import argparse
+import threading
+import multiprocessing
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import Crypto
+import cryptography
 from Crypto.PublicKey import RSA, DSA, ECC
-from Crypto.Cipher import PKCS1_OAEP
-from Crypto.Signature import pkcs1_15, DSS
-from Crypto.Hash import SHA256
-from cryptography.hazmat.primitives.asymmetric import dh
-from cryptography.hazmat.primitives import hashes
+from Crypto.Cipher import PKCS1_OAEP, PKCS1_v1_5, AES
+from Crypto.Random import get_random_bytes
+from Crypto.Signature import pkcs1_15, pss, DSS, eddsa
+from Crypto.Signature.pss import MGF1
+from Crypto.Hash import SHA1, SHA256, SHA512, SHAKE256
+from cryptography.hazmat.primitives.asymmetric import dh, ec, x25519, padding
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed, decode_dss_signature, encode_dss_signature
+from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.backends import default_backend
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.hashing import _hash_file
+from src.symmetric import PYCRYPTODOME, CRYPTOGRAPHY, _check_backend
+
 # Define constants
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'smaller_sample_text')
+LARGE_DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'sample_text')  # Same files as the symmetric suite
 ANALYSIS_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'asymmetric_analysis_results.csv')
+FILE_SIGNING_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'asymmetric_file_signing_results.csv')
+KEY_GENERATION_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'asymmetric_key_generation_results.csv')
+CONTEXT_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'asymmetric_context_results.csv')
+HANDSHAKE_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'asymmetric_handshake_results.csv')
+BATCH_VERIFY_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'asymmetric_batch_verify_results.csv')
+RSA_PADDING_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'rsa_padding_results.csv')
+KEY_SERIALIZATION_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'asymmetric_key_serialization_results.csv')
+NONCE_MODE_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'asymmetric_nonce_mode_results.csv')
+# Versions of the implementations selectable through the ``backend`` argument of RSA, DSA and ECC
+BACKEND_VERSIONS = {
+    PYCRYPTODOME: Crypto.__version__,
+    CRYPTOGRAPHY: f"{cryptography.__version__} ({default_backend().openssl_version_text()})",
+}
+ENVELOPE_KEY_SIZE = 32  # AES-256 data key wrapped by RSA-OAEP in envelope mode
+KEY_STORE_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'keys')
+KEY_GENERATION_REPEATS = 3  # Fresh key pairs generated per size in the key generation benchmark
+KEY_EXCHANGE_REPEATS = 10  # Key exchanges averaged per DH key size
+KEY_POOL_DEPTH = 4  # Ready key pairs KeyPool keeps queued per (algorithm, size)
+KEY_CACHE_SIZE = 64  # Parsed keys ParsedKeyCache keeps before evicting the least recently used
+SERIALIZATION_REPEATS = 200  # Calls averaged per algorithm, format and operation in the key serialization benchmark
+# Encodings export_key and import_key support per algorithm; raw encodings hold only the public value
+KEY_FORMATS = {
+    'RSA': ('PEM', 'DER', 'PKCS8-PEM', 'PKCS8-DER'),  # PEM and DER are PKCS#1
+    'DSA': ('PEM', 'DER', 'PKCS8-PEM', 'PKCS8-DER'),  # PEM and DER are the OpenSSL format
+    'ECC': ('PEM', 'DER', 'PKCS8-PEM', 'PKCS8-DER', 'raw'),  # PEM and DER are SEC1, raw is the uncompressed point
+    'DH': ('PKCS8-PEM', 'PKCS8-DER', 'raw'),  # raw is the big-endian public value
+}
+VERIFY_CHUNK_SIZE = 256  # Signatures sent to a verify_many worker process per job
+VERIFY_BATCH_SIZE = 2000  # Signatures per run in the batch verification benchmark
+FILE_CHUNK_SIZE = 1024 * 1024  # Bytes hashed per read by sign_file and verify_file
+HANDSHAKE_COUNT = 5000  # Ephemeral handshakes per parameter set and worker count in the throughput benchmark
+SIGNING_COUNT = 1000  # Signatures per key, nonce mode and RNG load in the nonce mode benchmark
+RNG_LOAD_CHUNK = 4096  # Bytes each RNG load process reads from os.urandom per call
+CONTEXT_REPEATS = 200  # Calls averaged per operation in the prepared-context benchmark
+RSA_PADDING_REPEATS = 50  # Calls averaged per operation and scheme in the RSA padding benchmark
+# RSA encryption paddings: OAEP (hash, MGF1 hash) by name, None for PKCS#1 v1.5
+RSA_PADDINGS = {
+    'oaep-sha1': ('SHA1', 'SHA1'),  # PKCS1_OAEP default
+    'oaep-sha256': ('SHA256', 'SHA256'),
+    'oaep-sha256-mgf1-sha1': ('SHA256', 'SHA1'),  # Java's RSA/ECB/OAEPWithSHA-256AndMGF1Padding
+    'pkcs1v15': None,
+}
+RSA_SIGNATURE_SCHEMES = ('pkcs1v15', 'pss')  # Both sign SHA-256; PSS uses MGF1-SHA-256
+PSS_SALT_LENGTHS = (0, 32, 64)  # Salt lengths swept by the RSA padding benchmark; the default is 32 (the SHA-256 size)
+_RSA_HASHES = {'SHA1': (SHA1, hashes.SHA1), 'SHA256': (SHA256, hashes.SHA256)}  # pycryptodome module, cryptography class
+DH_GENERATOR = 2
+
+# RFC 3526 MODP groups (generator 2)
+MODP_GROUPS = {
+    2048: int(
+        'FFFFFFFF FFFFFFFF C90FDAA2 2168C234 C4C6628B 80DC1CD1 29024E08 8A67CC74 '
+        '020BBEA6 3B139B22 514A0879 8E3404DD EF9519B3 CD3A431B 302B0A6D F25F1437 '
+        '4FE1356D 6D51C245 E485B576 625E7EC6 F44C42E9 A637ED6B 0BFF5CB6 F406B7ED '
+        'EE386BFB 5A899FA5 AE9F2411 7C4B1FE6 49286651 ECE45B3D C2007CB8 A163BF05 '
+        '98DA4836 1C55D39A 69163FA8 FD24CF5F 83655D23 DCA3AD96 1C62F356 208552BB '
+        '9ED52907 7096966D 670C354E 4ABC9804 F1746C08 CA18217C 32905E46 2E36CE3B '
+        'E39E772C 180E8603 9B2783A2 EC07A28F B5C55DF0 6F4C52C9 DE2BCBF6 95581718 '
+        '3995497C EA956AE5 15D22618 98FA0510 15728E5A 8AACAA68 FFFFFFFF FFFFFFFF'
+        .replace(' ', ''), 16),
+    3072: int(
+        'FFFFFFFF FFFFFFFF C90FDAA2 2168C234 C4C6628B 80DC1CD1 29024E08 8A67CC74 '
+        '020BBEA6 3B139B22 514A0879 8E3404DD EF9519B3 CD3A431B 302B0A6D F25F1437 '
+        '4FE1356D 6D51C245 E485B576 625E7EC6 F44C42E9 A637ED6B 0BFF5CB6 F406B7ED '
+        'EE386BFB 5A899FA5 AE9F2411 7C4B1FE6 49286651 ECE45B3D C2007CB8 A163BF05 '
+        '98DA4836 1C55D39A 69163FA8 FD24CF5F 83655D23 DCA3AD96 1C62F356 208552BB '
+        '9ED52907 7096966D 670C354E 4ABC9804 F1746C08 CA18217C 32905E46 2E36CE3B '
+        'E39E772C 180E8603 9B2783A2 EC07A28F B5C55DF0 6F4C52C9 DE2BCBF6 95581718 '
+        '3995497C EA956AE5 15D22618 98FA0510 15728E5A 8AAAC42D AD33170D 04507A33 '
+        'A85521AB DF1CBA64 ECFB8504 58DBEF0A 8AEA7157 5D060C7D B3970F85 A6E1E4C7 '
+        'ABF5AE8C DB0933D7 1E8C94E0 4A25619D CEE3D226 1AD2EE6B F12FFA06 D98A0864 '
+        'D8760273 3EC86A64 521F2B18 177B200C BBE11757 7A615D6C 770988C0 BAD946E2 '
+        '08E24FA0 74E5AB31 43DB5BFC E0FD108E 4B82D120 A93AD2CA FFFFFFFF FFFFFFFF'
+        .replace(' ', ''), 16),
+    4096: int(
+        'FFFFFFFF FFFFFFFF C90FDAA2 2168C234 C4C6628B 80DC1CD1 29024E08 8A67CC74 '
+        '020BBEA6 3B139B22 514A0879 8E3404DD EF9519B3 CD3A431B 302B0A6D F25F1437 '
+        '4FE1356D 6D51C245 E485B576 625E7EC6 F44C42E9 A637ED6B 0BFF5CB6 F406B7ED '
+        'EE386BFB 5A899FA5 AE9F2411 7C4B1FE6 49286651 ECE45B3D C2007CB8 A163BF05 '
+        '98DA4836 1C55D39A 69163FA8 FD24CF5F 83655D23 DCA3AD96 1C62F356 208552BB '
+        '9ED52907 7096966D 670C354E 4ABC9804 F1746C08 CA18217C 32905E46 2E36CE3B '
+        'E39E772C 180E8603 9B2783A2 EC07A28F B5C55DF0 6F4C52C9 DE2BCBF6 95581718 '
+        '3995497C EA956AE5 15D22618 98FA0510 15728E5A 8AAAC42D AD33170D 04507A33 '
+        'A85521AB DF1CBA64 ECFB8504 58DBEF0A 8AEA7157 5D060C7D B3970F85 A6E1E4C7 '
+        'ABF5AE8C DB0933D7 1E8C94E0 4A25619D CEE3D226 1AD2EE6B F12FFA06 D98A0864 '
+        'D8760273 3EC86A64 521F2B18 177B200C BBE11757 7A615D6C 770988C0 BAD946E2 '
+        '08E24FA0 74E5AB31 43DB5BFC E0FD108E 4B82D120 A9210801 1A723C12 A787E6D7 '
+        '88719A10 BDBA5B26 99C32718 6AF4E23C 1A946834 B6150BDA 2583E9CA 2AD44CE8 '
+        'DBBBC2DB 04DE8EF9 2E8EFC14 1FBECAA6 287C5947 4E6BC05D 99B2964F A090C3A2 '
+        '233BA186 515BE7ED 1F612970 CEE2D7AF B81BDD76 2170481C D0069127 D5B05AA9 '
+        '93B4EA98 8D8FDDC1 86FFB7DC 90A6C08F 4DF435C9 34063199 FFFFFFFF FFFFFFFF'
+        .replace(' ', ''), 16),
+}
+# RFC 7919 ffdhe groups (generator 2)
+FFDHE_GROUPS = {
+    2048: int(
+        'FFFFFFFF FFFFFFFF ADF85458 A2BB4A9A AFDC5620 273D3CF1 D8B9C583 CE2D3695 '
+        'A9E13641 146433FB CC939DCE 249B3EF9 7D2FE363 630C75D8 F681B202 AEC4617A '
+        'D3DF1ED5 D5FD6561 2433F51F 5F066ED0 85636555 3DED1AF3 B557135E 7F57C935 '
+        '984F0C70 E0E68B77 E2A689DA F3EFE872 1DF158A1 36ADE735 30ACCA4F 483A797A '
+        'BC0AB182 B324FB61 D108A94B B2C8E3FB B96ADAB7 60D7F468 1D4F42A3 DE394DF4 '
+        'AE56EDE7 6372BB19 0B07A7C8 EE0A6D70 9E02FCE1 CDF7E2EC C03404CD 28342F61 '
+        '9172FE9C E98583FF 8E4F1232 EEF28183 C3FE3B1B 4C6FAD73 3BB5FCBC 2EC22005 '
+        'C58EF183 7D1683B2 C6F34A26 C1B2EFFA 886B4238 61285C97 FFFFFFFF FFFFFFFF'
+        .replace(' ', ''), 16),
+    3072: int(
+        'FFFFFFFF FFFFFFFF ADF85458 A2BB4A9A AFDC5620 273D3CF1 D8B9C583 CE2D3695 '
+        'A9E13641 146433FB CC939DCE 249B3EF9 7D2FE363 630C75D8 F681B202 AEC4617A '
+        'D3DF1ED5 D5FD6561 2433F51F 5F066ED0 85636555 3DED1AF3 B557135E 7F57C935 '
+        '984F0C70 E0E68B77 E2A689DA F3EFE872 1DF158A1 36ADE735 30ACCA4F 483A797A '
+        'BC0AB182 B324FB61 D108A94B B2C8E3FB B96ADAB7 60D7F468 1D4F42A3 DE394DF4 '
+        'AE56EDE7 6372BB19 0B07A7C8 EE0A6D70 9E02FCE1 CDF7E2EC C03404CD 28342F61 '
+        '9172FE9C E98583FF 8E4F1232 EEF28183 C3FE3B1B 4C6FAD73 3BB5FCBC 2EC22005 '
+        'C58EF183 7D1683B2 C6F34A26 C1B2EFFA 886B4238 611FCFDC DE355B3B 6519035B '
+        'BC34F4DE F99C0238 61B46FC9 D6E6C907 7AD91D26 91F7F7EE 598CB0FA C186D91C '
+        'AEFE1309 85139270 B4130C93 BC437944 F4FD4452 E2D74DD3 64F2E21E 71F54BFF '
+        '5CAE82AB 9C9DF69E E86D2BC5 22363A0D ABC52197 9B0DEADA 1DBF9A42 D5C4484E '
+        '0ABCD06B FA53DDEF 3C1B20EE 3FD59D7C 25E41D2B 66C62E37 FFFFFFFF FFFFFFFF'
+        .replace(' ', ''), 16),
+    4096: int(
+        'FFFFFFFF FFFFFFFF ADF85458 A2BB4A9A AFDC5620 273D3CF1 D8B9C583 CE2D3695 '
+        'A9E13641 146433FB CC939DCE 249B3EF9 7D2FE363 630C75D8 F681B202 AEC4617A '
+        'D3DF1ED5 D5FD6561 2433F51F 5F066ED0 85636555 3DED1AF3 B557135E 7F57C935 '
+        '984F0C70 E0E68B77 E2A689DA F3EFE872 1DF158A1 36ADE735 30ACCA4F 483A797A '
+        'BC0AB182 B324FB61 D108A94B B2C8E3FB B96ADAB7 60D7F468 1D4F42A3 DE394DF4 '
+        'AE56EDE7 6372BB19 0B07A7C8 EE0A6D70 9E02FCE1 CDF7E2EC C03404CD 28342F61 '
+        '9172FE9C E98583FF 8E4F1232 EEF28183 C3FE3B1B 4C6FAD73 3BB5FCBC 2EC22005 '
+        'C58EF183 7D1683B2 C6F34A26 C1B2EFFA 886B4238 611FCFDC DE355B3B 6519035B '
+        'BC34F4DE F99C0238 61B46FC9 D6E6C907 7AD91D26 91F7F7EE 598CB0FA C186D91C '
+        'AEFE1309 85139270 B4130C93 BC437944 F4FD4452 E2D74DD3 64F2E21E 71F54BFF '
+        '5CAE82AB 9C9DF69E E86D2BC5 22363A0D ABC52197 9B0DEADA 1DBF9A42 D5C4484E '
+        '0ABCD06B FA53DDEF 3C1B20EE 3FD59D7C 25E41D2B 669E1EF1 6E6F52C3 164DF4FB '
+        '7930E9E4 E58857B6 AC7D5F42 D69F6D18 7763CF1D 55034004 87F55BA5 7E31CC7A '
+        '7135C886 EFB4318A ED6A1E01 2D9E6832 A907600A 918130C4 6DC778F9 71AD0038 '
+        '092999A3 33CB8B7A 1A1DB93D 7140003C 2A4ECEA9 F98D0ACC 0A8291CD CEC97DCF '
+        '8EC9B55A 7F88A46B 4DB5A851 F44182E1 C68A007E 5E655F6A FFFFFFFF FFFFFFFF'
+        .replace(' ', ''), 16),
+}
+DH_GROUPS = {'ffdhe': FFDHE_GROUPS, 'modp': MODP_GROUPS}
+DH_GENERATED = 'generated'  # Group name for parameters generated once and cached in the key store directory
+_dh_parameters = {}  # (group, key_size[, directory]) -> DHParameters already built in this process
+
+def export_key(algorithm, key, key_format):
+    """
+    Encode a key in one of the KEY_FORMATS of its algorithm.
+    
+    :param algorithm: 'RSA', 'DSA', 'ECC' or 'DH'.
+    :param key: The pycryptodome private key, or the cryptography private key for DH.
+    :param key_format: A format from KEY_FORMATS[algorithm].
+    :return: The encoded key as bytes; raw formats encode only the public key.
+    """
+    if key_format not in KEY_FORMATS[algorithm]:
+        raise ValueError(f"{algorithm} keys have no {key_format!r} encoding")
+    if algorithm == 'DH':
+        if key_format == 'raw':
+            public_value = key.public_key().public_numbers().y
+            return public_value.to_bytes((key.key_size + 7) // 8, 'big')
+        encoding = serialization.Encoding.PEM if key_format == 'PKCS8-PEM' else serialization.Encoding.DER
+        return key.private_bytes(encoding, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+
+    if key_format == 'raw':
+        return key.public_key().export_key(format='raw')
+    encoding = 'PEM' if key_format.endswith('PEM') else 'DER'
+    pkcs8 = key_format.startswith('PKCS8')
+    if algorithm == 'RSA':
+        encoded = key.export_key(format=encoding, pkcs=8 if pkcs8 else 1)
+    elif algorithm == 'DSA':
+        encoded = key.export_key(format=encoding, pkcs8=pkcs8)
+    else:
+        encoded = key.export_key(format=encoding, use_pkcs8=pkcs8)
+    return encoded.encode('ascii') if isinstance(encoded, str) else encoded
+
+def import_key(algorithm, encoded, key_format='PEM', key_size=None):
+    """
+    Parse a key encoded by export_key.
+    
+    :param algorithm: 'RSA', 'DSA', 'ECC', 'EdDSA' or 'DH'.
+    :param encoded: The encoded key.
+    :param key_format: The format it was encoded in.
+    :param key_size: The curve name for raw ECC points, or the key size of the DH group for raw DH values.
+    :return: The pycryptodome key, or the cryptography key for DH.
+    """
+    if algorithm == 'DH':
+        if key_format == 'raw':
+            parameter_numbers = load_dh_parameters(key_size).parameter_numbers()
+            return dh.DHPublicNumbers(int.from_bytes(encoded, 'big'), parameter_numbers).public_key()
+        if key_format == 'PKCS8-PEM':
+            return serialization.load_pem_private_key(encoded, password=None)
+        return serialization.load_der_private_key(encoded, password=None)
+    if key_format == 'raw':
+        return ECC.import_key(encoded, curve_name=key_size)
+    return KeyStore.modules[algorithm].import_key(encoded)
+
+class ParsedKeyCache:
+    """
+    LRU cache of parsed keys keyed by the fingerprint of their encoding.
+    
+    Loading the same PEM or DER bytes again returns the key object parsed the
+    first time. The SHA-256 of the encoded bytes is the fingerprint, so a
+    changed file is parsed again.
+    """
+    def __init__(self, capacity=KEY_CACHE_SIZE):
+        """
+        Initialize the cache.
+        
+        :param capacity: Number of parsed keys kept before the least recently used is evicted.
+        """
+        self.capacity = capacity
+        self.keys = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, algorithm, encoded, key_format='PEM', key_size=None):
+        """
+        Return the parsed key for an encoding, parsing it on a miss.
+        
+        :param algorithm: 'RSA', 'DSA', 'ECC', 'EdDSA' or 'DH'.
+        :param encoded: The encoded key.
+        :param key_format: The format it was encoded in.
+        :param key_size: Passed to import_key for raw encodings.
+        :return: The parsed key.
+        """
+        fingerprint = (algorithm, SHA256.new(encoded).digest())
+        with self.lock:
+            if fingerprint in self.keys:
+                self.hits += 1
+                self.keys.move_to_end(fingerprint)
+                return self.keys[fingerprint]
+            self.misses += 1
+        key = import_key(algorithm, encoded, key_format, key_size)
+        with self.lock:
+            self.keys[fingerprint] = key
+            self.keys.move_to_end(fingerprint)
+            while len(self.keys) > self.capacity:
+                self.keys.popitem(last=False)
+        return key
+
+    def metrics(self):
+        """
+        Return the hit and miss counters.
+        
+        :return: A dictionary with hits, misses, hit_rate and the number of cached keys.
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0,
+                'size': len(self.keys),
+            }
+
+    def clear(self):
+        """
+        Drop every cached key and reset the counters.
+        """
+        with self.lock:
+            self.keys.clear()
+            self.hits = 0
+            self.misses = 0
+
+class KeyStore:
+    """
+    On-disk store of pre-generated RSA, DSA and ECC key pairs.
+    
+    Keys are kept as PEM files named after the algorithm, the key size (or
+    curve) and a seed, so several distinct key pairs can be kept per size.
+    A missing key is generated once and saved for every later run.
+    """
+    modules = {'RSA': RSA, 'DSA': DSA, 'ECC': ECC, 'EdDSA': ECC}
+
+    def __init__(self, directory=KEY_STORE_DIR, cache=None):
+        """
+        Initialize the key store.
+        
+        :param directory: Directory holding the PEM files (created on first save).
+        :param cache: ParsedKeyCache that parses the loaded PEM files (default is to parse on every load).
+        """
+        self.directory = directory
+        self.cache = cache
+
+    def path(self, algorithm, key_size, seed=0):
+        """
+        Return the path of the PEM file for a key pair.
+        
+        :param algorithm: 'RSA', 'DSA' or 'ECC'.
+        :param key_size: Key size in bits, or the curve name for ECC.
+        :param seed: Identifies one of several key pairs of the same size.
+        :return: The file path.
+        """
+        return os.path.join(self.directory, f"{algorithm.lower()}_{key_size}_{seed}.pem")
+
+    def generate(self, algorithm, key_size):
+        """
+        Generate a new key pair without touching the store.
+        
+        :param algorithm: 'RSA', 'DSA', 'ECC' or 'EdDSA'.
+        :param key_size: Key size in bits, or the curve name for ECC and EdDSA.
+        :return: The new private key.
+        """
+        if algorithm in ('ECC', 'EdDSA'):
+            return ECC.generate(curve=key_size)
+        return self.modules[algorithm].generate(key_size)
+
+    def load(self, algorithm, key_size, seed=0):
+        """
+        Load a key pair from the store, generating and saving it if it is missing.
+        
+        :param algorithm: 'RSA', 'DSA' or 'ECC'.
+        :param key_size: Key size in bits, or the curve name for ECC.
+        :param seed: Identifies one of several key pairs of the same size.
+        :return: The private key.
+        """
+        path = self.path(algorithm, key_size, seed)
+        if os.path.exists(path):
+            with open(path, 'rb') as file:
+                pem = file.read()
+            if self.cache is not None:
+                return self.cache.load(algorithm, pem)
+            return self.modules[algorithm].import_key(pem)
+        key = self.generate(algorithm, key_size)
+        self.save(key, algorithm, key_size, seed)
+        return key
+
+    def save(self, key, algorithm, key_size, seed=0):
+        """
+        Save a key pair to the store.
+        
+        The file is written under a temporary name and renamed, so a concurrent
+        reader never sees a partial key. It is created readable by the owner only.
+        
+        :param key: The private key.
+        :param algorithm: 'RSA', 'DSA' or 'ECC'.
+        :param key_size: Key size in bits, or the curve name for ECC.
+        :param seed: Identifies one of several key pairs of the same size.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(algorithm, key_size, seed)
+        pem = key.export_key(format='PEM')
+        if isinstance(pem, str):
+            pem = pem.encode('ascii')
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as file:
+            file.write(pem)
+        os.replace(tmp_path, path)
+
+# Store the asymmetric classes load their keys from unless given another one
+default_key_cache = ParsedKeyCache()
+default_key_store = KeyStore(cache=default_key_cache)
+
+def _generate_key_pem(algorithm, key_size):
+    """
+    Generate a key pair in a KeyPool worker process.
+    
+    :return: The private key as PEM bytes, which can be sent back to the parent process.
+    """
+    pem = default_key_store.generate(algorithm, key_size).export_key(format='PEM')
+    return pem.encode('ascii') if isinstance(pem, str) else pem
+
+class KeyPool:
+    """
+    Background producer of fresh RSA, DSA and ECC key pairs.
+    
+    A process pool keeps a bounded queue of ready key pairs for each
+    (algorithm, size), so callers that need a new key take one instead of
+    waiting for generation. Every taken key is replaced in the background.
+    A failed generation job is queued as its exception, which take() raises.
+    """
+    def __init__(self, sizes, depth=KEY_POOL_DEPTH, processes=None):
+        """
+        Initialize the pool and start filling the queues.
+        
+        :param sizes: (algorithm, key_size) pairs to produce, e.g. [('RSA', 2048), ('ECC', 'P-256')].
+        :param depth: Number of ready key pairs kept per (algorithm, size).
+        :param processes: Number of worker processes (default is the CPU count).
+        """
+        self.depth = depth
+        self.executor = ProcessPoolExecutor(processes)
+        self.lock = threading.Lock()
+        self.closed = False
+        self.started = time.time()
+        self.queues = {spec: queue.Queue(maxsize=depth) for spec in sizes}
+        self.pending = {spec: 0 for spec in self.queues}
+        self.generated = {spec: 0 for spec in self.queues}
+        self.failed = {spec: 0 for spec in self.queues}
+        self.generation_time = {spec: 0.0 for spec in self.queues}
+        self.taken = {spec: 0 for spec in self.queues}
+        self.wait_time = {spec: 0.0 for spec in self.queues}
+        for spec in self.queues:
+            self._refill(spec)
+
+    def _refill(self, spec):
+        """
+        Submit generation jobs until the queued and pending keys reach the depth.
+        
+        :param spec: The (algorithm, key_size) pair to refill.
+        """
+        futures = []
+        with self.lock:
+            while not self.closed and self.queues[spec].qsize() + self.pending[spec] < self.depth:
+                self.pending[spec] += 1
+                futures.append((self.executor.submit(_generate_key_pem, *spec), time.time()))
+        # Attached outside the lock: a job that is already done runs _collect on this thread
+        for future, submitted in futures:
+            future.add_done_callback(lambda future, submitted=submitted: self._collect(spec, future, submitted))
+
+    def _collect(self, spec, future, submitted):
+        """
+        Queue a key pair finished by a worker process.
+        
+        :param spec: The (algorithm, key_size) pair of the key.
+        :param future: The finished generation job.
+        :param submitted: Time the job was submitted.
+        """
+        with self.lock:
+            self.pending[spec] -= 1
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                # Wakes a waiting take(), which raises it
+                self.failed[spec] += 1
+                self.queues[spec].put_nowait(future.exception())
+                return
+            self.generated[spec] += 1
+            self.generation_time[spec] += time.time() - submitted
+            self.queues[spec].put_nowait(KeyStore.modules[spec[0]].import_key(future.result()))
+
+    def take(self, algorithm, key_size, timeout=None):
+        """
+        Take a ready key pair, waiting for one if the queue is empty.
+        
+        :param algorithm: 'RSA', 'DSA' or 'ECC'.
+        :param key_size: Key size in bits, or the curve name for ECC.
+        :param timeout: Seconds to wait for a key (default is to wait indefinitely).
+        :return: The private key.
+        :raises ValueError: If the pool does not produce keys of this algorithm and size.
+        :raises queue.Empty: If no key is ready within the timeout.
+        :raises Exception: The error of the generation job whose result was taken.
+        """
+        spec = (algorithm, key_size)
+        if spec not in self.queues:
+            raise ValueError(f"KeyPool does not produce {algorithm} {key_size} keys")
+        start_time = time.time()
+        key = self.queues[spec].get(timeout=timeout)
+        # Refilled after a failure too, so a transient error costs one take() only
+        self._refill(spec)
+        if isinstance(key, Exception):
+            raise key
+        with self.lock:
+            self.taken[spec] += 1
+            self.wait_time[spec] += time.time() - start_time
+        return key
+
+    def metrics(self):
+        """
+        Return the pool metrics for each (algorithm, size).
+        
+        :return: A dictionary mapping each (algorithm, key_size) to its queue depth,
+                 keys generated, failed generation jobs, refill rate in keys/s since the pool started,
+                 average generation time, keys taken and average wait time in take().
+        """
+        elapsed = time.time() - self.started
+        with self.lock:
+            return {
+                spec: {
+                    'queue_depth': self.queues[spec].qsize(),
+                    'pending': self.pending[spec],
+                    'generated': self.generated[spec],
+                    'failed': self.failed[spec],
+                    'refill_rate': self.generated[spec] / elapsed if elapsed > 0 else 0,
+                    'avg_generation_time': self.generation_time[spec] / self.generated[spec] if self.generated[spec] else 0,
+                    'taken': self.taken[spec],
+                    'avg_wait_time': self.wait_time[spec] / self.taken[spec] if self.taken[spec] else 0,
+                }
+                for spec in self.queues
+            }
+
+    def close(self):
+        """
+        Stop the worker processes, dropping key pairs still being generated.
+        """
+        with self.lock:
+            self.closed = True
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def load_key(algorithm, key_size, fresh, seed, key_store, key_pool=None):
+    """
+    Return a private key from the key pool or key store, or a newly generated one.
+    
+    :param algorithm: 'RSA', 'DSA' or 'ECC'.
+    :param key_size: Key size in bits, or the curve name for ECC.
+    :param fresh: Generate a new key instead of using the store.
+    :param seed: Identifies one of several stored key pairs of the same size.
+    :param key_store: The store to use (default is default_key_store).
+    :param key_pool: KeyPool to take a fresh key from; takes precedence over the store.
+    :return: The private key.
+    """
+    if key_pool is not None:
+        return key_pool.take(algorithm, key_size)
+    key_store = key_store or default_key_store
+    if fresh:
+        return key_store.generate(algorithm, key_size)
+    return key_store.load(algorithm, key_size, seed)
+
+def _openssl_key(key):
+    """
+    Load a pycryptodome RSA, DSA or ECC key into the cryptography package.
+    
+    :param key: The pycryptodome private or public key.
+    :return: The equivalent cryptography key.
+    """
+    pem = key.export_key(format='PEM')
+    if isinstance(pem, str):
+        pem = pem.encode('ascii')
+    if key.has_private():
+        return serialization.load_pem_private_key(pem, password=None)
+    return serialization.load_pem_public_key(pem)
+
+class _OpenSSLSignatureScheme:
+    """
+    Adapter giving a ``cryptography`` RSA, DSA or ECC key the sign/verify
+    interface of the pycryptodome PKCS#1 v1.5, PSS and DSS schemes.
+    
+    The SHA-256 hash object is signed as a prehashed digest, and DSA and ECDSA
+    signatures are converted between DER and the fixed-length r || s encoding
+    DSS uses, so signatures verify with either backend.
+    """
+    def __init__(self, algorithm, key, signature_scheme='pkcs1v15', salt_length=None, deterministic=False):
+        """
+        Initialize the adapter.
+        
+        :param algorithm: 'RSA', 'DSA' or 'ECC'.
+        :param key: The cryptography private or public key.
+        :param signature_scheme: 'pkcs1v15' or 'pss', for RSA only.
+        :param salt_length: PSS salt length in bytes (default is the SHA-256 digest size).
+        :param deterministic: Derive ECDSA nonces with RFC 6979 (OpenSSL 3.2 or later).
+        """
+        self.algorithm = algorithm
+        self.key = key
+        self.prehashed = Prehashed(hashes.SHA256())
+        self.deterministic = deterministic
+        if algorithm == 'RSA':
+            if signature_scheme == 'pss':
+                salt_length = SHA256.digest_size if salt_length is None else salt_length
+                self.rsa_padding = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=salt_length)
+            else:
+                self.rsa_padding = padding.PKCS1v15()
+        elif algorithm == 'DSA':
+            self.order_size = (key.parameters().parameter_numbers().q.bit_length() + 7) // 8
+        elif algorithm == 'ECC':
+            self.order_size = (key.curve.key_size + 7) // 8
+
+    def sign(self, msg_hash):
+        """
+        Sign a SHA-256 hash object.
+        
+        :param msg_hash: The pycryptodome hash object.
+        :return: The signature.
+        """
+        digest = msg_hash.digest()
+        if self.algorithm == 'RSA':
+            return self.key.sign(digest, self.rsa_padding, self.prehashed)
+        if self.algorithm == 'DSA':
+            der = self.key.sign(digest, self.prehashed)
+        else:
+            der = self.key.sign(digest, ec.ECDSA(self.prehashed, deterministic_signing=self.deterministic))
+        r, s = decode_dss_signature(der)
+        return r.to_bytes(self.order_size, 'big') + s.to_bytes(self.order_size, 'big')
+
+    def verify(self, msg_hash, signature):
+        """
+        Verify a signature on a SHA-256 hash object.
+        
+        :param msg_hash: The pycryptodome hash object.
+        :param signature: The signature to verify.
+        :raises ValueError: If the signature is not valid.
+        """
+        digest = msg_hash.digest()
+        try:
+            if self.algorithm == 'RSA':
+                self.key.verify(signature, digest, self.rsa_padding, self.prehashed)
+                return
+            if len(signature) != 2 * self.order_size:
+                raise ValueError("The signature has the wrong length")
+            der = encode_dss_signature(int.from_bytes(signature[:self.order_size], 'big'),
+                                       int.from_bytes(signature[self.order_size:], 'big'))
+            if self.algorithm == 'DSA':
+                self.key.verify(der, digest, self.prehashed)
+            else:
+                self.key.verify(der, digest, ec.ECDSA(self.prehashed))
+        except InvalidSignature:
+            raise ValueError("The signature is not authentic")
+
+class _OpenSSLRSACipher:
+    """
+    Adapter giving a ``cryptography`` RSA private key the encrypt/decrypt
+    interface of pycryptodome's PKCS1_OAEP.
+    """
+    def __init__(self, key, rsa_padding='oaep-sha1'):
+        """
+        Initialize the adapter.
+        
+        :param key: The cryptography RSA private key.
+        :param rsa_padding: A name from RSA_PADDINGS.
+        """
+        self.key = key
+        self.public_key = key.public_key()
+        if RSA_PADDINGS[rsa_padding] is None:
+            self.padding = padding.PKCS1v15()
+        else:
+            hash_name, mgf_hash_name = RSA_PADDINGS[rsa_padding]
+            self.padding = padding.OAEP(mgf=padding.MGF1(_RSA_HASHES[mgf_hash_name][1]()),
+                                        algorithm=_RSA_HASHES[hash_name][1](), label=None)
+
+    def encrypt(self, plaintext):
+        """
+        Encrypt with the public key.
+        """
+        return self.public_key.encrypt(bytes(plaintext), self.padding)
+
+    def decrypt(self, ciphertext):
+        """
+        Decrypt with the private key, raising ValueError if the padding is wrong.
+        """
+        return self.key.decrypt(bytes(ciphertext), self.padding)
+
+class _PKCS1v15Cipher:
+    """
+    Adapter giving pycryptodome's PKCS1_v1_5 cipher the encrypt/decrypt
+    interface of PKCS1_OAEP: decrypt raises ValueError instead of returning
+    a sentinel. Only meant for benchmarking, as PKCS#1 v1.5 decryption errors
+    are a padding oracle.
+    """
+    def __init__(self, key):
+        """
+        Initialize the adapter.
+        
+        :param key: The pycryptodome RSA private key.
+        """
+        self.cipher = PKCS1_v1_5.new(key)
+
+    def encrypt(self, plaintext):
+        """
+        Encrypt with the public key.
+        """
+        return self.cipher.encrypt(plaintext)
+
+    def decrypt(self, ciphertext):
+        """
+        Decrypt with the private key, raising ValueError if the padding is wrong.
+        """
+        plaintext = self.cipher.decrypt(ciphertext, None)
+        if plaintext is None:
+            raise ValueError("Incorrect decryption.")
+        return plaintext
+
+def new_rsa_cipher(key, rsa_padding='oaep-sha1', backend=PYCRYPTODOME):
+    """
+    Build the RSA encryption cipher for a padding.
+    
+    :param key: The pycryptodome RSA private key.
+    :param rsa_padding: A name from RSA_PADDINGS.
+    :param backend: PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
+    :return: An object with encrypt and decrypt methods.
+    """
+    if backend == CRYPTOGRAPHY:
+        return _OpenSSLRSACipher(_openssl_key(key), rsa_padding)
+    if RSA_PADDINGS[rsa_padding] is None:
+        return _PKCS1v15Cipher(key)
+    hash_name, mgf_hash_name = RSA_PADDINGS[rsa_padding]
+    mgf_hash = _RSA_HASHES[mgf_hash_name][0]
+    return PKCS1_OAEP.new(key, hashAlgo=_RSA_HASHES[hash_name][0],
+                          mgfunc=lambda seed, length: MGF1(seed, length, mgf_hash))
+
+def rsa_max_message_size(key_size, rsa_padding='oaep-sha1'):
+    """
+    Return the largest plaintext RSA can encrypt in one block with a padding.
+    
+    :param key_size: Size of the RSA modulus in bits.
+    :param rsa_padding: A name from RSA_PADDINGS.
+    :return: The maximum plaintext size in bytes.
+    """
+    modulus_bytes = (key_size + 7) // 8
+    if RSA_PADDINGS[rsa_padding] is None:
+        return modulus_bytes - 11
+    hash_size = _RSA_HASHES[RSA_PADDINGS[rsa_padding][0]][0].digest_size
+    return modulus_bytes - 2 * hash_size - 2
+
+class PreparedKey:
+    """
+    Objects derived from a private key once and reused by every operation.
+    
+    The public key, the signer and verifier schemes and, for RSA, the
+    encryption cipher are built when the key is loaded, so sign and verify
+    only hash the message and do the key operation.
+    """
+    def __init__(self, algorithm, key, backend=PYCRYPTODOME, rsa_padding='oaep-sha1', signature_scheme='pkcs1v15',
+                 salt_length=None, deterministic=False):
+        """
+        Prepare the key.
+        
+        :param algorithm: 'RSA', 'DSA', 'ECC' or 'EdDSA'.
+        :param key: The pycryptodome private key.
+        :param backend: PYCRYPTODOME, or CRYPTOGRAPHY (OpenSSL) for RSA, DSA and ECC.
+        :param rsa_padding: RSA encryption padding, a name from RSA_PADDINGS.
+        :param signature_scheme: RSA signature scheme, 'pkcs1v15' or 'pss'.
+        :param salt_length: PSS salt length in bytes (default is the SHA-256 digest size).
+        :param deterministic: Sign DSA and ECC with RFC 6979 nonces instead of random ones.
+        """
+        self.algorithm = algorithm
+        self.backend = backend
+        self.rsa_padding = rsa_padding
+        self.signature_scheme = signature_scheme
+        self.salt_length = salt_length
+        self.deterministic = deterministic
+        self.key = key
+        self.public_key = key.public_key()
+        self.signer = new_signature_scheme(algorithm, key, backend, signature_scheme, salt_length, deterministic)
+        self.verifier = new_signature_scheme(algorithm, self.public_key, backend, signature_scheme, salt_length)
+        self.cipher = None
+        if algorithm == 'RSA':
+            self.cipher = new_rsa_cipher(key, rsa_padding, backend)
+
+def deterministic_signing_supported(algorithm, backend):
+    """
+    Check whether a backend can sign with RFC 6979 nonces.
+    
+    :param algorithm: 'DSA' or 'ECC'.
+    :param backend: PYCRYPTODOME or CRYPTOGRAPHY.
+    :return: True if deterministic signing is available.
+    """
+    if backend == PYCRYPTODOME:
+        return True
+    if algorithm == 'ECC':
+        # Deterministic ECDSA needs OpenSSL 3.2 or later, and a cryptography release that exposes it
+        return getattr(default_backend(), 'ecdsa_deterministic_supported', lambda: False)()
+    return False
+
+def new_signature_scheme(algorithm, key, backend=PYCRYPTODOME, signature_scheme='pkcs1v15', salt_length=None,
+                         deterministic=False):
+    """
+    Build the signature scheme used by the class for the algorithm.
+    
+    :param algorithm: 'RSA' (PKCS#1 v1.5 or PSS), 'DSA' or 'ECC' (FIPS 186-3 DSS), or 'EdDSA' (RFC 8032).
+    :param key: The pycryptodome private key for signing, or public key for verification.
+    :param backend: PYCRYPTODOME, or CRYPTOGRAPHY (OpenSSL) for RSA, DSA and ECC.
+    :param signature_scheme: RSA signature scheme, 'pkcs1v15' or 'pss'; ignored for other algorithms.
+    :param salt_length: PSS salt length in bytes (default is the SHA-256 digest size).
+    :param deterministic: Use RFC 6979 nonces for DSA and ECC; ignored for other algorithms.
+    :return: The signature scheme object.
+    """
+    if backend == CRYPTOGRAPHY:
+        return _OpenSSLSignatureScheme(algorithm, _openssl_key(key), signature_scheme, salt_length, deterministic)
+    if algorithm == 'RSA' and signature_scheme == 'pss':
+        return pss.new(key, salt_bytes=salt_length)
+    if algorithm == 'RSA':
+        return pkcs1_15.new(key)
+    if algorithm == 'EdDSA':
+        return eddsa.new(key, 'rfc8032')
+    return DSS.new(key, 'deterministic-rfc6979' if deterministic else 'fips-186-3')
+
+def message_digest(algorithm, message):
+    """
+    Return what the algorithm's signature scheme signs for a message.
+    
+    :param algorithm: 'RSA', 'DSA', 'ECC' or 'EdDSA'.
+    :param message: The message, str or bytes.
+    :return: The SHA-256 hash object, or the message bytes for EdDSA, which hashes internally.
+    """
+    if isinstance(message, str):
+        message = message.encode('utf-8')
+    if algorithm == 'EdDSA':
+        return message
+    return SHA256.new(message)
+
+def sign_message(algorithm, signer, message):
+    """
+    Sign a message with a prepared signer.
+    
+    :param algorithm: 'RSA', 'DSA', 'ECC' or 'EdDSA'.
+    :param signer: A scheme returned by new_signature_scheme for a private key.
+    :param message: The message to sign.
+    :return: The signature.
+    """
+    return signer.sign(message_digest(algorithm, message))
+
+def verify_message(algorithm, verifier, message, signature):
+    """
+    Verify a signature with a prepared verifier.
+    
+    :param algorithm: 'RSA', 'DSA', 'ECC' or 'EdDSA'.
+    :param verifier: A scheme returned by new_signature_scheme.
+    :param message: The message to verify.
+    :param signature: The signature to verify.
+    :return: True if the signature is valid, False otherwise.
+    """
+    try:
+        verifier.verify(message_digest(algorithm, message), signature)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+def file_digest(context, path, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+    """
+    Hash a file incrementally for signing, without loading it into memory.
+    
+    The file is read in fixed-size chunks into one reused buffer, or hashed
+    from a memory map. EdDSA keys get the hash of their prehash variant
+    (SHA-512 for Ed25519ph, SHAKE256 for Ed448ph), so their file signatures
+    do not verify with verify() and vice versa.
+    
+    :param context: The PreparedKey of the signing key.
+    :param path: Path of the file to hash.
+    :param chunk_size: Number of bytes read per chunk.
+    :param use_mmap: Hash through a memory map instead of chunked reads.
+    :return: The hash object, ready to be signed or verified.
+    """
+    if context.algorithm != 'EdDSA':
+        h = SHA256.new()
+    elif context.key.curve == 'Ed25519':
+        h = SHA512.new()
+    else:
+        h = SHAKE256.new()
+    return _hash_file(h, path, chunk_size, use_mmap)
+
+def _sign_file(context, path, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+    """
+    Sign a file from its incrementally computed hash.
+    
+    :param context: The PreparedKey of the signing key.
+    :param path: Path of the file to sign.
+    :param chunk_size: Number of bytes read per chunk.
+    :param use_mmap: Hash through a memory map instead of chunked reads.
+    :return: The signature.
+    """
+    return context.signer.sign(file_digest(context, path, chunk_size, use_mmap))
+
+def _verify_file(context, path, signature, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+    """
+    Verify a signature made by _sign_file.
+    
+    :param context: The PreparedKey of the signing key.
+    :param path: Path of the file to verify.
+    :param signature: The signature to verify.
+    :param chunk_size: Number of bytes read per chunk.
+    :param use_mmap: Hash through a memory map instead of chunked reads.
+    :return: True if the signature is valid, False otherwise.
+    """
+    try:
+        context.verifier.verify(file_digest(context, path, chunk_size, use_mmap), signature)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+# (algorithm, verifier) of the verify_many batch, built once in each worker process
+_worker_verifier = None
+
+def _init_verify_worker(algorithm, public_pem, backend, signature_scheme, salt_length):
+    """
+    Import the public key and build its verifier once per verify_many worker process.
+    """
+    global _worker_verifier
+    public_key = KeyStore.modules[algorithm].import_key(public_pem)
+    _worker_verifier = (algorithm, new_signature_scheme(algorithm, public_key, backend, signature_scheme, salt_length))
+
+def _verify_chunk(pairs):
+    """
+    Verify a chunk of (message, signature) pairs in a worker process.
+    
+    :return: One byte per pair, 1 for a valid signature and 0 otherwise.
+    """
+    algorithm, verifier = _worker_verifier
+    return array('B', [verify_message(algorithm, verifier, message, signature)
+                       for message, signature in pairs]).tobytes()
+
+def _verify_many(context, pairs, workers=None, chunk_size=VERIFY_CHUNK_SIZE):
+    """
+    Verify many signatures, spreading chunks of them across a process pool.
+    
+    A single worker, or a batch that fits in one chunk, is verified on the
+    calling thread to avoid the cost of starting processes.
+    
+    :param context: The PreparedKey of the signing key.
+    :param pairs: Iterable of (message, signature) pairs.
+    :param workers: Number of worker processes (default is the CPU count).
+    :param chunk_size: Number of pairs sent to a worker per job.
+    :return: An array('B') with 1 for each valid signature and 0 otherwise, in input order.
+    """
+    pairs = list(pairs)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pairs) <= chunk_size:
+        return array('B', [verify_message(context.algorithm, context.verifier, message, signature)
+                           for message, signature in pairs])
+
+    public_pem = context.public_key.export_key(format='PEM')
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    results = array('B')
+    initargs = (context.algorithm, public_pem, context.backend, context.signature_scheme, context.salt_length)
+    with ProcessPoolExecutor(workers, initializer=_init_verify_worker, initargs=initargs) as executor:
+        for chunk in executor.map(_verify_chunk, chunks):
+            results.frombytes(chunk)
+    return results
+
+class RSAEncryption:
+    """
+    Class to perform RSA encryption, decryption, signing, and verification.
+    """
+    SUPPORTED_BACKENDS = (PYCRYPTODOME, CRYPTOGRAPHY)
+
+    def __init__(self, key_size=2048, fresh=False, seed=0, key_store=None, key_pool=None, backend=PYCRYPTODOME,
+                 rsa_padding='oaep-sha1', signature_scheme='pkcs1v15', salt_length=None):
+        """
+        Initialize the RSA encryption with the specified key size.
+        
+        :param key_size: Size of the RSA key in bits (default is 2048).
+        :param fresh: Generate a new key pair instead of loading one from the key store.
+        :param seed: Selects one of several stored key pairs of the same size.
+        :param key_store: KeyStore to load from (default is default_key_store).
+        :param key_pool: KeyPool to take a fresh pre-generated key pair from instead.
+        :param backend: Implementation, PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
+        :param rsa_padding: Encryption padding, a name from RSA_PADDINGS (default is 'oaep-sha1').
+        :param signature_scheme: 'pkcs1v15' (default) or 'pss'.
+        :param salt_length: PSS salt length in bytes (default is the SHA-256 digest size).
+        """
+        if rsa_padding not in RSA_PADDINGS:
+            raise ValueError(f"Unknown RSA padding {rsa_padding!r}, expected one of {', '.join(RSA_PADDINGS)}")
+        if signature_scheme not in RSA_SIGNATURE_SCHEMES:
+            raise ValueError(f"Unknown RSA signature scheme {signature_scheme!r}, "
+                             f"expected one of {', '.join(RSA_SIGNATURE_SCHEMES)}")
+        self.key_size = key_size
+        self.backend = _check_backend(self, backend)
+        self.key = load_key('RSA', key_size, fresh, seed, key_store, key_pool)
+        self.context = PreparedKey('RSA', self.key, self.backend, rsa_padding, signature_scheme, salt_length)
+        self.cipher = self.context.cipher
+        self.max_message_size = rsa_max_message_size(self.key.size_in_bits(), rsa_padding)
+
+    def encrypt(self, plaintext):
+        """
+        Encrypt the plaintext using RSA.
+        
+        :param plaintext: The plaintext to encrypt.
+        :return: The encrypted ciphertext.
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode('utf-8')  # Convert to bytes
+        ciphertext = self.cipher.encrypt(plaintext)
+        return ciphertext
+
+    def decrypt(self, ciphertext):
+        """
+        Decrypt the ciphertext using RSA.
+        
+        :param ciphertext: The ciphertext to decrypt.
+        :return: The decrypted plaintext.
+        """
+        plaintext = self.cipher.decrypt(ciphertext)
+        return plaintext.decode('utf-8')
+
+    def encrypt_envelope(self, plaintext):
+        """
+        Encrypt a plaintext of any size using envelope encryption.
+        
+        RSA-OAEP can only encrypt a few hundred bytes, so a random AES-256 data
+        key encrypts the plaintext with AES-GCM and only that key is encrypted
+        with RSA. The wrapped key is authenticated as associated data.
+        
+        :param plaintext: The plaintext to encrypt.
+        :return: The RSA-wrapped data key, the ciphertext, the GCM tag and the nonce.
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode('utf-8')
+        data_key = get_random_bytes(ENVELOPE_KEY_SIZE)
+        wrapped_key = self.cipher.encrypt(data_key)
+        cipher = AES.new(data_key, AES.MODE_GCM)
+        cipher.update(wrapped_key)
+        ciphertext, tag = cipher.encrypt_and_digest(plaintext)
+        return wrapped_key, ciphertext, tag, cipher.nonce
+
+    def decrypt_envelope(self, wrapped_key, ciphertext, tag, nonce):
+        """
+        Decrypt the output of encrypt_envelope.
+        
+        :param wrapped_key: The RSA-wrapped data key.
+        :param ciphertext: The AES-GCM ciphertext.
+        :param tag: The GCM tag.
+        :param nonce: The GCM nonce.
+        :return: The decrypted plaintext.
+        :raises ValueError: If the key cannot be unwrapped or the tag does not match.
+        """
+        data_key = self.cipher.decrypt(wrapped_key)
+        cipher = AES.new(data_key, AES.MODE_GCM, nonce=nonce)
+        cipher.update(wrapped_key)
+        plaintext = cipher.decrypt_and_verify(ciphertext, tag)
+        return plaintext.decode('utf-8')
+
+    def sign(self, message):
+        """
+        Sign the message using RSA.
+        
+        :param message: The message to sign.
+        :return: The signature.
+        """
+        return sign_message(self.context.algorithm, self.context.signer, message)
+
+    def verify(self, message, signature):
+        """
+        Verify the signature using RSA.
+        
+        :param message: The message to verify.
+        :param signature: The signature to verify.
+        :return: True if the signature is valid, False otherwise.
+        """
+        return verify_message(self.context.algorithm, self.context.verifier, message, signature)
+
+    def verify_many(self, pairs, workers=None, chunk_size=VERIFY_CHUNK_SIZE):
+        """
+        Verify many RSA signatures across a process pool.
+        
+        :param pairs: Iterable of (message, signature) pairs.
+        :param workers: Number of worker processes (default is the CPU count).
+        :param chunk_size: Number of pairs sent to a worker per job.
+        :return: An array('B') with 1 for each valid signature and 0 otherwise.
+        """
+        return _verify_many(self.context, pairs, workers, chunk_size)
+
+    def sign_file(self, path, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+        """
+        Sign a file using RSA without loading it into memory.
+        
+        :param path: Path of the file to sign.
+        :param chunk_size: Number of bytes hashed per read.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
+        :return: The signature.
+        """
+        return _sign_file(self.context, path, chunk_size, use_mmap)
+
+    def verify_file(self, path, signature, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+        """
+        Verify a signature made by sign_file using RSA.
+        
+        :param path: Path of the file to verify.
+        :param signature: The signature to verify.
+        :param chunk_size: Number of bytes hashed per read.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
+        :return: True if the signature is valid, False otherwise.
+        """
+        return _verify_file(self.context, path, signature, chunk_size, use_mmap)
+
+class DSAEncryption:
+    """
+    Class to perform DSA signing and verification.
+    """
+    SUPPORTED_BACKENDS = (PYCRYPTODOME, CRYPTOGRAPHY)
+
+    def __init__(self, key_size=2048, fresh=False, seed=0, key_store=None, key_pool=None, backend=PYCRYPTODOME,
+                 deterministic=False):
+        """
+        Initialize the DSA signing with the specified key size.
+        
+        :param key_size: Size of the DSA key in bits (default is 2048).
+        :param fresh: Generate a new key pair instead of loading one from the key store.
+        :param seed: Selects one of several stored key pairs of the same size.
+        :param key_store: KeyStore to load from (default is default_key_store).
+        :param key_pool: KeyPool to take a fresh pre-generated key pair from instead.
+        :param backend: Implementation, PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
+        :param deterministic: Derive nonces with RFC 6979 instead of drawing them from the RNG.
+                              The cryptography package has no deterministic DSA, so this needs PYCRYPTODOME.
+        """
+        self.key_size = key_size
+        self.backend = _check_backend(self, backend)
+        if deterministic and not deterministic_signing_supported('DSA', self.backend):
+            raise ValueError("Deterministic DSA signing is only supported by the pycryptodome backend")
+        self.deterministic = deterministic
+        self.key = load_key('DSA', key_size, fresh, seed, key_store, key_pool)
+        self.context = PreparedKey('DSA', self.key, self.backend, deterministic=deterministic)
+
+    def sign(self, message):
+        """
+        Sign the message using DSA.
+        
+        :param message: The message to sign.
+        :return: The signature.
+        """
+        return sign_message(self.context.algorithm, self.context.signer, message)
+
+    def verify(self, message, signature):
+        """
+        Verify the signature using DSA.
+        
+        :param message: The message to verify.
+        :param signature: The signature to verify.
+        :return: True if the signature is valid, False otherwise.
+        """
+        return verify_message(self.context.algorithm, self.context.verifier, message, signature)
+
+    def verify_many(self, pairs, workers=None, chunk_size=VERIFY_CHUNK_SIZE):
+        """
+        Verify many DSA signatures across a process pool.
+        
+        :param pairs: Iterable of (message, signature) pairs.
+        :param workers: Number of worker processes (default is the CPU count).
+        :param chunk_size: Number of pairs sent to a worker per job.
+        :return: An array('B') with 1 for each valid signature and 0 otherwise.
+        """
+        return _verify_many(self.context, pairs, workers, chunk_size)
+
+    def sign_file(self, path, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+        """
+        Sign a file using DSA without loading it into memory.
+        
+        :param path: Path of the file to sign.
+        :param chunk_size: Number of bytes hashed per read.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
+        :return: The signature.
+        """
+        return _sign_file(self.context, path, chunk_size, use_mmap)
+
+    def verify_file(self, path, signature, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+        """
+        Verify a signature made by sign_file using DSA.
+        
+        :param path: Path of the file to verify.
+        :param signature: The signature to verify.
+        :param chunk_size: Number of bytes hashed per read.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
+        :return: True if the signature is valid, False otherwise.
+        """
+        return _verify_file(self.context, path, signature, chunk_size, use_mmap)
+
+def load_dh_parameters(key_size=2048, group='ffdhe', directory=KEY_STORE_DIR):
+    """
+    Return Diffie-Hellman parameters without generating safe primes on each call.
+    
+    'ffdhe' (RFC 7919) and 'modp' (RFC 3526) are built from the published
+    primes. 'generated' generates parameters once and caches them as a PEM
+    file, which is only worth it for sizes the named groups do not cover.
+    
+    :param key_size: Size of the prime in bits (2048, 3072 or 4096 for the named groups).
+    :param group: 'ffdhe', 'modp' or 'generated'.
+    :param directory: Directory of the cached PEM file for 'generated'.
+    :return: The DH parameters.
+    :raises ValueError: If the group or its size is not known.
+    """
+    cache_key = (group, key_size)
+    if group == DH_GENERATED:
+        cache_key += (os.path.abspath(directory),)
+    if cache_key in _dh_parameters:
+        return _dh_parameters[cache_key]
+
+    if group == DH_GENERATED:
+        path = os.path.join(directory, f"dh_{key_size}.pem")
+        if os.path.exists(path):
+            with open(path, 'rb') as file:
+                parameters = serialization.load_pem_parameters(file.read())
+        else:
+            parameters = dh.generate_parameters(generator=DH_GENERATOR, key_size=key_size, backend=default_backend())
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                file.write(parameters.parameter_bytes(serialization.Encoding.PEM, serialization.ParameterFormat.PKCS3))
+            os.replace(tmp_path, path)
+    elif key_size in DH_GROUPS.get(group, {}):
+        parameters = dh.DHParameterNumbers(DH_GROUPS[group][key_size], DH_GENERATOR).parameters()
+    else:
+        raise ValueError(f"Unknown DH group {group} with key size {key_size}")
+
+    _dh_parameters[cache_key] = parameters
+    return parameters
+
+def derive_key(shared_key, info):
+    """
+    Derive a 32-byte key from a key exchange's shared secret with HKDF-SHA256.
+    
+    :param shared_key: The raw shared secret.
+    :param info: The HKDF context string.
+    :return: The derived key.
+    """
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=info,
+        backend=default_backend()
+    ).derive(shared_key)
+
+class DiffieHellmanEncryption:
+    """
+    Class to perform Diffie-Hellman key exchange.
+    """
+    def __init__(self, key_size=2048, group='ffdhe'):
+        """
+        Initialize the Diffie-Hellman parameters and generate a key pair.
+        
+        :param key_size: Size of the key in bits (default is 2048 bits).
+        :param group: 'ffdhe' (RFC 7919), 'modp' (RFC 3526) or 'generated' (see load_dh_parameters).
+        """
+        self.parameters = load_dh_parameters(key_size, group)
+        self.private_key = self.parameters.generate_private_key()
+        self.public_key = self.private_key.public_key()
+        self.name = "DiffieHellmanEncryption"
+        self.execution_time = 0
+
+    def new_peer_private_key(self):
+        """
+        Generate a private key for the other party in the same group.
+        
+        :return: The new private key.
+        """
+        return self.parameters.generate_private_key()
+
+    def generate_shared_key(self, peer_public_key):
+        """
+        Generate a shared key using the peer's public key.
+        
+        :param peer_public_key: The peer's public key.
+        :return: The derived shared key.
+        """
+        shared_key = self.private_key.exchange(peer_public_key)
+        return derive_key(shared_key, b'dh_key_exchange')
+
+    def handshake(self, peer_public_key):
+        """
+        Run one ephemeral handshake: a new private key, the exchange and HKDF.
+        
+        :param peer_public_key: The peer's public key.
+        :return: The derived shared key.
+        """
+        ephemeral_key = self.new_peer_private_key()
+        return derive_key(ephemeral_key.exchange(peer_public_key), b'dh_key_exchange')
+
+    def run(self, key_size):
+        """
+        Run the Diffie-Hellman key exchange process.
+        
+        Only the other party's key generation and the exchange are timed; the
+        parameters come from a named group or the parameter cache.
+        
+        :param key_size: Size of the key in bits.
+        """
+        start_time = time.time()
+        # Generate the other party's Diffie-Hellman key pair
+        other_party_private_key = self.new_peer_private_key()
+        other_party_public_key = other_party_private_key.public_key()
+
+        # Generate shared keys
+        self.private_key.exchange(other_party_public_key)
+        self.execution_time = time.time() - start_time
+
+# Name used by the performance analyzer and tests
+DHEncryption = DiffieHellmanEncryption
+
+class ECCEncryption:
+    """
+    Class to perform ECC signing and verification.
+    """
+    SUPPORTED_BACKENDS = (PYCRYPTODOME, CRYPTOGRAPHY)
+
+    def __init__(self, curve='P-256', fresh=False, seed=0, key_store=None, key_pool=None, backend=PYCRYPTODOME,
+                 deterministic=False):
+        """
+        Initialize the ECC signing with the specified curve.
+        
+        :param curve: The ECC curve to use (default is 'P-256').
+        :param fresh: Generate a new key pair instead of loading one from the key store.
+        :param seed: Selects one of several stored key pairs of the same curve.
+        :param key_store: KeyStore to load from (default is default_key_store).
+        :param key_pool: KeyPool to take a fresh pre-generated key pair from instead.
+        :param backend: Implementation, PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
+        :param deterministic: Derive ECDSA nonces with RFC 6979 instead of drawing them from the RNG.
+                              With CRYPTOGRAPHY this needs OpenSSL 3.2 or later.
+        """
+        self.curve = curve
+        self.backend = _check_backend(self, backend)
+        if deterministic and not deterministic_signing_supported('ECC', self.backend):
+            raise ValueError("Deterministic ECDSA signing needs OpenSSL 3.2 or later with the cryptography backend")
+        self.deterministic = deterministic
+        self.key = load_key('ECC', curve, fresh, seed, key_store, key_pool)
+        self.context = PreparedKey('ECC', self.key, self.backend, deterministic=deterministic)
 
-class RSAEncryption:
-    """
-    Class to perform RSA encryption, decryption, signing, and verification.
-    """
-    def __init__(self, key_size=2048):
+    def sign(self, message):
         """
-        Initialize the RSA encryption with the specified key size.
+        Sign the message using ECC.
         
-        :param key_size: Size of the RSA key in bits (default is 2048).
+        :param message: The message to sign.
+        :return: The signature.
         """
-        self.key_size = key_size
-        self.key = RSA.generate(key_size)
-        self.cipher = PKCS1_OAEP.new(self.key)
+        return sign_message(self.context.algorithm, self.context.signer, message)
 
-    def encrypt(self, plaintext):
+    def verify(self, message, signature):
         """
-        Encrypt the plaintext using RSA.
+        Verify the signature using ECC.
         
-        :param plaintext: The plaintext to encrypt.
-        :return: The encrypted ciphertext.
+        :param message: The message to verify.
+        :param signature: The signature to verify.
+        :return: True if the signature is valid, False otherwise.
         """
-        if isinstance(plaintext, str):
-            plaintext = plaintext.encode('utf-8')  # Convert to bytes
-        ciphertext = self.cipher.encrypt(plaintext)
-        return ciphertext
+        return verify_message(self.context.algorithm, self.context.verifier, message, signature)
 
-    def decrypt(self, ciphertext):
+    def verify_many(self, pairs, workers=None, chunk_size=VERIFY_CHUNK_SIZE):
         """
-        Decrypt the ciphertext using RSA.
+        Verify many ECC signatures across a process pool.
         
-        :param ciphertext: The ciphertext to decrypt.
-        :return: The decrypted plaintext.
+        :param pairs: Iterable of (message, signature) pairs.
+        :param workers: Number of worker processes (default is the CPU count).
+        :param chunk_size: Number of pairs sent to a worker per job.
+        :return: An array('B') with 1 for each valid signature and 0 otherwise.
         """
-        plaintext = self.cipher.decrypt(ciphertext)
-        return plaintext.decode('utf-8')
+        return _verify_many(self.context, pairs, workers, chunk_size)
 
-    def sign(self, message):
+    def sign_file(self, path, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
         """
-        Sign the message using RSA.
+        Sign a file using ECC without loading it into memory.
         
-        :param message: The message to sign.
+        :param path: Path of the file to sign.
+        :param chunk_size: Number of bytes hashed per read.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
         :return: The signature.
         """
-        if isinstance(message, str):
-            message = message.encode('utf-8')
-        h = SHA256.new(message)
-        signature = pkcs1_15.new(self.key).sign(h)
-        return signature
+        return _sign_file(self.context, path, chunk_size, use_mmap)
 
-    def verify(self, message, signature):
+    def verify_file(self, path, signature, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
         """
-        Verify the signature using RSA.
+        Verify a signature made by sign_file using ECC.
         
-        :param message: The message to verify.
+        :param path: Path of the file to verify.
         :param signature: The signature to verify.
+        :param chunk_size: Number of bytes hashed per read.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
         :return: True if the signature is valid, False otherwise.
         """
-        if isinstance(message, str):
-            message = message.encode('utf-8')
-        h = SHA256.new(message)
-        try:
-            pkcs1_15.new(self.key).verify(h, signature)
-            return True
-        except (ValueError, TypeError):
-            return False
+        return _verify_file(self.context, path, signature, chunk_size, use_mmap)
 
-class DSAEncryption:
+class EdDSAEncryption:
     """
-    Class to perform DSA signing and verification.
+    Class to perform EdDSA (Ed25519 or Ed448) signing and verification.
     """
-    def __init__(self, key_size=2048):
+    SUPPORTED_BACKENDS = (PYCRYPTODOME,)
+
+    def __init__(self, curve='Ed25519', fresh=False, seed=0, key_store=None, key_pool=None, backend=PYCRYPTODOME):
         """
-        Initialize the DSA signing with the specified key size.
+        Initialize the EdDSA signing with the specified curve.
         
-        :param key_size: Size of the DSA key in bits (default is 2048).
+        :param curve: 'Ed25519' or 'Ed448' (default is 'Ed25519').
+        :param fresh: Generate a new key pair instead of loading one from the key store.
+        :param seed: Selects one of several stored key pairs of the same curve.
+        :param key_store: KeyStore to load from (default is default_key_store).
+        :param key_pool: KeyPool to take a fresh pre-generated key pair from instead.
+        :param backend: Only PYCRYPTODOME is supported.
         """
-        self.key_size = key_size
-        self.key = DSA.generate(key_size)
+        self.curve = curve
+        self.backend = _check_backend(self, backend)
+        self.key = load_key('EdDSA', curve, fresh, seed, key_store, key_pool)
+        self.context = PreparedKey('EdDSA', self.key)
 
     def sign(self, message):
         """
-        Sign the message using DSA.
+        Sign the message using EdDSA.
         
         :param message: The message to sign.
         :return: The signature.
         """
-        if isinstance(message, str):
-            message = message.encode('utf-8')
-        h = SHA256.new(message)
-        signer = DSS.new(self.key, 'fips-186-3')
-        return signer.sign(h)
+        return sign_message(self.context.algorithm, self.context.signer, message)
 
     def verify(self, message, signature):
         """
-        Verify the signature using DSA.
+        Verify the signature using EdDSA.
         
         :param message: The message to verify.
         :param signature: The signature to verify.
         :return: True if the signature is valid, False otherwise.
         """
-        if isinstance(message, str):
-            message = message.encode('utf-8')
-        h = SHA256.new(message)
-        verifier = DSS.new(self.key, 'fips-186-3')
-        try:
-            verifier.verify(h, signature)
-            return True
-        except ValueError:
-            return False
+        return verify_message(self.context.algorithm, self.context.verifier, message, signature)
 
-class DiffieHellmanEncryption:
+    def verify_many(self, pairs, workers=None, chunk_size=VERIFY_CHUNK_SIZE):
+        """
+        Verify many EdDSA signatures across a process pool.
+        
+        :param pairs: Iterable of (message, signature) pairs.
+        :param workers: Number of worker processes (default is the CPU count).
+        :param chunk_size: Number of pairs sent to a worker per job.
+        :return: An array('B') with 1 for each valid signature and 0 otherwise.
+        """
+        return _verify_many(self.context, pairs, workers, chunk_size)
+
+    def sign_file(self, path, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+        """
+        Sign a file using EdDSA without loading it into memory.
+        
+        :param path: Path of the file to sign.
+        :param chunk_size: Number of bytes hashed per read.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
+        :return: The signature.
+        """
+        return _sign_file(self.context, path, chunk_size, use_mmap)
+
+    def verify_file(self, path, signature, chunk_size=FILE_CHUNK_SIZE, use_mmap=False):
+        """
+        Verify a signature made by sign_file using EdDSA.
+        
+        :param path: Path of the file to verify.
+        :param signature: The signature to verify.
+        :param chunk_size: Number of bytes hashed per read.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
+        :return: True if the signature is valid, False otherwise.
+        """
+        return _verify_file(self.context, path, signature, chunk_size, use_mmap)
+
+class EllipticCurveKeyExchange(ABC):
     """
-    Class to perform Diffie-Hellman key exchange.
+    Base class for elliptic curve key agreement with the DiffieHellmanEncryption interface.
+    
+    Subclasses implement new_peer_private_key for their curve.
     """
-    def __init__(self, key_size=2048):
+    name = "EllipticCurveKeyExchange"
+
+    def __init__(self):
         """
-        Initialize the Diffie-Hellman parameters and generate a key pair.
-        
-        :param key_size: Size of the key in bits (default is 2048 bits).
+        Generate this party's key pair.
         """
-        self.parameters = dh.generate_parameters(generator=2, key_size=key_size, backend=default_backend())
-        self.private_key = self.parameters.generate_private_key()
+        self.private_key = self.new_peer_private_key()
         self.public_key = self.private_key.public_key()
-        self.name = "DiffieHellmanEncryption"
         self.execution_time = 0
 
+    @abstractmethod
+    def new_peer_private_key(self):
+        """
+        Generate a private key for the other party on the same curve.
+        
+        :return: The new private key.
+        """
+
+    def exchange(self, peer_public_key, private_key=None):
+        """
+        Compute the raw shared secret with the peer's public key.
+        
+        :param peer_public_key: The peer's public key.
+        :param private_key: The private key to use (default is this party's key).
+        :return: The shared secret.
+        """
+        return (private_key or self.private_key).exchange(peer_public_key)
+
     def generate_shared_key(self, peer_public_key):
         """
         Generate a shared key using the peer's public key.
@@ -155,74 +1499,203 @@ class DiffieHellmanEncryption:
         :param peer_public_key: The peer's public key.
         :return: The derived shared key.
         """
-        shared_key = self.private_key.exchange(peer_public_key)
-        derived_key = HKDF(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=None,
-            info=b'dh_key_exchange',
-            backend=default_backend()
-        ).derive(shared_key)
-        return derived_key
+        shared_key = self.exchange(peer_public_key)
+        return derive_key(shared_key, f'{self.name.lower()}_key_exchange'.encode('ascii'))
 
-    def run(self, key_size):
+    def handshake(self, peer_public_key):
         """
-        Run the Diffie-Hellman key exchange process.
+        Run one ephemeral handshake: a new private key, the exchange and HKDF.
         
-        :param key_size: Size of the key in bits.
+        :param peer_public_key: The peer's public key.
+        :return: The derived shared key.
         """
-        # Generate the other party's Diffie-Hellman key pair
-        other_party_private_key = self.parameters.generate_private_key()
-        other_party_public_key = other_party_private_key.public_key()
+        shared_key = self.exchange(peer_public_key, self.new_peer_private_key())
+        return derive_key(shared_key, f'{self.name.lower()}_key_exchange'.encode('ascii'))
 
-        # Generate shared keys
+    def run(self, key_size=None):
+        """
+        Run the key exchange process, timing the other party's key generation and the exchange.
+        
+        :param key_size: Not used, the curve fixes the key size.
+        """
         start_time = time.time()
-        self.generate_shared_key(other_party_public_key)
+        other_party_private_key = self.new_peer_private_key()
+        self.exchange(other_party_private_key.public_key())
         self.execution_time = time.time() - start_time
 
-class ECCEncryption:
+class X25519Encryption(EllipticCurveKeyExchange):
     """
-    Class to perform ECC signing and verification.
+    Class to perform X25519 key exchange.
+    """
+    name = "X25519Encryption"
+
+    def new_peer_private_key(self):
+        """
+        Generate an X25519 private key.
+        """
+        return x25519.X25519PrivateKey.generate()
+
+class ECDHEncryption(EllipticCurveKeyExchange):
     """
+    Class to perform ECDH key exchange on a NIST curve.
+    """
+    name = "ECDHEncryption"
+    curves = {'P-256': ec.SECP256R1, 'P-384': ec.SECP384R1, 'P-521': ec.SECP521R1}
+
     def __init__(self, curve='P-256'):
         """
-        Initialize the ECC signing with the specified curve.
+        Initialize ECDH on the specified curve and generate a key pair.
         
-        :param curve: The ECC curve to use (default is 'P-256').
+        :param curve: 'P-256', 'P-384' or 'P-521' (default is 'P-256').
         """
         self.curve = curve
-        self.key = ECC.generate(curve=curve)
+        super().__init__()
 
-    def sign(self, message):
+    def new_peer_private_key(self):
         """
-        Sign the message using ECC.
-        
-        :param message: The message to sign.
-        :return: The signature.
+        Generate a private key on this instance's curve.
         """
-        if isinstance(message, str):
-            message = message.encode('utf-8')
-        h = SHA256.new(message)
-        signer = DSS.new(self.key, 'fips-186-3')
-        return signer.sign(h)
+        return ec.generate_private_key(self.curves[self.curve]())
 
-    def verify(self, message, signature):
+    def exchange(self, peer_public_key, private_key=None):
         """
-        Verify the signature using ECC.
-        
-        :param message: The message to verify.
-        :param signature: The signature to verify.
-        :return: True if the signature is valid, False otherwise.
+        Compute the raw ECDH shared secret with the peer's public key.
         """
-        if isinstance(message, str):
-            message = message.encode('utf-8')
-        h = SHA256.new(message)
-        verifier = DSS.new(self.key.public_key(), 'fips-186-3')
-        try:
-            verifier.verify(h, signature)
-            return True
-        except ValueError:
-            return False
+        return (private_key or self.private_key).exchange(ec.ECDH(), peer_public_key)
+
+# Key exchange classes by the name used in the results, for the handshake benchmark
+KEY_EXCHANGE_CLASSES = {'DH': DiffieHellmanEncryption, 'X25519': X25519Encryption, 'ECDH': ECDHEncryption}
+
+def _run_handshakes(algorithm, key_size, count):
+    """
+    Run and time ephemeral handshakes in a handshake benchmark worker process.
+    
+    :param algorithm: 'DH', 'X25519' or 'ECDH'.
+    :param key_size: The DH key size or ECDH curve (ignored for X25519).
+    :param count: The number of handshakes.
+    :return: The latency of each handshake in seconds, as array('d') bytes.
+    """
+    exchange_class = KEY_EXCHANGE_CLASSES[algorithm]
+    exchange = exchange_class() if algorithm == 'X25519' else exchange_class(key_size)
+    peer_public_key = exchange.new_peer_private_key().public_key()
+    latencies = array('d')
+    for _ in range(count):
+        start_time = time.perf_counter()
+        exchange.handshake(peer_public_key)
+        latencies.append(time.perf_counter() - start_time)
+    return latencies.tobytes()
+
+def percentile(sorted_values, percent):
+    """
+    Return the nearest-rank percentile of already sorted values.
+    
+    :param sorted_values: The values in ascending order.
+    :param percent: The percentile, 0 to 100.
+    :return: The percentile value, or 0 for no values.
+    """
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+def measure_handshakes(algorithm, key_size=None, count=HANDSHAKE_COUNT, workers=1):
+    """
+    Measure sustained ephemeral handshake throughput and latency.
+    
+    Each handshake generates a new private key, runs exchange() against a
+    fixed peer key and derives a key with HKDF. The handshakes are split
+    evenly across worker processes.
+    
+    :param algorithm: 'DH', 'X25519' or 'ECDH'.
+    :param key_size: The DH key size or ECDH curve (ignored for X25519).
+    :param count: The total number of handshakes.
+    :param workers: The number of worker processes.
+    :return: A dictionary with the handshakes, wall time, handshakes per second
+             and the p50, p90 and p99 latency in seconds.
+    """
+    counts = [count // workers + (1 if i < count % workers else 0) for i in range(workers)]
+    latencies = array('d')
+    start_time = time.perf_counter()
+    if workers == 1:
+        latencies.frombytes(_run_handshakes(algorithm, key_size, count))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            for result in executor.map(_run_handshakes, [algorithm] * workers, [key_size] * workers, counts):
+                latencies.frombytes(result)
+    time_taken = time.perf_counter() - start_time
+
+    ordered = sorted(latencies)
+    return {
+        'handshakes': len(ordered),
+        'time_taken': time_taken,
+        'handshakes_per_second': len(ordered) / time_taken if time_taken > 0 else 0,
+        'p50': percentile(ordered, 50),
+        'p90': percentile(ordered, 90),
+        'p99': percentile(ordered, 99),
+    }
+
+def _drain_rng(stop):
+    """
+    Read the OS random number generator until stop is set, in an RNG load process.
+    
+    :param stop: The multiprocessing Event that ends the loop.
+    """
+    while not stop.is_set():
+        os.urandom(RNG_LOAD_CHUNK)
+
+@contextmanager
+def rng_load(processes):
+    """
+    Keep processes reading os.urandom for the duration of the block.
+    
+    This stands in for other tenants competing for the entropy source on a
+    busy or virtualized host.
+    
+    :param processes: The number of load processes; 0 runs the block unloaded.
+    """
+    if not processes:
+        yield
+        return
+    stop = multiprocessing.Event()
+    workers = [multiprocessing.Process(target=_drain_rng, args=(stop,), daemon=True) for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+def measure_signing(signer, message, count=SIGNING_COUNT, rng_processes=0):
+    """
+    Measure signing throughput and latency, optionally under RNG load.
+    
+    :param signer: A DSAEncryption or ECCEncryption instance.
+    :param message: The message to sign.
+    :param count: The number of signatures.
+    :param rng_processes: The number of processes reading os.urandom meanwhile.
+    :return: A dictionary with the signatures, wall time, signatures per second
+             and the p50, p90 and p99 latency in seconds.
+    """
+    latencies = array('d')
+    with rng_load(rng_processes):
+        start_time = time.perf_counter()
+        for _ in range(count):
+            call_start = time.perf_counter()
+            signer.sign(message)
+            latencies.append(time.perf_counter() - call_start)
+        time_taken = time.perf_counter() - start_time
+
+    ordered = sorted(latencies)
+    return {
+        'signatures': len(ordered),
+        'time_taken': time_taken,
+        'signatures_per_second': len(ordered) / time_taken if time_taken > 0 else 0,
+        'p50': percentile(ordered, 50),
+        'p90': percentile(ordered, 90),
+        'p99': percentile(ordered, 99),
+    }
 
 def measure_time(func):
     """
@@ -238,7 +1711,8 @@ def measure_time(func):
         return end_time - start_time, result
     return wrapper
 
-def save_results(algorithm, operation, key_size, file_name, time_taken, rate):
+def save_results(algorithm, operation, key_size, file_name, time_taken, rate, backend=PYCRYPTODOME,
+                 results_path=ANALYSIS_RESULTS_PATH):
     """
     Save the time taken for an operation to a CSV file.
     
@@ -248,92 +1722,510 @@ def save_results(algorithm, operation, key_size, file_name, time_taken, rate):
     :param file_name: The name of the file used.
     :param time_taken: The time taken for the operation.
     :param rate: The bytes/s rate for the operation.
+    :param backend: The library that performed the operation; its version is saved next to it.
+    :param results_path: The CSV file to append to (default is the per-file results).
     """
-    with open(ANALYSIS_RESULTS_PATH, 'a', newline='') as csvfile:
+    with open(results_path, 'a', newline='') as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow([algorithm, operation, key_size, file_name, time_taken, rate])
+        writer.writerow([algorithm, operation, key_size, file_name, time_taken, rate, backend, BACKEND_VERSIONS[backend]])
 
 def calculate_bytes_rate(time_taken, filename):
-    """Calculate bytes/s rate from time and filename."""
+    """Calculate bytes/s rate from time and filename (e.g. 125bytes_... or 10mb_...)."""
     try:
-        size_bytes = int(filename.split('bytes')[0])
+        prefix = filename.split('_')[0].lower()
+        if prefix.endswith('mb'):
+            size_bytes = int(prefix[:-2]) * 1024 * 1024
+        else:
+            size_bytes = int(filename.split('bytes')[0])
         return size_bytes / time_taken if time_taken > 0 else 0
     except:
         return 0
 
-if __name__ == "__main__":
-    # Initialize results file
-    with open(ANALYSIS_RESULTS_PATH, 'w', newline='') as csvfile:
+def load_messages(count):
+    """
+    Build a list of messages by cycling through the small sample files.
+    
+    :param count: The number of messages to return.
+    :return: A list of bytes messages.
+    """
+    samples = []
+    for file_name in sorted(os.listdir(DATA_DIR)):
+        if file_name.endswith('.txt'):
+            with open(os.path.join(DATA_DIR, file_name), 'rb') as file:
+                samples.append(file.read())
+    return [samples[i % len(samples)] for i in range(count)]
+
+def benchmark_batch_verification(algorithm, signer, key_size, messages, workers):
+    """
+    Time verify_many on signed messages and save the signatures per second per core.
+    
+    :param algorithm: The name of the algorithm.
+    :param signer: An RSAEncryption, DSAEncryption or ECCEncryption instance.
+    :param key_size: The size of the key or curve.
+    :param messages: The list of messages to sign and verify.
+    :param workers: The number of worker processes.
+    :return: The signatures verified per second per core.
+    """
+    pairs = [(message, signer.sign(message)) for message in messages]
+    verify_time, results = measure_time(signer.verify_many)(pairs, workers)
+    if not all(results):
+        raise ValueError("verify_many rejected a valid signature")
+    rate = len(pairs) / verify_time if verify_time > 0 else 0
+    with open(BATCH_VERIFY_RESULTS_PATH, 'a', newline='') as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow(['algorithm', 'operation', 'key_size', 'file_name', 'time_taken', 'rate'])
+        writer.writerow([algorithm, key_size, workers, len(pairs), verify_time, rate, rate / workers])
+    return rate / workers
+
+def benchmark_prepared_context(algorithm, instance, key_size, message, repeats=CONTEXT_REPEATS):
+    """
+    Compare per-call sign/verify time with and without the prepared key context.
+    
+    The unprepared calls rebuild the public key and signature scheme (and the
+    OAEP cipher for RSA) on every call, as the classes used to. The results are
+    saved to CONTEXT_RESULTS_PATH.
+    
+    :param algorithm: The name of the algorithm.
+    :param instance: An RSAEncryption, DSAEncryption or ECCEncryption instance.
+    :param key_size: The size of the key or curve.
+    :param message: The message to sign and verify.
+    :param repeats: The number of calls averaged per operation.
+    :return: The per-call time saved for each operation.
+    """
+    key = instance.key
+    signature = instance.sign(message)
+    operations = {
+        'signing': (lambda: sign_message(algorithm, new_signature_scheme(algorithm, key, instance.backend), message),
+                    lambda: instance.sign(message)),
+        'verification': (lambda: verify_message(algorithm, new_signature_scheme(algorithm, key.public_key(), instance.backend),
+                                                message, signature),
+                         lambda: instance.verify(message, signature)),
+    }
+    if algorithm == 'RSA':
+        ciphertext = instance.encrypt(message)
+        operations['decryption'] = (lambda: new_rsa_cipher(key, backend=instance.backend).decrypt(ciphertext),
+                                    lambda: instance.cipher.decrypt(ciphertext))
+
+    saved = {}
+    with open(CONTEXT_RESULTS_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        for operation, (unprepared, prepared) in operations.items():
+            unprepared_time, _ = measure_time(lambda: [unprepared() for _ in range(repeats)])()
+            prepared_time, _ = measure_time(lambda: [prepared() for _ in range(repeats)])()
+            unprepared_time /= repeats
+            prepared_time /= repeats
+            saved[operation] = unprepared_time - prepared_time
+            writer.writerow([algorithm, key_size, operation, unprepared_time, prepared_time, saved[operation], instance.backend])
+    return saved
+
+def benchmark_rsa_paddings(key_size, backend, message, repeats=RSA_PADDING_REPEATS):
+    """
+    Time RSA encryption and signing under every padding and signature scheme.
+    
+    Encryption and decryption are timed for each RSA_PADDINGS entry, signing
+    and verification for PKCS#1 v1.5 and for PSS with each of PSS_SALT_LENGTHS.
+    The results are saved to RSA_PADDING_RESULTS_PATH with the largest message
+    each encryption padding accepts.
+    
+    :param key_size: Size of the RSA key in bits.
+    :param backend: PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
+    :param message: The message to encrypt and sign, small enough for every padding.
+    :param repeats: The number of calls averaged per operation.
+    :return: The per-call time of each (operation, scheme, salt_length).
+    """
+    times = {}
+    with open(RSA_PADDING_RESULTS_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        for rsa_padding in RSA_PADDINGS:
+            rsa = RSAEncryption(key_size, backend=backend, rsa_padding=rsa_padding)
+            ciphertext = rsa.cipher.encrypt(message)
+            operations = {'encryption': lambda: rsa.cipher.encrypt(message),
+                          'decryption': lambda: rsa.cipher.decrypt(ciphertext)}
+            for operation, call in operations.items():
+                time_taken, _ = measure_time(lambda: [call() for _ in range(repeats)])()
+                times[(operation, rsa_padding, '')] = time_taken / repeats
+                writer.writerow([key_size, backend, operation, rsa_padding, '', time_taken / repeats, rsa.max_message_size])
+
+        schemes = [('pkcs1v15', None)] + [('pss', salt_length) for salt_length in PSS_SALT_LENGTHS]
+        for signature_scheme, salt_length in schemes:
+            rsa = RSAEncryption(key_size, backend=backend, signature_scheme=signature_scheme, salt_length=salt_length)
+            signature = rsa.sign(message)
+            operations = {'signing': lambda: rsa.sign(message),
+                          'verification': lambda: rsa.verify(message, signature)}
+            salt = '' if salt_length is None else salt_length
+            for operation, call in operations.items():
+                time_taken, _ = measure_time(lambda: [call() for _ in range(repeats)])()
+                times[(operation, signature_scheme, salt)] = time_taken / repeats
+                writer.writerow([key_size, backend, operation, signature_scheme, salt, time_taken / repeats, ''])
+    return times
+
+def benchmark_key_serialization(algorithm, key_size, repeats=SERIALIZATION_REPEATS):
+    """
+    Time encoding and parsing a key in every format of its algorithm.
+    
+    Each format is timed for export, for import_key and for a ParsedKeyCache
+    hit on the same bytes. The results are saved to KEY_SERIALIZATION_RESULTS_PATH.
+    
+    :param algorithm: 'RSA', 'DSA', 'ECC' or 'DH'.
+    :param key_size: The key size, or the curve for ECC.
+    :param repeats: The number of calls averaged per operation.
+    :return: The per-call time of each (key_format, operation).
+    """
+    if algorithm == 'DH':
+        key = load_dh_parameters(key_size).generate_private_key()
+    else:
+        key = default_key_store.load(algorithm, key_size)
+    cache = ParsedKeyCache()
+    times = {}
+    with open(KEY_SERIALIZATION_RESULTS_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        for key_format in KEY_FORMATS[algorithm]:
+            encoded = export_key(algorithm, key, key_format)
+            cache.load(algorithm, encoded, key_format, key_size)
+            operations = {
+                'export': lambda: export_key(algorithm, key, key_format),
+                'import': lambda: import_key(algorithm, encoded, key_format, key_size),
+                'cached_import': lambda: cache.load(algorithm, encoded, key_format, key_size),
+            }
+            for operation, call in operations.items():
+                time_taken, _ = measure_time(lambda: [call() for _ in range(repeats)])()
+                times[(key_format, operation)] = time_taken / repeats
+                writer.writerow([algorithm, key_size, key_format, operation, time_taken / repeats, len(encoded)])
+    return times
+
+def benchmark_file_signing(algorithm, signer, key_size, file_name, path):
+    """
+    Time hashing a file and signing its digest as separate results.
+    
+    Hashing is timed with chunked reads and with a memory map; signing and
+    verification are timed on the finished digest only. The results are saved
+    to FILE_SIGNING_RESULTS_PATH.
+    
+    :param algorithm: The name saved in the results.
+    :param signer: An RSAEncryption, DSAEncryption, ECCEncryption or EdDSAEncryption instance.
+    :param key_size: The size of the key or curve.
+    :param file_name: The name of the file used.
+    :param path: Path of the file to sign.
+    """
+    context = signer.context
+    hash_time, digest = measure_time(file_digest)(context, path)
+    save_results(algorithm, 'file_hashing', key_size, file_name, hash_time, calculate_bytes_rate(hash_time, file_name),
+                 context.backend, FILE_SIGNING_RESULTS_PATH)
+
+    hash_time, _ = measure_time(file_digest)(context, path, use_mmap=True)
+    save_results(algorithm, 'file_hashing_mmap', key_size, file_name, hash_time, calculate_bytes_rate(hash_time, file_name),
+                 context.backend, FILE_SIGNING_RESULTS_PATH)
+
+    sign_time, signature = measure_time(context.signer.sign)(digest)
+    save_results(algorithm, 'file_signing', key_size, file_name, sign_time, 0, context.backend, FILE_SIGNING_RESULTS_PATH)
+
+    verify_time, _ = measure_time(context.verifier.verify)(digest, signature)
+    save_results(algorithm, 'file_verification', key_size, file_name, verify_time, 0, context.backend,
+                 FILE_SIGNING_RESULTS_PATH)
+
+def save_nonce_mode_results(algorithm, key_size, backend, deterministic, rng_processes, result):
+    """
+    Save one nonce mode benchmark result to NONCE_MODE_RESULTS_PATH.
+    
+    :param algorithm: 'DSA' or 'ECC'.
+    :param key_size: The DSA key size or ECC curve.
+    :param backend: The library that signed.
+    :param deterministic: True for RFC 6979 nonces, False for random ones.
+    :param rng_processes: The number of RNG load processes.
+    :param result: The dictionary returned by measure_signing.
+    """
+    with open(NONCE_MODE_RESULTS_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([algorithm, key_size, backend, 'rfc6979' if deterministic else 'random', rng_processes,
+                         result['signatures'], result['time_taken'], result['signatures_per_second'],
+                         result['p50'], result['p90'], result['p99']])
+
+def save_handshake_results(algorithm, key_size, workers, result):
+    """
+    Save a handshake throughput result to HANDSHAKE_RESULTS_PATH.
+    
+    :param algorithm: 'DH', 'X25519' or 'ECDH'.
+    :param key_size: The DH key size or curve.
+    :param workers: The number of worker processes.
+    :param result: The dictionary returned by measure_handshakes.
+    """
+    with open(HANDSHAKE_RESULTS_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([algorithm, key_size, workers, result['handshakes'], result['time_taken'],
+                         result['handshakes_per_second'], result['p50'], result['p90'], result['p99']])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the asymmetric algorithms against the sample files.")
+    parser.add_argument('--batch-verify', action='store_true',
+                        help="Measure verify_many throughput in signatures per second per core "
+                             "instead of running the file benchmarks.")
+    parser.add_argument('--signatures', type=int, default=VERIFY_BATCH_SIZE,
+                        help="Number of signatures per run in the batch verification benchmark.")
+    parser.add_argument('--handshakes', action='store_true',
+                        help="Measure ephemeral key exchange throughput and latency percentiles on 1 to N cores "
+                             "instead of running the file benchmarks.")
+    parser.add_argument('--handshake-count', type=int, default=HANDSHAKE_COUNT,
+                        help="Number of handshakes per parameter set and worker count.")
+    parser.add_argument('--prepared-context', action='store_true',
+                        help="Measure the per-call overhead saved by the prepared key contexts "
+                             "instead of running the file benchmarks.")
+    parser.add_argument('--key-serialization', action='store_true',
+                        help="Time key export, import and cached import per encoding for RSA, DSA, ECC and DH "
+                             "instead of running the file benchmarks.")
+    parser.add_argument('--nonce-modes', action='store_true',
+                        help="Compare DSA and ECDSA signing with random and RFC 6979 nonces, idle and with every core "
+                             "reading os.urandom, instead of running the file benchmarks.")
+    parser.add_argument('--signing-count', type=int, default=SIGNING_COUNT,
+                        help="Number of signatures per key, nonce mode and RNG load.")
+    parser.add_argument('--rsa-paddings', action='store_true',
+                        help="Time RSA encryption paddings and signature schemes (PSS salt lengths included) "
+                             "on every key size and backend instead of running the file benchmarks.")
+    args = parser.parse_args()
 
-    # Test data files
-    sample_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.txt')]
     key_sizes = {
         'RSA': [2048, 3072, 4096],
         'DSA': [1024, 2048, 3072],
         'DH': [2048, 3072, 4096],
-        'ECC': ['P-256', 'P-384', 'P-521']
+        'ECC': ['P-256', 'P-384', 'P-521'],
+        'EdDSA': ['Ed25519', 'Ed448'],  # Results are saved under the curve name
+        'ECDH': ['P-256', 'P-384', 'P-521']
     }
 
+    if args.batch_verify:
+        with open(BATCH_VERIFY_RESULTS_PATH, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'key_size', 'workers', 'signatures', 'time_taken',
+                             'signatures_per_second', 'signatures_per_second_per_core'])
+        messages = load_messages(args.signatures)
+        cpu_count = os.cpu_count() or 1
+        worker_counts = sorted({1, cpu_count} | {2 ** i for i in range(cpu_count.bit_length()) if 2 ** i < cpu_count})
+        signer_classes = {'RSA': RSAEncryption, 'DSA': DSAEncryption, 'ECC': ECCEncryption, 'EdDSA': EdDSAEncryption}
+        for algorithm, signer_class in signer_classes.items():
+            for key_size in key_sizes[algorithm]:
+                signer = signer_class(key_size)
+                for workers in worker_counts:
+                    per_core = benchmark_batch_verification(algorithm, signer, key_size, messages, workers)
+                    print(f"{algorithm}-{key_size} with {workers} workers: {per_core:.0f} signatures/s per core")
+        sys.exit(0)
+
+    if args.handshakes:
+        with open(HANDSHAKE_RESULTS_PATH, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'key_size', 'workers', 'handshakes', 'time_taken',
+                             'handshakes_per_second', 'p50_latency', 'p90_latency', 'p99_latency'])
+        cpu_count = os.cpu_count() or 1
+        worker_counts = sorted({1, cpu_count} | {2 ** i for i in range(cpu_count.bit_length()) if 2 ** i < cpu_count})
+        parameter_sets = [('DH', key_size) for key_size in key_sizes['DH']]
+        parameter_sets += [('X25519', 'Curve25519')] + [('ECDH', curve) for curve in key_sizes['ECDH']]
+        for algorithm, key_size in parameter_sets:
+            for workers in worker_counts:
+                result = measure_handshakes(algorithm, key_size, args.handshake_count, workers)
+                save_handshake_results(algorithm, key_size, workers, result)
+                print(f"{algorithm}-{key_size} with {workers} workers: {result['handshakes_per_second']:.0f} handshakes/s, "
+                      f"p50 {result['p50'] * 1e6:.0f} us, p99 {result['p99'] * 1e6:.0f} us")
+        sys.exit(0)
+
+    if args.prepared_context:
+        with open(CONTEXT_RESULTS_PATH, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'key_size', 'operation', 'unprepared_time', 'prepared_time', 'overhead_saved', 'backend'])
+        message = b'Prepared context benchmark message.'
+        signer_classes = {'RSA': RSAEncryption, 'DSA': DSAEncryption, 'ECC': ECCEncryption, 'EdDSA': EdDSAEncryption}
+        for algorithm, signer_class in signer_classes.items():
+            for key_size in key_sizes[algorithm]:
+                for backend in signer_class.SUPPORTED_BACKENDS:
+                    saved = benchmark_prepared_context(algorithm, signer_class(key_size, backend=backend), key_size, message)
+                    for operation, overhead in saved.items():
+                        print(f"{algorithm}-{key_size} ({backend}) {operation}: {overhead * 1e6:.1f} us saved per call")
+        sys.exit(0)
+
+    if args.key_serialization:
+        with open(KEY_SERIALIZATION_RESULTS_PATH, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'key_size', 'key_format', 'operation', 'time_taken', 'encoded_size'])
+        for algorithm in ('RSA', 'DSA', 'ECC', 'DH'):
+            for key_size in key_sizes[algorithm]:
+                times = benchmark_key_serialization(algorithm, key_size)
+                for key_format in KEY_FORMATS[algorithm]:
+                    print(f"{algorithm}-{key_size} {key_format}: export {times[(key_format, 'export')] * 1e6:.1f} us, "
+                          f"import {times[(key_format, 'import')] * 1e6:.1f} us, "
+                          f"cached {times[(key_format, 'cached_import')] * 1e6:.1f} us")
+        print(f"Key store cache: {default_key_cache.metrics()}")
+        sys.exit(0)
+
+    if args.nonce_modes:
+        with open(NONCE_MODE_RESULTS_PATH, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'key_size', 'backend', 'nonce_mode', 'rng_processes', 'signatures', 'time_taken',
+                             'signatures_per_second', 'p50_latency', 'p90_latency', 'p99_latency'])
+        message = b'Nonce mode benchmark message.'
+        signer_classes = {'DSA': DSAEncryption, 'ECC': ECCEncryption}
+        for algorithm, signer_class in signer_classes.items():
+            for key_size in key_sizes[algorithm]:
+                for backend in signer_class.SUPPORTED_BACKENDS:
+                    for deterministic in (False, True):
+                        if deterministic and not deterministic_signing_supported(algorithm, backend):
+                            continue
+                        signer = signer_class(key_size, backend=backend, deterministic=deterministic)
+                        for rng_processes in (0, os.cpu_count() or 1):
+                            result = measure_signing(signer, message, args.signing_count, rng_processes)
+                            save_nonce_mode_results(algorithm, key_size, backend, deterministic, rng_processes, result)
+                            print(f"{algorithm}-{key_size} ({backend}, {'rfc6979' if deterministic else 'random'} nonces, "
+                                  f"{rng_processes} RNG load processes): {result['signatures_per_second']:.0f} signatures/s, "
+                                  f"p99 {result['p99'] * 1e6:.0f} us")
+        sys.exit(0)
+
+    if args.rsa_paddings:
+        with open(RSA_PADDING_RESULTS_PATH, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['key_size', 'backend', 'operation', 'scheme', 'salt_length', 'time_taken', 'max_message_size'])
+        message = b'RSA padding benchmark message.'
+        for key_size in key_sizes['RSA']:
+            for backend in RSAEncryption.SUPPORTED_BACKENDS:
+                times = benchmark_rsa_paddings(key_size, backend, message)
+                for operation in ('encryption', 'decryption', 'signing', 'verification'):
+                    (_, scheme, salt_length), fastest = min(((key, value) for key, value in times.items()
+                                                              if key[0] == operation), key=lambda item: item[1])
+                    salt = f" (salt {salt_length})" if salt_length != '' else ''
+                    print(f"RSA-{key_size} ({backend}) fastest {operation}: {scheme}{salt}, {fastest * 1e6:.1f} us")
+        sys.exit(0)
+
+    # Initialize results files
+    for results_path in (ANALYSIS_RESULTS_PATH, KEY_GENERATION_RESULTS_PATH, FILE_SIGNING_RESULTS_PATH):
+        with open(results_path, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'operation', 'key_size', 'file_name', 'time_taken', 'rate', 'backend', 'version'])
+
+    # Test data files
+    sample_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.txt')]
+
+    # Key generation Tests, timed apart from the operations that use the stored keys and saved
+    # to their own file, since they are not tied to a sample file
+    for algorithm in ('RSA', 'DSA', 'ECC', 'EdDSA'):
+        for key_size in key_sizes[algorithm]:
+            for _ in range(KEY_GENERATION_REPEATS):
+                gen_time, _ = measure_time(default_key_store.generate)(algorithm, key_size)
+                save_results(key_size if algorithm == 'EdDSA' else algorithm, 'key_generation', key_size, '', gen_time, 0,
+                             results_path=KEY_GENERATION_RESULTS_PATH)
+
     for file_name in sample_files:
-        with open(os.path.join(DATA_DIR, file_name), 'r') as file:
+        with open(os.path.join(DATA_DIR, file_name), 'rb') as file:
             data = file.read()
 
-        # RSA Tests
+        # RSA Tests, one run per backend
         for key_size in key_sizes['RSA']:
-            rsa = RSAEncryption(key_size)
-            
-            # Encryption/Decryption
-            enc_time, ciphertext = measure_time(rsa.encrypt)(data)
-            rate = calculate_bytes_rate(enc_time, file_name)
-            save_results('RSA', 'encryption', key_size, file_name, enc_time, rate)
-            
-            dec_time, _ = measure_time(rsa.decrypt)(ciphertext)
-            rate = calculate_bytes_rate(dec_time, file_name)
-            save_results('RSA', 'decryption', key_size, file_name, dec_time, rate)
-            
-            # Signing/Verification
-            sign_time, signature = measure_time(rsa.sign)(data)
-            rate = calculate_bytes_rate(sign_time, file_name)
-            save_results('RSA', 'signing', key_size, file_name, sign_time, rate)
-            
-            verify_time, _ = measure_time(rsa.verify)(data, signature)
-            rate = calculate_bytes_rate(verify_time, file_name)
-            save_results('RSA', 'verification', key_size, file_name, verify_time, rate)
+            for backend in RSAEncryption.SUPPORTED_BACKENDS:
+                rsa = RSAEncryption(key_size, backend=backend)
+
+                # Encryption/Decryption
+                enc_time, ciphertext = measure_time(rsa.encrypt)(data)
+                rate = calculate_bytes_rate(enc_time, file_name)
+                save_results('RSA', 'encryption', key_size, file_name, enc_time, rate, backend)
+
+                dec_time, _ = measure_time(rsa.decrypt)(ciphertext)
+                rate = calculate_bytes_rate(dec_time, file_name)
+                save_results('RSA', 'decryption', key_size, file_name, dec_time, rate, backend)
+
+                # Signing/Verification
+                sign_time, signature = measure_time(rsa.sign)(data)
+                rate = calculate_bytes_rate(sign_time, file_name)
+                save_results('RSA', 'signing', key_size, file_name, sign_time, rate, backend)
+
+                verify_time, _ = measure_time(rsa.verify)(data, signature)
+                rate = calculate_bytes_rate(verify_time, file_name)
+                save_results('RSA', 'verification', key_size, file_name, verify_time, rate, backend)
 
-        # DSA Tests
+        # DSA Tests, one run per backend
         for key_size in key_sizes['DSA']:
-            dsa = DSAEncryption(key_size)
-            
-            sign_time, signature = measure_time(dsa.sign)(data)
-            rate = calculate_bytes_rate(sign_time, file_name)
-            save_results('DSA', 'signing', key_size, file_name, sign_time, rate)
-            
-            verify_time, _ = measure_time(dsa.verify)(data, signature)
-            rate = calculate_bytes_rate(verify_time, file_name)
-            save_results('DSA', 'verification', key_size, file_name, verify_time, rate)
+            for backend in DSAEncryption.SUPPORTED_BACKENDS:
+                dsa = DSAEncryption(key_size, backend=backend)
+
+                sign_time, signature = measure_time(dsa.sign)(data)
+                rate = calculate_bytes_rate(sign_time, file_name)
+                save_results('DSA', 'signing', key_size, file_name, sign_time, rate, backend)
+
+                verify_time, _ = measure_time(dsa.verify)(data, signature)
+                rate = calculate_bytes_rate(verify_time, file_name)
+                save_results('DSA', 'verification', key_size, file_name, verify_time, rate, backend)
 
         # DH Tests
         for key_size in key_sizes['DH']:
             dhe = DiffieHellmanEncryption(key_size)
             
-            dhe.run(key_size)
-            exchange_time = dhe.execution_time
+            exchange_time = 0
+            for _ in range(KEY_EXCHANGE_REPEATS):
+                dhe.run(key_size)
+                exchange_time += dhe.execution_time
+            exchange_time /= KEY_EXCHANGE_REPEATS
             rate = calculate_bytes_rate(exchange_time, file_name)
-            save_results('DH', 'key_exchange', key_size, file_name, exchange_time, rate)
+            save_results('DH', 'key_exchange', key_size, file_name, exchange_time, rate, CRYPTOGRAPHY)
 
-        # ECC Tests
+        # ECC Tests, one run per backend
         for curve in key_sizes['ECC']:
-            ecc = ECCEncryption(curve)
-            
-            # Signing/Verification
-            sign_time, signature = measure_time(ecc.sign)(data)
+            for backend in ECCEncryption.SUPPORTED_BACKENDS:
+                ecc = ECCEncryption(curve, backend=backend)
+
+                # Signing/Verification
+                sign_time, signature = measure_time(ecc.sign)(data)
+                rate = calculate_bytes_rate(sign_time, file_name)
+                save_results('ECC', 'signing', curve, file_name, sign_time, rate, backend)
+
+                verify_time, _ = measure_time(ecc.verify)(data, signature)
+                rate = calculate_bytes_rate(verify_time, file_name)
+                save_results('ECC', 'verification', curve, file_name, verify_time, rate, backend)
+
+        # EdDSA Tests
+        for curve in key_sizes['EdDSA']:
+            eddsa_signer = EdDSAEncryption(curve)
+
+            sign_time, signature = measure_time(eddsa_signer.sign)(data)
             rate = calculate_bytes_rate(sign_time, file_name)
-            save_results('ECC', 'signing', curve, file_name, sign_time, rate)
-            
-            verify_time, _ = measure_time(ecc.verify)(data, signature)
+            save_results(curve, 'signing', curve, file_name, sign_time, rate)
+
+            verify_time, _ = measure_time(eddsa_signer.verify)(data, signature)
             rate = calculate_bytes_rate(verify_time, file_name)
-            save_results('ECC', 'verification', curve, file_name, verify_time, rate)
+            save_results(curve, 'verification', curve, file_name, verify_time, rate)
+
+        # X25519 and ECDH Tests
+        exchanges = [('X25519', 'Curve25519', X25519Encryption())]
+        exchanges += [('ECDH', curve, ECDHEncryption(curve)) for curve in key_sizes['ECDH']]
+        for algorithm, curve, exchange in exchanges:
+            exchange_time = 0
+            for _ in range(KEY_EXCHANGE_REPEATS):
+                exchange.run()
+                exchange_time += exchange.execution_time
+            exchange_time /= KEY_EXCHANGE_REPEATS
+            rate = calculate_bytes_rate(exchange_time, file_name)
+            save_results(algorithm, 'key_exchange', curve, file_name, exchange_time, rate, CRYPTOGRAPHY)
+
+        print(f"Completed analysis for {file_name}")
+
+    # RSA envelope Tests on the symmetric suite's 1-50 MB files
+    rsa_keys = [RSAEncryption(key_size, backend=backend)
+                for key_size in key_sizes['RSA'] for backend in RSAEncryption.SUPPORTED_BACKENDS]
+    large_files = [f for f in os.listdir(LARGE_DATA_DIR) if f.endswith('.txt')]
+    for file_name in large_files:
+        with open(os.path.join(LARGE_DATA_DIR, file_name), 'rb') as file:
+            data = file.read()
+
+        for rsa in rsa_keys:
+            enc_time, envelope = measure_time(rsa.encrypt_envelope)(data)
+            rate = calculate_bytes_rate(enc_time, file_name)
+            save_results('RSA', 'envelope_encryption', rsa.key_size, file_name, enc_time, rate, rsa.backend)
+
+            dec_time, _ = measure_time(rsa.decrypt_envelope)(*envelope)
+            rate = calculate_bytes_rate(dec_time, file_name)
+            save_results('RSA', 'envelope_decryption', rsa.key_size, file_name, dec_time, rate, rsa.backend)
+
+        print(f"Completed envelope analysis for {file_name}")
+
+    # File signing Tests: chunked hashing and digest signing timed separately
+    file_signers = [(algorithm, key_size, signer_class(key_size, backend=backend))
+                    for algorithm, key_size, signer_class in (('RSA', 2048, RSAEncryption), ('DSA', 2048, DSAEncryption),
+                                                              ('ECC', 'P-256', ECCEncryption))
+                    for backend in signer_class.SUPPORTED_BACKENDS]
+    file_signers += [(curve, curve, EdDSAEncryption(curve)) for curve in key_sizes['EdDSA']]
+    for file_name in large_files:
+        for algorithm, key_size, signer in file_signers:
+            benchmark_file_signing(algorithm, signer, key_size, file_name, os.path.join(LARGE_DATA_DIR, file_name))
 
-        print(f"Completed analysis for {file_name}")
\ No newline at end of file
+        print(f"Completed file signing analysis for {file_name}")
\ No newline at end of file
@@ -8,21 +8,27 @@ RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results',
 class AsymmetricDataVisualization:
     def __init__(self):
         self.data = pd.read_csv(RESULTS_PATH)
-        self.algorithms = ["RSA", "DSA", "DH", "ECC"]
+        self.algorithms = ["RSA", "DSA", "DH", "ECC", "Ed25519", "Ed448", "X25519", "ECDH"]
         self.base_plot_dir = os.path.join(os.path.dirname(__file__), '..', 'media', 'plots', 'asymmetric_analysis')
         os.makedirs(self.base_plot_dir, exist_ok=True)
         self.colors = {
             "RSA": "blue",
             "DSA": "green",
             "DH": "red",
-            "ECC": "purple"
+            "ECC": "purple",
+            "Ed25519": "orange",
+            "Ed448": "brown",
+            "X25519": "cyan",
+            "ECDH": "olive"
         }
         self.operation_colors = {
             "encryption": "blue",
             "decryption": "green",
             "signing": "red",
             "verification": "purple",
-            "key_exchange": "orange"
+            "key_exchange": "orange",
+            "envelope_encryption": "teal",
+            "envelope_decryption": "olive"
         }
 
     def clean_file_name(self, file_name):
@@ -9,8 +9,11 @@ class DataVisualization:
     def __init__(self):
         self.data = pd.read_csv(RESULTS_PATH)
         self.algorithms = {
-            "Symmetric": ["AESEncryption", "DESEncryption", "DES3Encryption", "RC2Encryption", "RC4Encryption", "BlowfishEncryption"],
-            "Asymmetric": ["RSAEncryption", "DSAEncryption", "DHEncryption", "ECCEncryption"],
+            "Symmetric": ["AESEncryption", "DESEncryption", "DES3Encryption", "RC2Encryption", "RC4Encryption", "BlowfishEncryption",
+                          "CAST128Encryption", "TwofishEncryption", "ChaCha20Encryption", "ChaCha20Poly1305Encryption",
+                          "Salsa20Encryption"],
+            "Asymmetric": ["RSAEncryption", "DSAEncryption", "DHEncryption", "ECCEncryption",
+                           "EdDSAEncryption", "X25519Encryption", "ECDHEncryption"],
             "Hashing": ["SHA1Hash", "SHA2Hash", "MD5Hash", "HMACHash"]
         }
         self.base_plot_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'media', 'plots')
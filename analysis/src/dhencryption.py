@@ -1,28 +1,34 @@
+import os
+import sys
 import time
-from cryptography.hazmat.primitives.asymmetric import dh
-from cryptography.hazmat.backends import default_backend
+
+# Add the src directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.asymmetric import load_dh_parameters
 
 class DHEncryption:
     """
     Class to perform Diffie-Hellman key exchange.
     """
 
-    def __init__(self, key_size=2048):
+    def __init__(self, key_size=2048, group='ffdhe'):
         """
         Initialize the Diffie-Hellman parameters and generate a key pair.
 
         :param key_size: Size of the key in bits (default is 2048 bits).
+        :param group: 'ffdhe' (RFC 7919), 'modp' (RFC 3526) or 'generated' (see load_dh_parameters).
         """
         print("Initializing DHEncryption...")
         print(f"Key size provided: {key_size}")
 
-        # Attempt to generate parameters
+        # Attempt to load parameters
         try:
-            print("Attempting to generate parameters...")
-            self.parameters = dh.generate_parameters(generator=2, key_size=key_size, backend=default_backend())
-            print("Parameters generated successfully.")
+            print(f"Loading {group} parameters...")
+            self.parameters = load_dh_parameters(key_size, group)
+            print("Parameters loaded successfully.")
         except Exception as e:
-            print(f"Error generating parameters: {e}")
+            print(f"Error loading parameters: {e}")
             raise
 
         # Generate private and public keys
@@ -65,17 +71,13 @@ class DHEncryption:
         """
         print(f"Running Diffie-Hellman exchange with key size: {key_size}")
         try:
-            # Generate the other party's Diffie-Hellman key pair
-            print("Generating other party's private key...")
+            # Only key generation and the exchange are timed, the prints stay outside
+            start_time = time.time()
             other_party_private_key = self.parameters.generate_private_key()
-            print("Other party's private key generated.")
             other_party_public_key = other_party_private_key.public_key()
-            print("Other party's public key generated.")
-
-            # Generate shared keys
-            start_time = time.time()
-            self.generate_shared_key(other_party_public_key)
+            self.private_key.exchange(other_party_public_key)
             self.execution_time = time.time() - start_time
+            print("Other party's key pair generated and shared key exchanged.")
             print(f"Shared key exchange completed in {self.execution_time:.4f} seconds.")
         except Exception as e:
             print(f"Error during Diffie-Hellman exchange: {e}")
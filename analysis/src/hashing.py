@@ -12,17 +12,60 @@ import os
 import time
 import csv
 import hashlib
+import io
+import mmap
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from Crypto.Hash import SHA1, SHA224, SHA256, SHA384, SHA512, MD5, HMAC
 from Crypto.Random import get_random_bytes
 
 # Define constants
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'sample_text')
 ANALYSIS_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'hashing_analysis_results.csv')
+CHUNK_SIZE = 1024 * 1024  # Bytes read per chunk by hash_file and hash_stream
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'hashing_digest_manifest.csv')
 
-class SHA1Hash:
+class _ChunkedHash:
+    """
+    File and stream hashing shared by the hash classes, built on their _new_hash().
+    """
+    def _hexdigest(self, h):
+        """
+        Return the hex digest of a finished hash object.
+        """
+        return h.hexdigest()
+
+    def hash_file(self, path, chunk_size=CHUNK_SIZE, use_mmap=False):
+        """
+        Hash a file in fixed-size chunks, without decoding it or loading it into memory.
+        
+        :param path: Path of the file to hash.
+        :param chunk_size: Number of bytes read per chunk.
+        :param use_mmap: Hash through a memory map instead of chunked reads.
+        :return: The hash digest.
+        """
+        return self._hexdigest(_hash_file(self._new_hash(), path, chunk_size, use_mmap))
+
+    def hash_stream(self, reader, chunk_size=CHUNK_SIZE):
+        """
+        Hash everything read from a binary stream.
+        
+        :param reader: A binary file-like object with readinto.
+        :param chunk_size: Number of bytes read per chunk.
+        :return: The hash digest.
+        """
+        return self._hexdigest(_hash_stream(self._new_hash(), reader, chunk_size))
+
+class SHA1Hash(_ChunkedHash):
     """
     Class to perform SHA-1 hashing.
     """
+    def _new_hash(self):
+        """
+        Create a new SHA-1 hash object.
+        """
+        return SHA1.new()
+
     def hash(self, message):
         """
         Hash the message using SHA-1.
@@ -30,13 +73,13 @@ class SHA1Hash:
         :param message: The message to hash.
         :return: The hash digest.
         """
-        h = SHA1.new()
+        h = self._new_hash()
         if isinstance(message, str):
             message = message.encode('utf-8')  # Convert to bytes if str
         h.update(message)
         return h.hexdigest()
 
-class SHA2Hash:
+class SHA2Hash(_ChunkedHash):
     """
     Class to perform SHA-2 hashing.
     """
@@ -48,6 +91,20 @@ class SHA2Hash:
         """
         self.algorithm = algorithm
 
+    def _new_hash(self):
+        """
+        Create a new hash object for the configured SHA-2 algorithm.
+        """
+        if self.algorithm == 'SHA-224':
+            return SHA224.new()
+        elif self.algorithm == 'SHA-256':
+            return SHA256.new()
+        elif self.algorithm == 'SHA-384':
+            return SHA384.new()
+        elif self.algorithm == 'SHA-512':
+            return SHA512.new()
+        raise ValueError(f"Unsupported SHA-2 algorithm: {self.algorithm}")
+
     def hash(self, message):
         """
         Hash the message using SHA-2.
@@ -55,23 +112,22 @@ class SHA2Hash:
         :param message: The message to hash.
         :return: The hash digest.
         """
-        if self.algorithm == 'SHA-224':
-            h = SHA224.new()
-        elif self.algorithm == 'SHA-256':
-            h = SHA256.new()
-        elif self.algorithm == 'SHA-384':
-            h = SHA384.new()
-        elif self.algorithm == 'SHA-512':
-            h = SHA512.new()
+        h = self._new_hash()
         if isinstance(message, str):
             message = message.encode('utf-8')  # Convert to bytes if str
         h.update(message)
         return h.hexdigest()
 
-class MD5Hash:
+class MD5Hash(_ChunkedHash):
     """
     Class to perform MD5 hashing.
     """
+    def _new_hash(self):
+        """
+        Create a new MD5 hash object.
+        """
+        return MD5.new()
+
     def hash(self, message):
         """
         Hash the message using MD5.
@@ -79,13 +135,13 @@ class MD5Hash:
         :param message: The message to hash.
         :return: The hash digest.
         """
-        h = MD5.new()
+        h = self._new_hash()
         if isinstance(message, str):
             message = message.encode('utf-8')  # Convert to bytes if str
         h.update(message)
         return h.hexdigest()
 
-class HMACHash:
+class HMACHash(_ChunkedHash):
     """
     Class to perform HMAC hashing.
     """
@@ -97,6 +153,12 @@ class HMACHash:
         """
         self.key = key or get_random_bytes(16)
 
+    def _new_hash(self):
+        """
+        Create a new HMAC-SHA256 object keyed with this instance's key.
+        """
+        return HMAC.new(self.key, digestmod=SHA256)
+
     def hash(self, message):
         """
         Hash the message using HMAC.
@@ -104,13 +166,13 @@ class HMACHash:
         :param message: The message to hash.
         :return: The hash digest.
         """
-        h = HMAC.new(self.key, digestmod=SHA256)
+        h = self._new_hash()
         if isinstance(message, str):
             message = message.encode('utf-8')  # Convert to bytes if str
         h.update(message)
         return h.hexdigest()
 
-class SHA3Hash:
+class SHA3Hash(_ChunkedHash):
     """
     Class to perform SHA-3 hashing.
     """
@@ -122,6 +184,20 @@ class SHA3Hash:
         """
         self.algorithm = algorithm
 
+    def _new_hash(self):
+        """
+        Create a new hash object for the configured SHA-3 algorithm.
+        """
+        if self.algorithm == 'SHA3-224':
+            return hashlib.sha3_224()
+        elif self.algorithm == 'SHA3-256':
+            return hashlib.sha3_256()
+        elif self.algorithm == 'SHA3-384':
+            return hashlib.sha3_384()
+        elif self.algorithm == 'SHA3-512':
+            return hashlib.sha3_512()
+        raise ValueError(f"Unsupported SHA-3 algorithm: {self.algorithm}")
+
     def hash(self, message):
         """
         Hash the message using SHA-3.
@@ -129,20 +205,13 @@ class SHA3Hash:
         :param message: The message to hash.
         :return: The hash digest.
         """
-        if self.algorithm == 'SHA3-224':
-            h = hashlib.sha3_224()
-        elif self.algorithm == 'SHA3-256':
-            h = hashlib.sha3_256()
-        elif self.algorithm == 'SHA3-384':
-            h = hashlib.sha3_384()
-        elif self.algorithm == 'SHA3-512':
-            h = hashlib.sha3_512()
+        h = self._new_hash()
         if isinstance(message, str):
             message = message.encode('utf-8')  # Convert to bytes if str
         h.update(message)
         return h.hexdigest()
 
-class SHAKEHash:
+class SHAKEHash(_ChunkedHash):
     """
     Class to perform SHAKE hashing.
     """
@@ -156,6 +225,16 @@ class SHAKEHash:
         self.algorithm = algorithm
         self.output_length = output_length
 
+    def _new_hash(self):
+        """
+        Create a new hash object for the configured SHAKE algorithm.
+        """
+        if self.algorithm == 'SHAKE128':
+            return hashlib.shake_128()
+        elif self.algorithm == 'SHAKE256':
+            return hashlib.shake_256()
+        raise ValueError(f"Unsupported SHAKE algorithm: {self.algorithm}")
+
     def hash(self, message):
         """
         Hash the message using SHAKE.
@@ -163,15 +242,154 @@ class SHAKEHash:
         :param message: The message to hash.
         :return: The hash digest.
         """
-        if self.algorithm == 'SHAKE128':
-            h = hashlib.shake_128()
-        elif self.algorithm == 'SHAKE256':
-            h = hashlib.shake_256()
+        h = self._new_hash()
         if isinstance(message, str):
             message = message.encode('utf-8')  # Convert to bytes if str
         h.update(message)
         return h.hexdigest(self.output_length)
 
+    def _hexdigest(self, h):
+        """
+        Return the hex digest of a finished hash object, ``output_length`` bytes long.
+        """
+        return h.hexdigest(self.output_length)
+
+class MultiDigest:
+    """
+    Compute the digests of several hash algorithms in a single pass over the data.
+    
+    Each chunk is read once and handed to every hasher on a thread pool;
+    hashlib and pycryptodome release the GIL while hashing large buffers, so
+    the hashers run concurrently and the pass takes about as long as the
+    slowest one. The next chunk is read into a second buffer meanwhile.
+    """
+    def __init__(self, hashers, workers=None):
+        """
+        Initialize the engine.
+        
+        :param hashers: Mapping of algorithm name to a hash class instance, e.g. {'SHA-256': SHA2Hash()}.
+        :param workers: Number of hashing threads (default is one per hasher).
+        """
+        self.hashers = dict(hashers)
+        self.workers = workers or len(self.hashers)
+
+    def _hexdigests(self, hashes):
+        """
+        Build the digest manifest from the finished hash objects.
+        """
+        return {name: hasher._hexdigest(h) for (name, hasher), h in zip(self.hashers.items(), hashes)}
+
+    def hash(self, message):
+        """
+        Hash an in-memory message with every algorithm.
+        
+        :param message: The message to hash.
+        :return: The digest manifest, mapping each algorithm name to its digest.
+        """
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+        return self.hash_stream(io.BytesIO(message))
+
+    def hash_stream(self, reader, chunk_size=CHUNK_SIZE):
+        """
+        Hash everything read from a binary stream with every algorithm.
+        
+        :param reader: A binary file-like object with readinto.
+        :param chunk_size: Number of bytes read per chunk.
+        :return: The digest manifest, mapping each algorithm name to its digest.
+        """
+        hashes = [hasher._new_hash() for hasher in self.hashers.values()]
+        buffers = [bytearray(chunk_size), bytearray(chunk_size)]
+        views = [memoryview(buffer) for buffer in buffers]
+        pending = []
+        current = 0
+        with ThreadPoolExecutor(self.workers) as executor:
+            while True:
+                # The other buffer is still being hashed while this one is filled
+                read = reader.readinto(buffers[current])
+                for future in pending:
+                    future.result()
+                if not read:
+                    break
+                chunk = views[current][:read]
+                pending = [executor.submit(h.update, chunk) for h in hashes]
+                current ^= 1
+        return self._hexdigests(hashes)
+
+    def hash_file(self, path, chunk_size=CHUNK_SIZE):
+        """
+        Hash a file with every algorithm in a single pass.
+        
+        :param path: Path of the file to hash.
+        :param chunk_size: Number of bytes read per chunk.
+        :return: The digest manifest, mapping each algorithm name to its digest.
+        """
+        with open(path, 'rb', buffering=0) as file:
+            return self.hash_stream(file, chunk_size)
+
+@contextmanager
+def _map_file(path):
+    """
+    Map a file read-only and yield a memoryview over its contents.
+    
+    :param path: Path of the file to map.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files cannot be memory mapped
+            yield memoryview(b'')
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            try:
+                view.release()
+                mapped.close()
+            except BufferError:
+                # A slice is still referenced; the map is closed when it is collected
+                pass
+
+def _hash_stream(h, reader, chunk_size=CHUNK_SIZE):
+    """
+    Feed a binary stream to a hash object in fixed-size chunks.
+    
+    Every chunk is read into the same buffer and passed to update() as a
+    memoryview slice, so memory use does not grow with the stream size.
+    
+    :param h: The hash object to update.
+    :param reader: A binary file-like object with readinto.
+    :param chunk_size: Number of bytes read per chunk.
+    :return: The updated hash object.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        read = reader.readinto(buffer)
+        if not read:
+            break
+        h.update(view[:read])
+    return h
+
+def _hash_file(h, path, chunk_size=CHUNK_SIZE, use_mmap=False):
+    """
+    Feed a file to a hash object in fixed-size chunks or through a memory map.
+    
+    :param h: The hash object to update.
+    :param path: Path of the file to hash.
+    :param chunk_size: Number of bytes read per chunk.
+    :param use_mmap: Hash the whole memory map in one update() instead.
+    :return: The updated hash object.
+    """
+    if use_mmap:
+        with _map_file(path) as data:
+            h.update(data)
+        return h
+    # Unbuffered, so readinto fills the buffer straight from the file
+    with open(path, 'rb', buffering=0) as file:
+        return _hash_stream(h, file, chunk_size)
+
 def save_time_result(algorithm_name, file_name, total_time):
     with open(ANALYSIS_RESULTS_PATH, 'a', newline='') as csvfile:
         writer = csv.writer(csvfile)
@@ -185,9 +403,31 @@ def measure_hash_time(hash_function, data, algorithm_name, file_name):
     total_time = end_time - start_time
     save_time_result(algorithm_name, file_name, total_time)
 
+def measure_hash_file_time(hash_function, algorithm_name, file_name):
+    start_time = time.time()
+    hash_function.hash_file(os.path.join(DATA_DIR, file_name))
+    end_time = time.time()
+    total_time = end_time - start_time
+    save_time_result(algorithm_name, file_name, total_time)
+
+def measure_multi_digest_time(engine, file_name):
+    start_time = time.time()
+    manifest = engine.hash_file(os.path.join(DATA_DIR, file_name))
+    end_time = time.time()
+    total_time = end_time - start_time
+    save_time_result('All (single pass)', file_name, total_time)
+    save_manifest(file_name, manifest)
+
+def save_manifest(file_name, manifest):
+    file_size = os.path.getsize(os.path.join(DATA_DIR, file_name))
+    with open(MANIFEST_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        for algorithm_name, digest in manifest.items():
+            writer.writerow([file_name, file_size, algorithm_name, digest])
+
 def load_data(file_name):
     data_path = os.path.join(DATA_DIR, file_name)
-    with open(data_path, 'r') as file:
+    with open(data_path, 'rb') as file:
         return file.read()
 
 # Example usage
@@ -197,35 +437,31 @@ if __name__ == "__main__":
         writer = csv.writer(csvfile)
         writer.writerow(['Algorithm', 'File Name', 'Time Taken'])
 
+    with open(MANIFEST_PATH, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['File Name', 'File Size', 'Algorithm', 'Digest'])
+
     # List of sample data files
     sample_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.txt')]
 
     for file_name in sample_files:
-        data = load_data(file_name)
-        sha1 = SHA1Hash()
-        sha2_224 = SHA2Hash('SHA-224')
-        sha2_256 = SHA2Hash('SHA-256')
-        sha2_384 = SHA2Hash('SHA-384')
-        sha2_512 = SHA2Hash('SHA-512')
-        md5 = MD5Hash()
-        hmac = HMACHash()
-        sha3_224 = SHA3Hash('SHA3-224')
-        sha3_256 = SHA3Hash('SHA3-256')
-        sha3_384 = SHA3Hash('SHA3-384')
-        sha3_512 = SHA3Hash('SHA3-512')
-        shake128 = SHAKEHash('SHAKE128', 32)
-        shake256 = SHAKEHash('SHAKE256', 64)
-
-        measure_hash_time(sha1, data, 'SHA-1', file_name)
-        measure_hash_time(sha2_224, data, 'SHA-224', file_name)
-        measure_hash_time(sha2_256, data, 'SHA-256', file_name)
-        measure_hash_time(sha2_384, data, 'SHA-384', file_name)
-        measure_hash_time(sha2_512, data, 'SHA-512', file_name)
-        measure_hash_time(md5, data, 'MD5', file_name)
-        measure_hash_time(hmac, data, 'HMAC', file_name)
-        measure_hash_time(sha3_224, data, 'SHA3-224', file_name)
-        measure_hash_time(sha3_256, data, 'SHA3-256', file_name)
-        measure_hash_time(sha3_384, data, 'SHA3-384', file_name)
-        measure_hash_time(sha3_512, data, 'SHA3-512', file_name)
-        measure_hash_time(shake128, data, 'SHAKE128', file_name)
-        measure_hash_time(shake256, data, 'SHAKE256', file_name)
\ No newline at end of file
+        hashers = {
+            'SHA-1': SHA1Hash(),
+            'SHA-224': SHA2Hash('SHA-224'),
+            'SHA-256': SHA2Hash('SHA-256'),
+            'SHA-384': SHA2Hash('SHA-384'),
+            'SHA-512': SHA2Hash('SHA-512'),
+            'MD5': MD5Hash(),
+            'HMAC': HMACHash(),
+            'SHA3-224': SHA3Hash('SHA3-224'),
+            'SHA3-256': SHA3Hash('SHA3-256'),
+            'SHA3-384': SHA3Hash('SHA3-384'),
+            'SHA3-512': SHA3Hash('SHA3-512'),
+            'SHAKE128': SHAKEHash('SHAKE128', 32),
+            'SHAKE256': SHAKEHash('SHAKE256', 64),
+        }
+
+        # One pass per algorithm, then all of them in a single pass
+        for algorithm_name, hasher in hashers.items():
+            measure_hash_file_time(hasher, algorithm_name, file_name)
+        measure_multi_digest_time(MultiDigest(hashers), file_name)
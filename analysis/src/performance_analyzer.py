@@ -10,14 +10,18 @@ from memory_profiler import memory_usage
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import specific algorithms directly
-from src.symmetric import AESEncryption, DESEncryption, DES3Encryption, RC2Encryption, RC4Encryption, BlowfishEncryption
-from src.asymmetric import RSAEncryption, DSAEncryption, DHEncryption, ECCEncryption
+from src.symmetric import (AESEncryption, DESEncryption, DES3Encryption, RC2Encryption, RC4Encryption, BlowfishEncryption,
+                           CAST128Encryption, TwofishEncryption, ChaCha20Encryption, ChaCha20Poly1305Encryption,
+                           Salsa20Encryption, Twofish, SEGMENT_SIZE)
+from src.asymmetric import (RSAEncryption, DSAEncryption, DHEncryption, ECCEncryption, EdDSAEncryption,
+                            X25519Encryption, ECDHEncryption)
 from src.hashing import SHA1Hash, SHA2Hash, MD5Hash, HMACHash
 
 # Define constants
 DATA_DIR = os.path.join(os.path.dirname(__file__),  '..', 'data', 'sample_text')
 SMALLER_DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'smaller_sample_text')
 RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'performance_data.csv')
+SCALING_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'scaling_data.csv')
 DEFAULT_ITERATIONS = 2
 DEFAULT_KEYSIZE = None 
 
@@ -32,10 +36,20 @@ class PerformanceMetrics:
             iterations (int): Number of iterations to measure performance over.
         """
         self.iterations = iterations
+        self.total_setup_time = 0
         self.total_time = 0
         self.total_cpu = 0
         self.total_ram = 0
 
+    def record_setup(self, start_time):
+        """
+        Record the time spent creating the algorithm instance (key generation).
+
+        Args:
+            start_time (float): Time the instance creation started.
+        """
+        self.total_setup_time += time.time() - start_time
+
     def record_iteration(self, start_time, start_cpu, start_ram):
         """
         Record performance metrics for a single iteration.
@@ -58,9 +72,10 @@ class PerformanceMetrics:
         Calculate average metrics over all iterations.
 
         Returns:
-            dict: A dictionary containing average time, CPU usage, and RAM usage.
+            dict: A dictionary containing average setup time, time, CPU usage, and RAM usage.
         """
         return {
+            "avg_setup_time": self.total_setup_time / self.iterations,
             "avg_time": self.total_time / self.iterations,
             "avg_cpu": self.total_cpu / self.iterations,
             "avg_ram": self.total_ram / self.iterations,
@@ -83,13 +98,25 @@ class PerformanceAnalyzer:
         self.encryption_algorithms = {
             "AESEncryption", "DESEncryption", "DES3Encryption", 
             "RC2Encryption", "RC4Encryption", "BlowfishEncryption", 
+            "CAST128Encryption", "TwofishEncryption", "ChaCha20Encryption",
+            "ChaCha20Poly1305Encryption", "Salsa20Encryption",
             "RSAEncryption", 
         }
+        # Symmetric classes take their key size in bytes, the key_sizes table below is in bits
+        self.symmetric_algorithms = {
+            "AESEncryption", "DESEncryption", "DES3Encryption", "RC2Encryption", "RC4Encryption",
+            "BlowfishEncryption", "CAST128Encryption", "TwofishEncryption", "ChaCha20Encryption",
+            "ChaCha20Poly1305Encryption", "Salsa20Encryption",
+        }
         self.signing_algorithms = {
-            "DSAEncryption", "ECCEncryption"
+            "DSAEncryption", "ECCEncryption", "EdDSAEncryption"
         }
         self.key_exchange_algorithms = {
-            "DHEncryption"
+            "DHEncryption", "X25519Encryption", "ECDHEncryption"
+        }
+        # Classes that load their key pair from the key store unless asked for a fresh one
+        self.key_pair_algorithms = {
+            "RSAEncryption", "DSAEncryption", "ECCEncryption", "EdDSAEncryption"
         }
         self.algorithms = {
             "AESEncryption": AESEncryption,
@@ -98,15 +125,25 @@ class PerformanceAnalyzer:
             "RC2Encryption": RC2Encryption,
             "RC4Encryption": RC4Encryption,
             "BlowfishEncryption": BlowfishEncryption,
+            "CAST128Encryption": CAST128Encryption,
+            "TwofishEncryption": TwofishEncryption,
+            "ChaCha20Encryption": ChaCha20Encryption,
+            "ChaCha20Poly1305Encryption": ChaCha20Poly1305Encryption,
+            "Salsa20Encryption": Salsa20Encryption,
             "RSAEncryption": RSAEncryption,
             "DSAEncryption": DSAEncryption,
             "DHEncryption": DHEncryption,
             "ECCEncryption": ECCEncryption,
+            "EdDSAEncryption": EdDSAEncryption,
+            "X25519Encryption": X25519Encryption,
+            "ECDHEncryption": ECDHEncryption,
             "SHA1Hash": SHA1Hash,
             "SHA2Hash": SHA2Hash,
             "MD5Hash": MD5Hash,
             "HMACHash": HMACHash,
         }
+        if Twofish is None:  # the twofish package is optional
+            del self.algorithms["TwofishEncryption"]
         self.data = []
 
     def get_data_files(self, algo_name):
@@ -117,7 +154,8 @@ class PerformanceAnalyzer:
             list: A list of file paths for data files in the data directory.
         """
          # Use SMALLER_DATA_DIR for asymmetric algorithms, otherwise use the regular DATA_DIR
-        if algo_name in ["RSAEncryption", "DSAEncryption", "DHEncryption", "ECCEncryption"]:
+        if algo_name in ["RSAEncryption", "DSAEncryption", "DHEncryption", "ECCEncryption",
+                         "EdDSAEncryption", "X25519Encryption", "ECDHEncryption"]:
             data_dir = SMALLER_DATA_DIR
         else:
             data_dir = self.data_dir
@@ -125,7 +163,7 @@ class PerformanceAnalyzer:
         return [os.path.join(data_dir, file) for file in os.listdir(data_dir) if file.endswith(".txt")]
 
     
-    def analyze_algorithm(self, algo_name, algo_class, data, key_size=None):
+    def analyze_algorithm(self, algo_name, algo_class, data, key_size=None, fresh_keys=False):
         """
         Analyze the performance of a specific algorithm with given data.
 
@@ -133,34 +171,42 @@ class PerformanceAnalyzer:
             algo_name (str): Name of the algorithm.
             algo_class (class): The class representing the algorithm.
             data (bytes): The input data to process.
-            key_size (int): The key size for encryption algorithms.
+            key_size (int): The key size for encryption algorithms, in bits.
+            fresh_keys (bool): Generate a new RSA, DSA or ECC key pair per iteration
+                instead of loading it from the key store, so avg_setup_time is key generation.
 
         Returns:
             dict: A dictionary containing average performance metrics.
         """
         metrics = PerformanceMetrics()
+        if key_size and algo_name in self.symmetric_algorithms:
+            key_size //= 8
+        key_options = {"fresh": True} if fresh_keys and algo_name in self.key_pair_algorithms else {}
         for _ in range(metrics.iterations):
-            start_time = time.time()
-            start_cpu = psutil.cpu_percent(interval=None)
-            start_ram = psutil.virtual_memory().percent
-
-            # Execute algorithm functions
+            # Key generation is timed on its own so it does not inflate the operation time
+            setup_start = time.time()
             no_key_size_algorithms = ["DESEncryption"]
             if algo_class.__name__ in no_key_size_algorithms:
                 algo_instance = algo_class()
             else:
-                algo_instance = algo_class(key_size) if key_size else algo_class()
+                algo_instance = algo_class(key_size, **key_options) if key_size else algo_class(**key_options)
+            metrics.record_setup(setup_start)
+
+            start_time = time.time()
+            start_cpu = psutil.cpu_percent(interval=None)
+            start_ram = psutil.virtual_memory().percent
 
+            # Execute algorithm functions
             if algo_name in self.encryption_algorithms:
                 encrypted_data = algo_instance.encrypt(data)  # For encryption algorithms
             elif algo_name in self.signing_algorithms:
                 signed_data = algo_instance.sign(data.decode())
             elif algo_name in self.key_exchange_algorithms:
-                # Generate the other party's Diffie-Hellman key pair
-                other_party_private_key = algo_instance.parameters.generate_private_key()
+                # Generate the other party's key pair in the same group or on the same curve
+                other_party_private_key = algo_instance.new_peer_private_key()
                 other_party_public_key = other_party_private_key.public_key()
 
-                # Pass the other party's public key (which is a DHPublicKey object) to generate the shared key
+                # Pass the other party's public key to generate the shared key
                 shared_key = algo_instance.generate_shared_key(other_party_public_key)
                 # Ensure shared_key is not returned here, as it's not needed for performance metrics
 
@@ -186,7 +232,14 @@ class PerformanceAnalyzer:
             "RC2Encryption": [40, 64, 128],  # RC2 supports variable key sizes
             "RC4Encryption": [40, 128],  # RC4 supports variable key sizes
             "BlowfishEncryption": [128, 448],  # Blowfish supports variable key sizes up to 448 bits
+            "CAST128Encryption": [40, 128],  # CAST-128 supports 40 to 128-bit keys
+            "TwofishEncryption": [128, 192, 256],
+            "ChaCha20Encryption": [256],  # ChaCha20 only uses 256-bit keys
+            "ChaCha20Poly1305Encryption": [256],
+            "Salsa20Encryption": [128, 256],
             "RSAEncryption": [2048, 3072, 4096],  # RSA supports various sizes
+            "EdDSAEncryption": ["Ed25519", "Ed448"],
+            "ECDHEncryption": ["P-256", "P-384", "P-521"],
         }
 
         results = []
@@ -254,6 +307,7 @@ class PerformanceAnalyzer:
                 # Update existing entry with the new average metrics
                 existing_data[unique_key].update({
                     "avg_cpu": result["avg_cpu"],
+                    "avg_setup_time": result["avg_setup_time"],
                     "avg_time": result["avg_time"],
                     "avg_ram": result["avg_ram"],
                 })
@@ -265,17 +319,82 @@ class PerformanceAnalyzer:
                     "iterations": result["iterations"],
                     "key_size": result["key_size"],
                     "avg_cpu": result["avg_cpu"],
+                    "avg_setup_time": result["avg_setup_time"],
                     "avg_time": result["avg_time"],
                     "avg_ram": result["avg_ram"],
                 }
 
         # Write back to the CSV file
         with open(RESULTS_PATH, mode="w", newline="") as csv_file:
-            fieldnames = ["algorithm", "data_size", "iterations", "key_size", "avg_cpu", "avg_time", "avg_ram"]
+            fieldnames = ["algorithm", "data_size", "iterations", "key_size", "avg_cpu", "avg_setup_time", "avg_time", "avg_ram"]
             writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(existing_data.values())
 
+    def analyze_segmented_scaling(self, data, max_workers=None, key_size=16, segment_size=SEGMENT_SIZE, iterations=DEFAULT_ITERATIONS):
+        """
+        Measure how segmented AES-GCM throughput scales from 1 to N worker threads.
+
+        Args:
+            data (bytes): The input data to encrypt.
+            max_workers (int): Highest worker count to measure (default is the CPU count).
+            key_size (int): AES key size in bytes.
+            segment_size (int): Plaintext bytes per segment.
+            iterations (int): Number of runs averaged for each worker count.
+
+        Returns:
+            list: One dictionary per worker count with average times, MB/s and speedup over one worker.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        aes = AESEncryption(key_size, raw=True)
+        size_mb = len(data) / (1024 * 1024)
+        results = []
+        baseline = None
+
+        for workers in range(1, max_workers + 1):
+            encrypt_total = 0
+            decrypt_total = 0
+            for _ in range(iterations):
+                start_time = time.time()
+                encrypted = aes.encrypt_segmented(data, segment_size, workers)
+                encrypt_total += time.time() - start_time
+
+                start_time = time.time()
+                aes.decrypt_segmented(*encrypted, segment_size=segment_size, workers=workers)
+                decrypt_total += time.time() - start_time
+
+            avg_encrypt = encrypt_total / iterations
+            avg_decrypt = decrypt_total / iterations
+            if baseline is None:
+                baseline = avg_encrypt
+            results.append({
+                "workers": workers,
+                "data_size": len(data),
+                "segment_size": segment_size,
+                "avg_encrypt_time": avg_encrypt,
+                "avg_decrypt_time": avg_decrypt,
+                "encrypt_mb_per_s": size_mb / avg_encrypt if avg_encrypt > 0 else 0,
+                "decrypt_mb_per_s": size_mb / avg_decrypt if avg_decrypt > 0 else 0,
+                "speedup": baseline / avg_encrypt if avg_encrypt > 0 else 0,
+            })
+
+        return results
+
+    def save_scaling_results(self, results, output_path=SCALING_RESULTS_PATH):
+        """
+        Save worker scaling results to a CSV file, replacing any previous run.
+
+        Args:
+            results (list): Result dictionaries returned by analyze_segmented_scaling.
+            output_path (str): Path of the CSV file to write.
+        """
+        fieldnames = ["workers", "data_size", "segment_size", "avg_encrypt_time", "avg_decrypt_time",
+                      "encrypt_mb_per_s", "decrypt_mb_per_s", "speedup"]
+        with open(output_path, mode="w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(results)
+
     def collect_performance_data(self, algorithm, data_size, iterations, key_size):
         cpu_usage = []
         ram_usage = []
@@ -324,3 +443,10 @@ class PerformanceAnalyzer:
 if __name__ == "__main__":
     analyzer = PerformanceAnalyzer()
     analyzer.analyze_performance()
+
+    # Worker scaling of segmented AES-GCM on the largest sample
+    data_files = analyzer.get_data_files("AESEncryption")
+    if data_files:
+        with open(max(data_files, key=os.path.getsize), "rb") as file:
+            data = file.read()
+        analyzer.save_scaling_results(analyzer.analyze_segmented_scaling(data))
@@ -7,438 +7,2263 @@ DES (Data Encryption Standard)
 RC2
 RC4
 Blowfish
+CAST-128
+Twofish
+ChaCha20
+ChaCha20-Poly1305
+Salsa20
 """
-from Crypto.Cipher import AES, DES, DES3, ARC2, ARC4, Blowfish
+from Crypto.Cipher import AES, DES, DES3, ARC2, ARC4, Blowfish, CAST, ChaCha20, ChaCha20_Poly1305, Salsa20
 from Crypto.Util.Padding import pad, unpad
 from Crypto.Random import get_random_bytes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.decrepit.ciphers import algorithms as decrepit_algorithms
+from cryptography.exceptions import InvalidTag
 import base64
 import time
 import os
 import csv
+import sys
+import tempfile
+import argparse
+import mmap
+import traceback
+import struct
+from array import array
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from twofish import Twofish
+except ImportError:  # Optional, only needed for TwofishEncryption
+    Twofish = None
 
 # Define constants
 DATA_DIR = os.path.join(os.path.dirname(__file__),  '..', 'data', 'sample_text')
 ANALYSIS_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'symmetric_analysis_results.csv')
+SMALL_MESSAGE_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'middle_sample_text')
+SMALL_MESSAGE_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'symmetric_small_message_results.csv')
+PHASE_RESULTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'results', 'symmetric_phase_results.csv')
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read per chunk by the streaming API
+SMALL_MESSAGE_COUNT = 10000  # Messages per run in the small-message benchmark
+SEGMENT_SIZE = 4 * 1024 * 1024  # Plaintext bytes per segment in segmented AES-GCM
+PHASE_REPEATS = 100  # Runs averaged for the key generation and key schedule phases
+COST_MESSAGE_SIZES = (16, 256, 4 * 1024, 64 * 1024, 1024 * 1024)  # Message sizes the cost model is fitted to
+# AES modes selectable through the ``mode`` argument, mapped to the nonce (or IV)
+# length each one uses; the nonce is stored at the start of encrypted files
+AES_NONCE_SIZES = {'GCM': 16, 'OCB': 15, 'EAX': 16, 'SIV': 16, 'CTR': 8, 'CBC': 16}
+AEAD_MODES = ('GCM', 'OCB', 'EAX', 'SIV')  # Modes that produce an authentication tag
+AES_TAG_SIZE = 16
+TWOFISH_BLOCK_SIZE = 16
+CHACHA20_NONCE_SIZE = 12  # RFC 7539 nonce, used by ChaCha20 and ChaCha20-Poly1305
+SALSA20_NONCE_SIZE = 8
+POLY1305_TAG_SIZE = 16
+
+# Implementations selectable through the ``backend`` argument, shared with the asymmetric classes
+PYCRYPTODOME = 'pycryptodome'
+CRYPTOGRAPHY = 'cryptography'  # OpenSSL through the cryptography package
+OPENSSL_AES_MODES = ('GCM', 'CTR', 'CBC')  # AES modes implemented for the cryptography backend
+TWOFISH = 'twofish'  # Block function from the twofish package, chained in Python
+
+class _SymmetricCipher:
+    """
+    Buffer, file, batch and streaming methods shared by the encryption classes.
+    
+    Subclasses provide ``_new_cipher(nonce)`` and describe the cipher through
+    the class attributes below. The nonce is the IV for the CBC ciphers and is
+    empty for RC4. The extra values returned by the encrypt methods are the tag
+    (AES and ChaCha20-Poly1305) followed by the nonce (all but RC4), and the
+    decrypt methods take them back in the same order.
+    """
+    block_size = None  # Block size each message is PKCS#7 padded to, None for stream ciphers and modes
+    nonce_size = 0  # Bytes of nonce (or IV) stored at the start of encrypted files
+    tag_size = 0  # Bytes of tag stored at the end of encrypted files
+    has_tag = False  # Whether a tag is returned and expected back
+    supports_output = True  # Whether the cipher objects accept an ``output=`` buffer
+
+    def _new_nonce(self):
+        """
+        Generate a random nonce (or IV) of ``nonce_size`` bytes.
+        """
+        return get_random_bytes(self.nonce_size)
+
+    def _tag_output(self, tag):
+        """
+        Encode a tag for output, passing through the None of the unauthenticated modes.
+        """
+        return None if tag is None else _encode_output(tag, self.raw)
+
+    def _tag_input(self, tag):
+        """
+        Decode a tag given to a decrypt method, passing through None.
+        """
+        return None if tag is None else bytes(_decode_input(tag))
+
+    def _output_params(self, tag, nonce):
+        """
+        Return the tag and nonce this cipher hands back, encoded for output.
+        """
+        params = (self._tag_output(tag),) if self.has_tag else ()
+        if self.nonce_size:
+            params += (_encode_output(nonce, self.raw),)
+        return params
+
+    def _input_params(self, params):
+        """
+        Decode the values returned by _output_params.
+        
+        :param params: The tag and nonce as passed to a decrypt method.
+        :return: The tag (None without one) and the nonce.
+        """
+        expected = int(self.has_tag) + int(self.nonce_size > 0)
+        if len(params) != expected:
+            raise TypeError(f"{type(self).__name__} expects {expected} values after the data, got {len(params)}")
+        tag = self._tag_input(params[0]) if self.has_tag else None
+        nonce = _decode_input(params[-1]) if self.nonce_size else b''
+        return tag, nonce
+
+    def _seal(self, cipher, data):
+        """
+        Encrypt all of ``data`` with a fresh cipher.
+        
+        :return: The ciphertext and the tag, or None for the unauthenticated ciphers.
+        """
+        if self.tag_size:
+            return cipher.encrypt_and_digest(data)
+        return cipher.encrypt(data), None
+
+    def _open(self, cipher, data, tag):
+        """
+        Decrypt all of ``data`` with a fresh cipher, verifying the tag if there is one.
+        """
+        if self.tag_size:
+            return cipher.decrypt_and_verify(data, tag)
+        return cipher.decrypt(data)
+
+    def _encrypt_to(self, cipher, src, dst):
+        """
+        Encrypt ``src`` into the equally long buffer ``dst`` without padding.
+        
+        :return: The tag, or None for the unauthenticated ciphers.
+        """
+        if self.supports_output:
+            cipher.encrypt(src, output=dst)
+        else:
+            _transform_chunks(cipher.encrypt, src, dst)
+        return cipher.digest() if self.tag_size else None
+
+    def _decrypt_to(self, cipher, src, dst, tag):
+        """
+        Decrypt ``src`` into the equally long buffer ``dst`` and verify the tag if there is one.
+        """
+        if self.supports_output:
+            cipher.decrypt(src, output=dst)
+        else:
+            _transform_chunks(cipher.decrypt, src, dst)
+        if self.tag_size:
+            cipher.verify(tag)
+
+    def _encrypt_chunks(self, cipher, reader, writer, chunk_size):
+        """
+        Encrypt a stream without padding.
+        
+        :return: The tag, or None for the unauthenticated ciphers.
+        """
+        _stream_transform(cipher.encrypt, reader, writer, chunk_size, supports_output=self.supports_output)
+        return cipher.digest() if self.tag_size else None
+
+    def _decrypt_chunks(self, cipher, reader, writer, tag, chunk_size):
+        """
+        Decrypt a stream without padding and verify the tag if there is one.
+        """
+        _stream_transform(cipher.decrypt, reader, writer, chunk_size, supports_output=self.supports_output)
+        if self.tag_size:
+            cipher.verify(tag)
+
+    def key_schedule(self):
+        """
+        Run the key schedule, returning a fresh cipher object with a random nonce (or IV).
+        
+        :return: A cipher object ready to process data.
+        """
+        return self._new_cipher(self._new_nonce())
+
+    def ciphertext_size(self, plaintext_size):
+        """
+        Return the ciphertext length for a plaintext of the given size.
+        
+        :param plaintext_size: Length of the plaintext in bytes.
+        :return: Length of the ciphertext in bytes.
+        """
+        if self.block_size:
+            return plaintext_size - plaintext_size % self.block_size + self.block_size
+        return plaintext_size
+
+    def encrypt_into(self, src, dst):
+        """
+        Encrypt ``src``, writing the ciphertext into a preallocated buffer.
+        
+        :param src: Bytes-like plaintext.
+        :param dst: Writable buffer (bytearray or memoryview) of at least ``ciphertext_size(len(src))`` bytes.
+        :return: The number of bytes written, followed by the tag and nonce if the cipher has them.
+        """
+        nonce = self._new_nonce()
+        cipher = self._new_cipher(nonce)
+        tag = None
+        if self.block_size:
+            length = _cbc_encrypt_into(cipher, self.block_size, src, dst)
+        else:
+            length = len(src)
+            if len(dst) < length:
+                raise ValueError(f"Output buffer too small: {length} bytes required")
+            tag = self._encrypt_to(cipher, memoryview(src), memoryview(dst)[:length])
+        params = self._output_params(tag, nonce)
+        return (length,) + params if params else length
+
+    def decrypt_into(self, src, dst, *params):
+        """
+        Decrypt ``src`` into a preallocated buffer, verifying the tag or
+        stripping the padding in place.
+        
+        :param src: Bytes-like ciphertext.
+        :param dst: Writable buffer of at least ``len(src)`` bytes.
+        :param params: The tag and nonce returned by encrypt_into, as base64 strings or raw bytes.
+        :return: The number of plaintext bytes at the start of ``dst``.
+        """
+        tag, nonce = self._input_params(params)
+        cipher = self._new_cipher(nonce)
+        if self.block_size:
+            return _cbc_decrypt_into(cipher, self.block_size, src, dst)
+        length = len(src)
+        self._decrypt_to(cipher, memoryview(src), memoryview(dst)[:length], tag)
+        return length
+
+    def encrypt_file(self, src_path, dst_path):
+        """
+        Encrypt a file through memory maps.
+        
+        The output file is laid out as nonce || ciphertext || tag, leaving out
+        what the cipher does not have (IV || padded ciphertext for CBC). It is
+        preallocated, so neither file is read into memory.
+        
+        :param src_path: Path of the plaintext file.
+        :param dst_path: Path of the encrypted file to create.
+        :return: The size of the encrypted file in bytes.
+        """
+        nonce = self._new_nonce()
+        cipher = self._new_cipher(nonce)
+        if self.block_size:
+            return _cbc_encrypt_file(cipher, self.block_size, nonce, src_path, dst_path)
+        nonce_size = len(nonce)
+        with _map_input(src_path) as src:
+            length = len(src)
+            total = nonce_size + length + self.tag_size
+            with _map_output(dst_path, total) as dst:
+                dst[:nonce_size] = nonce
+                tag = self._encrypt_to(cipher, src, dst[nonce_size:nonce_size + length])
+                if tag is not None:
+                    dst[nonce_size + length:] = tag
+        return total
 
-class AESEncryption:
+    def decrypt_file(self, src_path, dst_path):
+        """
+        Decrypt a file written by encrypt_file through memory maps.
+        
+        The output file is removed if the tag or padding does not verify.
+        
+        :param src_path: Path of the encrypted file.
+        :param dst_path: Path of the plaintext file to create.
+        :return: The size of the plaintext file in bytes.
+        """
+        if self.block_size:
+            return _cbc_decrypt_file(self._new_cipher, self.block_size, src_path, dst_path)
+        nonce_size = self.nonce_size
+        with _map_input(src_path) as src:
+            length = len(src) - nonce_size - self.tag_size
+            if length < 0:
+                raise ValueError("Encrypted file is too short")
+            tag = bytes(src[nonce_size + length:]) if self.tag_size else None
+            try:
+                with _map_output(dst_path, length) as dst:
+                    cipher = self._new_cipher(bytes(src[:nonce_size]))
+                    self._decrypt_to(cipher, src[nonce_size:nonce_size + length], dst, tag)
+            except ValueError:
+                os.remove(dst_path)
+                raise
+        return length
+
+    def encrypt_many(self, messages):
+        """
+        Encrypt a batch of messages with a single cipher operation.
+        
+        The messages are packed back to back (each padded separately for CBC)
+        and encrypted under one fresh nonce or IV, so the batch must be
+        decrypted as a whole with decrypt_many. With a tag, the message
+        boundaries are authenticated along with the data.
+        
+        :param messages: Iterable of str or bytes-like messages.
+        :return: The packed ciphertext and the end offset of each message, followed by the tag and nonce if the cipher has them.
+        """
+        packed, offsets = _pack_messages(messages, self.block_size)
+        nonce = self._new_nonce()
+        cipher = self._new_cipher(nonce)
+        if self.tag_size:
+            cipher.update(_offsets_aad(offsets))
+        ciphertext, tag = self._seal(cipher, packed)
+        return (_encode_output(ciphertext, self.raw), offsets) + self._output_params(tag, nonce)
+
+    def decrypt_many(self, ciphertext, offsets, *params):
+        """
+        Decrypt and verify a batch produced by encrypt_many.
+        
+        :param ciphertext: The packed ciphertext as a base64 string or raw bytes.
+        :param offsets: The end offset of each message.
+        :param params: The tag and nonce returned by encrypt_many, as base64 strings or raw bytes.
+        :return: A list of plaintexts (bytes if raw output is enabled).
+        """
+        tag, nonce = self._input_params(params)
+        offsets = array('Q', offsets)
+        cipher = self._new_cipher(nonce)
+        if self.tag_size:
+            cipher.update(_offsets_aad(offsets))
+        plaintext = self._open(cipher, _decode_input(ciphertext), tag)
+        return _unpack_messages(plaintext, offsets, self.block_size, self.raw)
+
+    def encrypt_stream(self, reader, writer, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Encrypt a binary stream chunk by chunk.
+        
+        :param reader: Binary file-like object to read the plaintext from.
+        :param writer: Binary file-like object the ciphertext is written to.
+        :param chunk_size: Number of bytes to read per chunk.
+        :return: The tag and nonce if the cipher has them (a single value if it has one, None for RC4).
+        """
+        nonce = self._new_nonce()
+        cipher = self._new_cipher(nonce)
+        tag = None
+        if self.block_size:
+            _cbc_encrypt_stream(cipher, self.block_size, reader, writer, chunk_size)
+        else:
+            tag = self._encrypt_chunks(cipher, reader, writer, chunk_size)
+        params = self._output_params(tag, nonce)
+        if len(params) > 1:
+            return params
+        return params[0] if params else None
+
+    def decrypt_stream(self, reader, writer, *params, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Decrypt a binary stream chunk by chunk.
+        
+        The tag is only checked once the whole stream has been processed, so the
+        output must be discarded if a ValueError is raised.
+        
+        :param reader: Binary file-like object to read the ciphertext from.
+        :param writer: Binary file-like object the plaintext is written to.
+        :param params: The tag and nonce returned by encrypt_stream, as base64 strings or raw bytes.
+        :param chunk_size: Number of bytes to read per chunk.
+        """
+        tag, nonce = self._input_params(params)
+        cipher = self._new_cipher(nonce)
+        if self.block_size:
+            _cbc_decrypt_stream(cipher, self.block_size, reader, writer, chunk_size)
+        else:
+            self._decrypt_chunks(cipher, reader, writer, tag, chunk_size)
+
+class AESEncryption(_SymmetricCipher):
     """
     Class to perform AES encryption and decryption.
     """
-    def __init__(self, key_size=16):
+    SUPPORTED_BACKENDS = (PYCRYPTODOME, CRYPTOGRAPHY)
+    has_tag = True  # Returns a tag, None in the unauthenticated modes
+
+    def __init__(self, key_size=16, raw=False, backend=PYCRYPTODOME, mode='GCM'):
         """
         Initialize the AES cipher with a random key.
         
+        SIV splits its key into a MAC key and an encryption key, so a key of
+        twice ``key_size`` bytes is generated for it.
+        
         :param key_size: Size of the key in bytes (default is 16 bytes for AES-128).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation, PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
+        :param mode: Mode of operation, one of AES_NONCE_SIZES (default is GCM).
         """
-        self.key = get_random_bytes(key_size)
+        if mode not in AES_NONCE_SIZES:
+            raise ValueError(f"Unsupported AES mode: {mode}")
+        if backend == CRYPTOGRAPHY and mode not in OPENSSL_AES_MODES:
+            raise ValueError(f"AES-{mode} is not available with the {backend!r} backend")
+        self.key = get_random_bytes(2 * key_size if mode == 'SIV' else key_size)
         self.name = "AESEncryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = mode
+        self.block_size = AES.block_size if mode == 'CBC' else None
+        self.nonce_size = AES_NONCE_SIZES[mode]
+        self.tag_size = AES_TAG_SIZE if mode in AEAD_MODES else 0
         self.execution_time = 0
 
+    def _new_cipher(self, nonce):
+        """
+        Create a fresh AES cipher object in the selected mode using the selected backend.
+        
+        :param nonce: The nonce (or IV for CBC) to use.
+        :return: A pycryptodome cipher or an object with the same interface.
+        """
+        nonce = bytes(nonce)
+        if self.backend == CRYPTOGRAPHY:
+            if self.mode == 'GCM':
+                mode = modes.GCM(nonce)
+            elif self.mode == 'CTR':
+                # pycryptodome counts in the low 8 bytes of the counter block
+                mode = modes.CTR(nonce + bytes(16 - len(nonce)))
+            else:
+                mode = modes.CBC(nonce)
+            return _OpenSSLCipher(algorithms.AES(self.key), mode)
+        if self.mode == 'CBC':
+            return AES.new(self.key, AES.MODE_CBC, iv=nonce)
+        return AES.new(self.key, getattr(AES, 'MODE_' + self.mode), nonce=nonce)
+
+    def _encrypt_to(self, cipher, src, dst):
+        """
+        Encrypt ``src`` into the equally long buffer ``dst`` in a non-CBC mode.
+        
+        GCM, EAX and CTR write straight into ``dst``. OCB and SIV cannot, so
+        their output is copied.
+        
+        :return: The tag, or None for CTR.
+        """
+        if self.mode == 'SIV':
+            ciphertext, tag = cipher.encrypt_and_digest(bytes(src))
+            dst[:len(ciphertext)] = ciphertext
+            return tag
+        if self.mode == 'OCB':
+            ciphertext = cipher.encrypt(src) + cipher.encrypt()
+            dst[:len(ciphertext)] = ciphertext
+            return cipher.digest()
+        return super()._encrypt_to(cipher, src, dst)
+
+    def _decrypt_to(self, cipher, src, dst, tag):
+        """
+        Decrypt ``src`` into the equally long buffer ``dst`` in a non-CBC mode
+        and verify the tag for the AEAD modes.
+        """
+        if self.mode == 'SIV':
+            plaintext = cipher.decrypt_and_verify(bytes(src), tag)
+            dst[:len(plaintext)] = plaintext
+        elif self.mode == 'OCB':
+            plaintext = cipher.decrypt(src) + cipher.decrypt()
+            cipher.verify(tag)
+            dst[:len(plaintext)] = plaintext
+        else:
+            super()._decrypt_to(cipher, src, dst, tag)
+
+    def _encrypt_chunks(self, cipher, reader, writer, chunk_size):
+        """
+        Encrypt a stream in a non-CBC mode.
+        
+        SIV needs the whole message before it can produce any output, so it
+        cannot be streamed. OCB holds back data until it is finished.
+        """
+        if self.mode == 'SIV':
+            raise ValueError("SIV mode cannot be streamed")
+        if self.mode != 'OCB':
+            return super()._encrypt_chunks(cipher, reader, writer, chunk_size)
+        _stream_transform(cipher.encrypt, reader, writer, chunk_size, supports_output=False)
+        writer.write(cipher.encrypt())
+        return cipher.digest()
+
+    def _decrypt_chunks(self, cipher, reader, writer, tag, chunk_size):
+        """
+        Decrypt a stream in a non-CBC mode and verify the tag for the AEAD modes.
+        """
+        if self.mode == 'SIV':
+            raise ValueError("SIV mode cannot be streamed")
+        if self.mode != 'OCB':
+            return super()._decrypt_chunks(cipher, reader, writer, tag, chunk_size)
+        _stream_transform(cipher.decrypt, reader, writer, chunk_size, supports_output=False)
+        writer.write(cipher.decrypt())
+        cipher.verify(tag)
+
     def encrypt(self, plaintext):
         """
-        Encrypt the plaintext using AES-GCM.
+        Encrypt the plaintext using AES in the selected mode.
         
         :param plaintext: The plaintext to encrypt.
-        :return: The ciphertext, tag, and nonce.
+        :return: The ciphertext, tag (None for CTR and CBC) and nonce (the IV
+            for CBC), base64 encoded unless raw output is enabled.
         """
         if isinstance(plaintext, str):
             plaintext = plaintext.encode('utf-8')
-        cipher = AES.new(self.key, AES.MODE_GCM)
-        ciphertext, tag = cipher.encrypt_and_digest(plaintext)
-        return base64.b64encode(ciphertext).decode('utf-8'), base64.b64encode(tag).decode('utf-8'), base64.b64encode(cipher.nonce).decode('utf-8')
+        if self.mode == 'CBC':
+            plaintext = pad(plaintext, AES.block_size)
+        nonce = self._new_nonce()
+        ciphertext, tag = self._seal(self._new_cipher(nonce), plaintext)
+        return _encode_output(ciphertext, self.raw), self._tag_output(tag), _encode_output(nonce, self.raw)
 
     def decrypt(self, ciphertext, tag, nonce):
         """
-        Decrypt the ciphertext using AES-GCM.
+        Decrypt the ciphertext using AES in the selected mode.
+        
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param tag: The tag as a base64 string or raw bytes (None for CTR and CBC).
+        :param nonce: The nonce as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
+        """
+        ciphertext = _decode_input(ciphertext)
+        cipher = self._new_cipher(_decode_input(nonce))
+        plaintext = self._open(cipher, ciphertext, self._tag_input(tag))
+        if self.mode == 'CBC':
+            plaintext = unpad(plaintext, AES.block_size)
+        return plaintext if self.raw else plaintext.decode('utf-8')
+
+    def encrypt_segmented(self, data, segment_size=SEGMENT_SIZE, workers=None):
+        """
+        Encrypt ``data`` as independently authenticated AES-GCM segments on a thread pool.
+        
+        Segment ``i`` uses the nonce ``prefix || i`` and authenticates the segment
+        count, so segments cannot be reordered, dropped or appended. A final
+        commitment tag covers the count, the segment size and every segment tag.
+        pycryptodome releases the GIL inside its C code, so the segments are
+        encrypted in parallel on worker threads.
+        
+        :param data: Bytes-like plaintext (str is encoded as UTF-8).
+        :param segment_size: Plaintext bytes per segment.
+        :param workers: Number of worker threads (default is the CPU count).
+        :return: The ciphertext, the concatenated segment tags, the nonce prefix and the commitment.
+        """
+        if self.mode != 'GCM':
+            raise ValueError("Segmented encryption is only available in GCM mode")
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        src = memoryview(data)
+        count = _segment_count(len(src), segment_size)
+        prefix = get_random_bytes(8)
+        out = bytearray(len(src))
+        tags = bytearray(16 * count)
+        dst = memoryview(out)
+
+        def encrypt_segment(index):
+            start = index * segment_size
+            end = min(start + segment_size, len(src))
+            cipher = self._new_cipher(prefix + struct.pack('>I', index))
+            cipher.update(struct.pack('>QQ', count, segment_size))
+            cipher.encrypt(src[start:end], output=dst[start:end])
+            tags[16 * index:16 * (index + 1)] = cipher.digest()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(encrypt_segment, range(count)))
+
+        commitment = self._segment_commitment(prefix, count, segment_size, tags).digest()
+        return (_encode_output(out, self.raw), _encode_output(tags, self.raw),
+                _encode_output(prefix, self.raw), _encode_output(commitment, self.raw))
+
+    def decrypt_segmented(self, ciphertext, tags, nonce, commitment, segment_size=SEGMENT_SIZE, workers=None):
+        """
+        Verify and decrypt the output of encrypt_segmented on a thread pool.
+        
+        :param ciphertext: The ciphertext as a base64 string or raw bytes.
+        :param tags: The concatenated segment tags as a base64 string or raw bytes.
+        :param nonce: The nonce prefix as a base64 string or raw bytes.
+        :param commitment: The commitment tag as a base64 string or raw bytes.
+        :param segment_size: Plaintext bytes per segment used during encryption.
+        :param workers: Number of worker threads (default is the CPU count).
+        :return: The decrypted plaintext (a bytearray if raw output is enabled).
+        """
+        if self.mode != 'GCM':
+            raise ValueError("Segmented encryption is only available in GCM mode")
+        src = memoryview(_decode_input(ciphertext))
+        tags = bytes(_decode_input(tags))
+        prefix = bytes(_decode_input(nonce))
+        count = _segment_count(len(src), segment_size)
+        if len(tags) != 16 * count:
+            raise ValueError("Segment count does not match the number of tags")
+        self._segment_commitment(prefix, count, segment_size, tags).verify(_decode_input(commitment))
+        out = bytearray(len(src))
+        dst = memoryview(out)
+
+        def decrypt_segment(index):
+            start = index * segment_size
+            end = min(start + segment_size, len(src))
+            cipher = self._new_cipher(prefix + struct.pack('>I', index))
+            cipher.update(struct.pack('>QQ', count, segment_size))
+            cipher.decrypt(src[start:end], output=dst[start:end])
+            cipher.verify(tags[16 * index:16 * (index + 1)])
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(decrypt_segment, range(count)))
+
+        return out if self.raw else out.decode('utf-8')
+
+    def _segment_commitment(self, prefix, count, segment_size, tags):
+        """
+        Build the GCM instance whose tag commits to the segment layout and tags.
         
-        :param ciphertext: The base64 encoded ciphertext to decrypt.
-        :param tag: The base64 encoded tag.
-        :param nonce: The base64 encoded nonce.
-        :return: The decrypted plaintext.
+        :param prefix: The 8 byte nonce prefix.
+        :param count: The number of segments.
+        :param segment_size: Plaintext bytes per segment.
+        :param tags: The concatenated segment tags.
+        :return: A GCM cipher object with the commitment data authenticated.
         """
-        if isinstance(ciphertext, str):
-            ciphertext = base64.b64decode(ciphertext)
-        if isinstance(tag, str):
-            tag = base64.b64decode(tag)
-        if isinstance(nonce, str):
-            nonce = base64.b64decode(nonce)
-        cipher = AES.new(self.key, AES.MODE_GCM, nonce=nonce)
-        plaintext = cipher.decrypt_and_verify(ciphertext, tag)
-        return plaintext.decode('utf-8')
+        cipher = self._new_cipher(prefix + b'\xff\xff\xff\xff')
+        cipher.update(struct.pack('>QQ', count, segment_size))
+        cipher.update(tags)
+        return cipher
 
-class DESEncryption:
+class DESEncryption(_SymmetricCipher):
     """
     Class to perform DES encryption and decryption.
     """
-    def __init__(self, key_size=8):
+    SUPPORTED_BACKENDS = (PYCRYPTODOME,)
+    block_size = DES.block_size
+    nonce_size = DES.block_size  # The IV
+
+    def __init__(self, key_size=8, raw=False, backend=PYCRYPTODOME):
         """
         Initialize the DES cipher with a random key.
         
         :param key_size: Size of the key in bytes (default is 8 bytes for DES).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation; only PYCRYPTODOME is available.
         """
         self.key = get_random_bytes(key_size)
         self.iv = get_random_bytes(DES.block_size)
         self.name = "DESEncryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = 'CBC'
         self.execution_time = 0
 
+    def _new_cipher(self, iv):
+        """
+        Create a fresh DES-CBC cipher object.
+        
+        :param iv: The IV to use.
+        :return: A pycryptodome cipher object.
+        """
+        return DES.new(self.key, DES.MODE_CBC, iv)
+
     def encrypt(self, plaintext):
         """
         Encrypt the plaintext using DES.
         
         :param plaintext: The plaintext to encrypt.
-        :return: The base64 encoded ciphertext and IV.
+        :return: The ciphertext and IV, base64 encoded unless raw output is enabled.
         """
         if isinstance(plaintext, str):
             plaintext = plaintext.encode('utf-8')
-        cipher = DES.new(self.key, DES.MODE_CBC, self.iv)
+        cipher = self._new_cipher(self.iv)
         ciphertext = cipher.encrypt(pad(plaintext, DES.block_size))
-        return base64.b64encode(ciphertext).decode('utf-8'), base64.b64encode(self.iv).decode('utf-8')
+        return _encode_output(ciphertext, self.raw), _encode_output(self.iv, self.raw)
 
     def decrypt(self, ciphertext, iv):
         """
         Decrypt the ciphertext using DES.
         
-        :param ciphertext: The base64 encoded ciphertext to decrypt.
-        :param iv: The base64 encoded IV.
-        :return: The decrypted plaintext.
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param iv: The IV as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
         """
-        if isinstance(ciphertext, str):
-            ciphertext = base64.b64decode(ciphertext)
-        if isinstance(iv, str):
-            iv = base64.b64decode(iv)
-        cipher = DES.new(self.key, DES.MODE_CBC, iv)
+        ciphertext = _decode_input(ciphertext)
+        iv = _decode_input(iv)
+        cipher = self._new_cipher(iv)
         plaintext = unpad(cipher.decrypt(ciphertext), DES.block_size)
-        return plaintext.decode('utf-8')
+        return plaintext if self.raw else plaintext.decode('utf-8')
 
-class DES3Encryption:
+class DES3Encryption(_SymmetricCipher):
     """
     Class to perform 3DES encryption and decryption.
     """
-    def __init__(self, key_size=16):
+    SUPPORTED_BACKENDS = (PYCRYPTODOME, CRYPTOGRAPHY)
+    block_size = DES3.block_size
+    nonce_size = DES3.block_size  # The IV
+
+    def __init__(self, key_size=16, raw=False, backend=PYCRYPTODOME):
         """
         Initialize the 3DES cipher with a random key.
         
         :param key_size: Size of the key in bytes (default is 16 bytes for 3DES).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation, PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
         """
         self.key = get_random_bytes(key_size)
         self.iv = get_random_bytes(DES3.block_size)
         self.name = "DES3Encryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = 'CBC'
         self.execution_time = 0
 
+    def _new_cipher(self, iv):
+        """
+        Create a fresh 3DES-CBC cipher object using the selected backend.
+        
+        :param iv: The IV to use.
+        :return: A pycryptodome cipher or an object with the same interface.
+        """
+        if self.backend == CRYPTOGRAPHY:
+            return _OpenSSLCipher(decrepit_algorithms.TripleDES(self.key), modes.CBC(bytes(iv)))
+        return DES3.new(self.key, DES3.MODE_CBC, iv)
+
     def encrypt(self, plaintext):
         """
         Encrypt the plaintext using 3DES.
         
         :param plaintext: The plaintext to encrypt.
-        :return: The base64 encoded ciphertext and IV.
+        :return: The ciphertext and IV, base64 encoded unless raw output is enabled.
         """
         if isinstance(plaintext, str):
             plaintext = plaintext.encode('utf-8')
-        cipher = DES3.new(self.key, DES3.MODE_CBC, self.iv)
+        cipher = self._new_cipher(self.iv)
         ciphertext = cipher.encrypt(pad(plaintext, DES3.block_size))
-        return base64.b64encode(ciphertext).decode('utf-8'), base64.b64encode(self.iv).decode('utf-8')
+        return _encode_output(ciphertext, self.raw), _encode_output(self.iv, self.raw)
 
     def decrypt(self, ciphertext, iv):
         """
         Decrypt the ciphertext using 3DES.
         
-        :param ciphertext: The base64 encoded ciphertext to decrypt.
-        :param iv: The base64 encoded IV.
-        :return: The decrypted plaintext.
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param iv: The IV as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
         """
-        if isinstance(ciphertext, str):
-            ciphertext = base64.b64decode(ciphertext)
-        if isinstance(iv, str):
-            iv = base64.b64decode(iv)
-        cipher = DES3.new(self.key, DES3.MODE_CBC, iv)
+        ciphertext = _decode_input(ciphertext)
+        iv = _decode_input(iv)
+        cipher = self._new_cipher(iv)
         plaintext = unpad(cipher.decrypt(ciphertext), DES3.block_size)
-        return plaintext.decode('utf-8')
+        return plaintext if self.raw else plaintext.decode('utf-8')
 
-class RC2Encryption:
+class RC2Encryption(_SymmetricCipher):
     """
     Class to perform RC2 encryption and decryption.
     """
-    def __init__(self, key_size=16):
+    SUPPORTED_BACKENDS = (PYCRYPTODOME,)
+    block_size = ARC2.block_size
+    nonce_size = ARC2.block_size  # The IV
+
+    def __init__(self, key_size=16, raw=False, backend=PYCRYPTODOME):
         """
         Initialize the RC2 cipher with a random key.
         
         :param key_size: Size of the key in bytes (default is 16 bytes for RC2).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation; only PYCRYPTODOME is available.
         """
         self.key = get_random_bytes(key_size)
         self.iv = get_random_bytes(ARC2.block_size)
         self.name = "RC2Encryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = 'CBC'
         self.execution_time = 0
 
+    def _new_cipher(self, iv):
+        """
+        Create a fresh RC2-CBC cipher object.
+        
+        :param iv: The IV to use.
+        :return: A pycryptodome cipher object.
+        """
+        return ARC2.new(self.key, ARC2.MODE_CBC, iv)
+
     def encrypt(self, plaintext):
         """
         Encrypt the plaintext using RC2.
         
         :param plaintext: The plaintext to encrypt.
-        :return: The base64 encoded ciphertext and IV.
+        :return: The ciphertext and IV, base64 encoded unless raw output is enabled.
         """
         if isinstance(plaintext, str):
             plaintext = plaintext.encode('utf-8')
-        cipher = ARC2.new(self.key, ARC2.MODE_CBC, self.iv)
+        cipher = self._new_cipher(self.iv)
         ciphertext = cipher.encrypt(pad(plaintext, ARC2.block_size))
-        return base64.b64encode(ciphertext).decode('utf-8'), base64.b64encode(self.iv).decode('utf-8')
+        return _encode_output(ciphertext, self.raw), _encode_output(self.iv, self.raw)
 
     def decrypt(self, ciphertext, iv):
         """
         Decrypt the ciphertext using RC2.
         
-        :param ciphertext: The base64 encoded ciphertext to decrypt.
-        :param iv: The base64 encoded IV.
-        :return: The decrypted plaintext.
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param iv: The IV as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
         """
-        if isinstance(ciphertext, str):
-            ciphertext = base64.b64decode(ciphertext)
-        if isinstance(iv, str):
-            iv = base64.b64decode(iv)
-        cipher = ARC2.new(self.key, ARC2.MODE_CBC, iv)
+        ciphertext = _decode_input(ciphertext)
+        iv = _decode_input(iv)
+        cipher = self._new_cipher(iv)
         plaintext = unpad(cipher.decrypt(ciphertext), ARC2.block_size)
-        return plaintext.decode('utf-8')
+        return plaintext if self.raw else plaintext.decode('utf-8')
 
-class RC4Encryption:
+class RC4Encryption(_SymmetricCipher):
     """
     Class to perform RC4 encryption and decryption.
     """
-    def __init__(self, key_size=16):
+    SUPPORTED_BACKENDS = (PYCRYPTODOME,)
+    supports_output = False  # pycryptodome's ARC4 has no output= parameter
+
+    def __init__(self, key_size=16, raw=False, backend=PYCRYPTODOME):
         """
         Initialize the RC4 cipher with a random key.
         
         :param key_size: Size of the key in bytes (default is 16 bytes for RC4).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation; only PYCRYPTODOME is available.
         """
         self.key = get_random_bytes(key_size)
         self.name = "RC4Encryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = None  # Stream cipher
         self.execution_time = 0
 
+    def _new_cipher(self, nonce=b''):
+        """
+        Create a fresh RC4 cipher object.
+        
+        :param nonce: Ignored; RC4 has no nonce, so the shared methods pass an empty one.
+        :return: A pycryptodome cipher object.
+        """
+        return ARC4.new(self.key)
+
     def encrypt(self, plaintext):
         """
         Encrypt the plaintext using RC4.
         
         :param plaintext: The plaintext to encrypt.
-        :return: The base64 encoded ciphertext.
+        :return: The ciphertext, base64 encoded unless raw output is enabled.
         """
         if isinstance(plaintext, str):
             plaintext = plaintext.encode('utf-8')
-        cipher = ARC4.new(self.key)
+        cipher = self._new_cipher()
         ciphertext = cipher.encrypt(plaintext)
-        return base64.b64encode(ciphertext).decode('utf-8')
+        return _encode_output(ciphertext, self.raw)
 
     def decrypt(self, ciphertext):
         """
         Decrypt the ciphertext using RC4.
         
-        :param ciphertext: The base64 encoded ciphertext to decrypt.
-        :return: The decrypted plaintext.
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
         """
-        if isinstance(ciphertext, str):
-            ciphertext = base64.b64decode(ciphertext)
-        cipher = ARC4.new(self.key)
+        ciphertext = _decode_input(ciphertext)
+        cipher = self._new_cipher()
         plaintext = cipher.decrypt(ciphertext)
-        return plaintext.decode('utf-8')
+        return plaintext if self.raw else plaintext.decode('utf-8')
 
-class BlowfishEncryption:
+class BlowfishEncryption(_SymmetricCipher):
     """
     Class to perform Blowfish encryption and decryption.
     """
-    def __init__(self, key_size=16):
+    SUPPORTED_BACKENDS = (PYCRYPTODOME, CRYPTOGRAPHY)
+    block_size = Blowfish.block_size
+    nonce_size = Blowfish.block_size  # The IV
+
+    def __init__(self, key_size=16, raw=False, backend=PYCRYPTODOME):
         """
         Initialize the Blowfish cipher with a random key.
         
         :param key_size: Size of the key in bytes (default is 16 bytes for Blowfish).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation, PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
         """
         self.key = get_random_bytes(key_size)
         self.iv = get_random_bytes(Blowfish.block_size)
         self.name = "BlowfishEncryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = 'CBC'
         self.execution_time = 0
 
+    def _new_cipher(self, iv):
+        """
+        Create a fresh Blowfish-CBC cipher object using the selected backend.
+        
+        :param iv: The IV to use.
+        :return: A pycryptodome cipher or an object with the same interface.
+        """
+        if self.backend == CRYPTOGRAPHY:
+            return _OpenSSLCipher(decrepit_algorithms.Blowfish(self.key), modes.CBC(bytes(iv)))
+        return Blowfish.new(self.key, Blowfish.MODE_CBC, iv)
+
     def encrypt(self, plaintext):
         """
         Encrypt the plaintext using Blowfish.
         
         :param plaintext: The plaintext to encrypt.
-        :return: The base64 encoded ciphertext and IV.
+        :return: The ciphertext and IV, base64 encoded unless raw output is enabled.
         """
         if isinstance(plaintext, str):
             plaintext = plaintext.encode('utf-8')
-        cipher = Blowfish.new(self.key, Blowfish.MODE_CBC, self.iv)
+        cipher = self._new_cipher(self.iv)
         ciphertext = cipher.encrypt(pad(plaintext, Blowfish.block_size))
-        return base64.b64encode(ciphertext).decode('utf-8'), base64.b64encode(self.iv).decode('utf-8')
+        return _encode_output(ciphertext, self.raw), _encode_output(self.iv, self.raw)
 
     def decrypt(self, ciphertext, iv):
         """
         Decrypt the ciphertext using Blowfish.
         
-        :param ciphertext: The base64 encoded ciphertext to decrypt.
-        :param iv: The base64 encoded IV.
-        :return: The decrypted plaintext.
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param iv: The IV as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
         """
-        if isinstance(ciphertext, str):
-            ciphertext = base64.b64decode(ciphertext)
-        if isinstance(iv, str):
-            iv = base64.b64decode(iv)
-        cipher = Blowfish.new(self.key, Blowfish.MODE_CBC, iv)
+        ciphertext = _decode_input(ciphertext)
+        iv = _decode_input(iv)
+        cipher = self._new_cipher(iv)
         plaintext = unpad(cipher.decrypt(ciphertext), Blowfish.block_size)
-        return plaintext.decode('utf-8')
+        return plaintext if self.raw else plaintext.decode('utf-8')
 
-def measure_time(func):
+class CAST128Encryption(_SymmetricCipher):
     """
-    Decorator to measure the time taken by a function.
-    
-    :param func: The function to measure.
-    :return: The time taken and the function's result.
+    Class to perform CAST-128 encryption and decryption.
     """
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        return end_time - start_time, result
-    return wrapper
+    SUPPORTED_BACKENDS = (PYCRYPTODOME, CRYPTOGRAPHY)
+    block_size = CAST.block_size
+    nonce_size = CAST.block_size  # The IV
 
-def calculate_mb_rate(time_taken, filename):
-    """Calculate MB/s rate from time and filename."""
-    try:
-        size_mb = int(filename.split('_')[0].replace('mb', ''))
-        return size_mb / time_taken if time_taken > 0 else 0
-    except:
-        return 0
+    def __init__(self, key_size=16, raw=False, backend=PYCRYPTODOME):
+        """
+        Initialize the CAST-128 cipher with a random key.
+        
+        :param key_size: Size of the key in bytes (default is 16 bytes for CAST-128).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation, PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
+        """
+        self.key = get_random_bytes(key_size)
+        self.iv = get_random_bytes(CAST.block_size)
+        self.name = "CAST128Encryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = 'CBC'
+        self.execution_time = 0
+
+    def _new_cipher(self, iv):
+        """
+        Create a fresh CAST-128-CBC cipher object using the selected backend.
+        
+        :param iv: The IV to use.
+        :return: A pycryptodome cipher or an object with the same interface.
+        """
+        if self.backend == CRYPTOGRAPHY:
+            return _OpenSSLCipher(decrepit_algorithms.CAST5(self.key), modes.CBC(bytes(iv)))
+        return CAST.new(self.key, CAST.MODE_CBC, iv)
+
+    def encrypt(self, plaintext):
+        """
+        Encrypt the plaintext using CAST-128.
+        
+        :param plaintext: The plaintext to encrypt.
+        :return: The ciphertext and IV, base64 encoded unless raw output is enabled.
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode('utf-8')
+        cipher = self._new_cipher(self.iv)
+        ciphertext = cipher.encrypt(pad(plaintext, CAST.block_size))
+        return _encode_output(ciphertext, self.raw), _encode_output(self.iv, self.raw)
+
+    def decrypt(self, ciphertext, iv):
+        """
+        Decrypt the ciphertext using CAST-128.
+        
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param iv: The IV as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
+        """
+        ciphertext = _decode_input(ciphertext)
+        iv = _decode_input(iv)
+        cipher = self._new_cipher(iv)
+        plaintext = unpad(cipher.decrypt(ciphertext), CAST.block_size)
+        return plaintext if self.raw else plaintext.decode('utf-8')
 
-def save_results(algorithm, operation, key_size, file_name, time_taken, rate):
+class TwofishEncryption(_SymmetricCipher):
     """
-    Save the time taken and rate for an operation to a CSV file.
-    
-    :param algorithm: The name of the algorithm
-    :param operation: The operation performed
-    :param key_size: The size of the key
-    :param file_name: The name of the file used
-    :param time_taken: The time taken for the operation
-    :param rate: Processing rate in MB/s
+    Class to perform Twofish encryption and decryption.
     """
-    with open(ANALYSIS_RESULTS_PATH, 'a', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([algorithm, operation, key_size, file_name, time_taken, rate])
+    SUPPORTED_BACKENDS = (TWOFISH,)
+    block_size = TWOFISH_BLOCK_SIZE
+    nonce_size = TWOFISH_BLOCK_SIZE  # The IV
 
-if __name__ == "__main__":
-    # Initialize results file
-    with open(ANALYSIS_RESULTS_PATH, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['algorithm', 'operation', 'key_size', 'file_name', 'time_taken', 'rate'])
+    def __init__(self, key_size=16, raw=False, backend=TWOFISH):
+        """
+        Initialize the Twofish cipher with a random key.
+        
+        Neither pycryptodome nor cryptography implement Twofish, so this needs
+        the optional ``twofish`` package.
+        
+        :param key_size: Size of the key in bytes (16, 24 or 32; default is 16 bytes).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation; only TWOFISH is available.
+        """
+        if Twofish is None:
+            raise ImportError("TwofishEncryption requires the 'twofish' package")
+        self.key = get_random_bytes(key_size)
+        self.iv = get_random_bytes(TWOFISH_BLOCK_SIZE)
+        self.name = "TwofishEncryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = 'CBC'
+        self.execution_time = 0
 
-    # Test data files
-    sample_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.txt')]
-    key_sizes = {
-        'AES': [16, 24, 32],  # Correct key sizes for AES
-        'DES': [8],
-        '3DES': [16, 24],  # Correct key sizes for 3DES
-        'RC2': [5, 8, 16],
-        'RC4': [5, 8, 16],
-        'Blowfish': [4, 8, 16, 24, 32]  # Correct key sizes for Blowfish
-    }
+    def _new_cipher(self, iv):
+        """
+        Create a fresh Twofish-CBC cipher object.
+        
+        :param iv: The IV to use.
+        :return: An object with the pycryptodome cipher interface.
+        """
+        return _TwofishCBC(self.key, iv)
 
-    for file_name in sample_files:
-        with open(os.path.join(DATA_DIR, file_name), 'r') as file:
-            data = file.read()
+    def encrypt(self, plaintext):
+        """
+        Encrypt the plaintext using Twofish.
+        
+        :param plaintext: The plaintext to encrypt.
+        :return: The ciphertext and IV, base64 encoded unless raw output is enabled.
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode('utf-8')
+        cipher = self._new_cipher(self.iv)
+        ciphertext = cipher.encrypt(pad(plaintext, TWOFISH_BLOCK_SIZE))
+        return _encode_output(ciphertext, self.raw), _encode_output(self.iv, self.raw)
 
-        # AES Tests
-        for key_size in key_sizes['AES']:
-            aes = AESEncryption(key_size)
-            
-            try:
-                # Encryption
-                enc_time, (ciphertext, tag, nonce) = measure_time(aes.encrypt)(data)
-                rate = calculate_mb_rate(enc_time, file_name)
-                save_results('AES', 'encryption', key_size, file_name, enc_time, rate)
-                
-                # Decryption
-                dec_time, _ = measure_time(aes.decrypt)(ciphertext, tag, nonce)
-                rate = calculate_mb_rate(dec_time, file_name)
-                save_results('AES', 'decryption', key_size, file_name, dec_time, rate)
-            except Exception as e:
-                print(f"Error during AES operation with key size {key_size} and file {file_name}: {e}")
+    def decrypt(self, ciphertext, iv):
+        """
+        Decrypt the ciphertext using Twofish.
+        
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param iv: The IV as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
+        """
+        ciphertext = _decode_input(ciphertext)
+        iv = _decode_input(iv)
+        cipher = self._new_cipher(iv)
+        plaintext = unpad(cipher.decrypt(ciphertext), TWOFISH_BLOCK_SIZE)
+        return plaintext if self.raw else plaintext.decode('utf-8')
 
-        # DES Tests
-        des = DESEncryption()
+class ChaCha20Encryption(_SymmetricCipher):
+    """
+    Class to perform ChaCha20 encryption and decryption.
+    """
+    SUPPORTED_BACKENDS = (PYCRYPTODOME, CRYPTOGRAPHY)
+    nonce_size = CHACHA20_NONCE_SIZE
+
+    def __init__(self, key_size=32, raw=False, backend=PYCRYPTODOME):
+        """
+        Initialize the ChaCha20 cipher with a random key.
         
-        try:
-            # Encryption
+        :param key_size: Size of the key in bytes (ChaCha20 only accepts 32 bytes).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation, PYCRYPTODOME or CRYPTOGRAPHY (OpenSSL).
+        """
+        self.key = get_random_bytes(key_size)
+        self.name = "ChaCha20Encryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = None  # Stream cipher
+        self.execution_time = 0
+
+    def _new_cipher(self, nonce):
+        """
+        Create a fresh ChaCha20 cipher object using the selected backend.
+        
+        :param nonce: The 12 byte nonce to use.
+        :return: A pycryptodome cipher or an object with the same interface.
+        """
+        nonce = bytes(nonce)
+        if self.backend == CRYPTOGRAPHY:
+            # OpenSSL takes a 4 byte little-endian block counter followed by the nonce
+            return _OpenSSLCipher(algorithms.ChaCha20(self.key, bytes(4) + nonce), None)
+        return ChaCha20.new(key=self.key, nonce=nonce)
+
+    def encrypt(self, plaintext):
+        """
+        Encrypt the plaintext using ChaCha20.
+        
+        :param plaintext: The plaintext to encrypt.
+        :return: The ciphertext and nonce, base64 encoded unless raw output is enabled.
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode('utf-8')
+        nonce = get_random_bytes(CHACHA20_NONCE_SIZE)
+        ciphertext = self._new_cipher(nonce).encrypt(plaintext)
+        return _encode_output(ciphertext, self.raw), _encode_output(nonce, self.raw)
+
+    def decrypt(self, ciphertext, nonce):
+        """
+        Decrypt the ciphertext using ChaCha20.
+        
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param nonce: The nonce as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
+        """
+        ciphertext = _decode_input(ciphertext)
+        plaintext = self._new_cipher(_decode_input(nonce)).decrypt(ciphertext)
+        return plaintext if self.raw else plaintext.decode('utf-8')
+
+class ChaCha20Poly1305Encryption(_SymmetricCipher):
+    """
+    Class to perform ChaCha20-Poly1305 authenticated encryption and decryption.
+    """
+    SUPPORTED_BACKENDS = (PYCRYPTODOME,)
+    nonce_size = CHACHA20_NONCE_SIZE
+    tag_size = POLY1305_TAG_SIZE
+    has_tag = True
+
+    def __init__(self, key_size=32, raw=False, backend=PYCRYPTODOME):
+        """
+        Initialize the ChaCha20-Poly1305 cipher with a random key.
+        
+        The cryptography package only offers a one-shot ChaCha20-Poly1305 API,
+        which cannot serve the buffer, file and streaming methods, so only
+        pycryptodome is available.
+        
+        :param key_size: Size of the key in bytes (ChaCha20-Poly1305 only accepts 32 bytes).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation; only PYCRYPTODOME is available.
+        """
+        self.key = get_random_bytes(key_size)
+        self.name = "ChaCha20Poly1305Encryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = None  # AEAD stream cipher
+        self.execution_time = 0
+
+    def _new_cipher(self, nonce):
+        """
+        Create a fresh ChaCha20-Poly1305 cipher object.
+        
+        :param nonce: The 12 byte nonce to use.
+        :return: A pycryptodome cipher object.
+        """
+        return ChaCha20_Poly1305.new(key=self.key, nonce=bytes(nonce))
+
+    def encrypt(self, plaintext):
+        """
+        Encrypt the plaintext using ChaCha20-Poly1305.
+        
+        :param plaintext: The plaintext to encrypt.
+        :return: The ciphertext, tag, and nonce, base64 encoded unless raw output is enabled.
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode('utf-8')
+        nonce = get_random_bytes(CHACHA20_NONCE_SIZE)
+        ciphertext, tag = self._new_cipher(nonce).encrypt_and_digest(plaintext)
+        return _encode_output(ciphertext, self.raw), _encode_output(tag, self.raw), _encode_output(nonce, self.raw)
+
+    def decrypt(self, ciphertext, tag, nonce):
+        """
+        Decrypt the ciphertext using ChaCha20-Poly1305.
+        
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param tag: The tag as a base64 string or raw bytes.
+        :param nonce: The nonce as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
+        """
+        ciphertext = _decode_input(ciphertext)
+        cipher = self._new_cipher(_decode_input(nonce))
+        plaintext = cipher.decrypt_and_verify(ciphertext, _decode_input(tag))
+        return plaintext if self.raw else plaintext.decode('utf-8')
+
+class Salsa20Encryption(_SymmetricCipher):
+    """
+    Class to perform Salsa20 encryption and decryption.
+    """
+    SUPPORTED_BACKENDS = (PYCRYPTODOME,)
+    nonce_size = SALSA20_NONCE_SIZE
+
+    def __init__(self, key_size=32, raw=False, backend=PYCRYPTODOME):
+        """
+        Initialize the Salsa20 cipher with a random key.
+        
+        :param key_size: Size of the key in bytes (16 or 32; default is 32 bytes).
+        :param raw: Return raw bytes instead of base64 strings and skip decoding the plaintext.
+        :param backend: Cipher implementation; only PYCRYPTODOME is available.
+        """
+        self.key = get_random_bytes(key_size)
+        self.name = "Salsa20Encryption"
+        self.raw = raw
+        self.backend = _check_backend(self, backend)
+        self.mode = None  # Stream cipher
+        self.execution_time = 0
+
+    def _new_cipher(self, nonce):
+        """
+        Create a fresh Salsa20 cipher object.
+        
+        :param nonce: The 8 byte nonce to use.
+        :return: A pycryptodome cipher object.
+        """
+        return Salsa20.new(key=self.key, nonce=bytes(nonce))
+
+    def encrypt(self, plaintext):
+        """
+        Encrypt the plaintext using Salsa20.
+        
+        :param plaintext: The plaintext to encrypt.
+        :return: The ciphertext and nonce, base64 encoded unless raw output is enabled.
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode('utf-8')
+        nonce = get_random_bytes(SALSA20_NONCE_SIZE)
+        ciphertext = self._new_cipher(nonce).encrypt(plaintext)
+        return _encode_output(ciphertext, self.raw), _encode_output(nonce, self.raw)
+
+    def decrypt(self, ciphertext, nonce):
+        """
+        Decrypt the ciphertext using Salsa20.
+        
+        :param ciphertext: The ciphertext to decrypt as a base64 string or raw bytes.
+        :param nonce: The nonce as a base64 string or raw bytes.
+        :return: The decrypted plaintext (bytes if raw output is enabled).
+        """
+        ciphertext = _decode_input(ciphertext)
+        plaintext = self._new_cipher(_decode_input(nonce)).decrypt(ciphertext)
+        return plaintext if self.raw else plaintext.decode('utf-8')
+
+class _TwofishCBC:
+    """
+    CBC mode over the block function of the ``twofish`` package, with the
+    subset of the pycryptodome cipher interface used by the CBC helpers.
+    
+    The chaining runs in Python, one block at a time, so it is much slower
+    than the C implementations of the other ciphers.
+    """
+    def __init__(self, key, iv):
+        """
+        Initialize the chaining state.
+        
+        :param key: The Twofish key (16, 24 or 32 bytes).
+        :param iv: The 16 byte IV.
+        """
+        self._cipher = Twofish(bytes(key))
+        self._previous = bytes(iv)
+
+    def _check(self, data, output):
+        """
+        Validate the input length and return the buffer the result is written to.
+        """
+        if len(data) % TWOFISH_BLOCK_SIZE:
+            raise ValueError("Data must be padded to 16 byte boundary in CBC mode")
+        return bytearray(len(data)) if output is None else memoryview(output)
+
+    def encrypt(self, plaintext, output=None):
+        """
+        Encrypt whole blocks, like pycryptodome's ``encrypt``.
+        """
+        data = memoryview(plaintext)
+        out = self._check(data, output)
+        previous = self._previous
+        for start in range(0, len(data), TWOFISH_BLOCK_SIZE):
+            end = start + TWOFISH_BLOCK_SIZE
+            block = int.from_bytes(data[start:end], 'big') ^ int.from_bytes(previous, 'big')
+            previous = self._cipher.encrypt(block.to_bytes(TWOFISH_BLOCK_SIZE, 'big'))
+            out[start:end] = previous
+        self._previous = previous
+        return bytes(out) if output is None else None
+
+    def decrypt(self, ciphertext, output=None):
+        """
+        Decrypt whole blocks, like pycryptodome's ``decrypt``.
+        """
+        data = memoryview(ciphertext)
+        out = self._check(data, output)
+        previous = self._previous
+        for start in range(0, len(data), TWOFISH_BLOCK_SIZE):
+            end = start + TWOFISH_BLOCK_SIZE
+            block = bytes(data[start:end])
+            plain = int.from_bytes(self._cipher.decrypt(block), 'big') ^ int.from_bytes(previous, 'big')
+            out[start:end] = plain.to_bytes(TWOFISH_BLOCK_SIZE, 'big')
+            previous = block
+        self._previous = previous
+        return bytes(out) if output is None else None
+
+class _OpenSSLCipher:
+    """
+    Adapter giving a ``cryptography`` cipher context the subset of the
+    pycryptodome cipher interface used by the encryption classes.
+    
+    The direction is fixed by the first encrypt or decrypt call. ``output=`` is
+    filled in place with ``update_into``; in CBC mode OpenSSL wants a block of
+    spare room, so when ``output`` is exactly sized the last few bytes go
+    through a small scratch buffer.
+    """
+    def __init__(self, algorithm, mode):
+        """
+        Initialize the adapter.
+        
+        :param algorithm: A ``cryptography`` cipher algorithm instance.
+        :param mode: A ``cryptography`` mode instance (GCM, CTR or CBC), or None for ChaCha20.
+        """
+        self._cipher = Cipher(algorithm, mode)
+        self._context = None
+        self._aad = []
+        # Spare bytes update_into needs past the input length
+        self._slack = algorithm.block_size // 8 - 1 if isinstance(mode, modes.CBC) else 0
+        self._tail = bytearray(2 * self._slack)
+
+    def _get_context(self, encrypt):
+        """
+        Return the encryptor or decryptor, creating it on first use.
+        """
+        if self._context is None:
+            self._context = self._cipher.encryptor() if encrypt else self._cipher.decryptor()
+            for data in self._aad:
+                self._context.authenticate_additional_data(data)
+        return self._context
+
+    def _update(self, data, output, encrypt):
+        """
+        Process data, returning it or writing it into ``output``.
+        """
+        context = self._get_context(encrypt)
+        if output is None:
+            return context.update(data)
+        data = memoryview(data)
+        output = memoryview(output)
+        head = len(data)
+        if len(output) < head + self._slack:
+            head = max(0, head - self._slack)
+        written = context.update_into(data[:head], output) if head else 0
+        if head < len(data):
+            count = context.update_into(data[head:], self._tail)
+            output[written:written + count] = self._tail[:count]
+
+    def update(self, data):
+        """
+        Add associated data; it is applied once the direction is known.
+        """
+        self._aad.append(bytes(data))
+
+    def encrypt(self, plaintext, output=None):
+        """
+        Encrypt data, like pycryptodome's ``encrypt``.
+        """
+        return self._update(plaintext, output, True)
+
+    def decrypt(self, ciphertext, output=None):
+        """
+        Decrypt data, like pycryptodome's ``decrypt``.
+        """
+        return self._update(ciphertext, output, False)
+
+    def digest(self):
+        """
+        Finish encryption and return the GCM tag.
+        """
+        context = self._get_context(True)
+        context.finalize()
+        return context.tag
+
+    def verify(self, tag):
+        """
+        Finish decryption, raising ValueError if the GCM tag does not match.
+        """
+        try:
+            self._get_context(False).finalize_with_tag(bytes(tag))
+        except InvalidTag:
+            raise ValueError("MAC check failed")
+
+    def encrypt_and_digest(self, plaintext):
+        """
+        Encrypt all data and return the ciphertext and tag.
+        """
+        return self.encrypt(plaintext), self.digest()
+
+    def decrypt_and_verify(self, ciphertext, tag):
+        """
+        Decrypt all data and verify the tag.
+        """
+        plaintext = self.decrypt(ciphertext)
+        self.verify(tag)
+        return plaintext
+
+def _check_backend(instance, backend):
+    """
+    Validate a backend name against the class's SUPPORTED_BACKENDS.
+    
+    :param instance: The symmetric or asymmetric algorithm class instance.
+    :param backend: The requested backend name.
+    :return: The backend name.
+    """
+    if backend not in instance.SUPPORTED_BACKENDS:
+        raise ValueError(f"{type(instance).__name__} does not support the {backend!r} backend")
+    return backend
+
+def _encode_output(data, raw):
+    """
+    Return binary output as-is in raw mode, otherwise as a base64 string.
+    
+    :param data: The bytes to return.
+    :param raw: Whether raw output is enabled.
+    """
+    if raw:
+        return data
+    return base64.b64encode(data).decode('utf-8')
+
+def _decode_input(data):
+    """
+    Accept either a base64 string or a bytes-like object and return bytes-like data.
+    
+    :param data: A base64 string, bytes, bytearray or memoryview.
+    """
+    if isinstance(data, str):
+        return base64.b64decode(data)
+    return data
+
+def _segment_count(length, segment_size):
+    """
+    Return the number of segments used for a message of the given length.
+    
+    :param length: Length of the message in bytes.
+    :param segment_size: Bytes per segment.
+    """
+    count = (length + segment_size - 1) // segment_size
+    if count >= 0xFFFFFFFF:
+        raise ValueError("Too many segments; increase the segment size")
+    return count
+
+def _pack_messages(messages, block_size=None):
+    """
+    Concatenate messages into one buffer, padding each one for block ciphers.
+    
+    :param messages: Iterable of str or bytes-like messages.
+    :param block_size: Block size to pad each message to, or None for no padding.
+    :return: The packed bytes and an array with the 64-bit end offset of each message.
+    """
+    packed = bytearray()
+    offsets = array('Q')
+    for message in messages:
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+        packed += pad(message, block_size) if block_size else message
+        offsets.append(len(packed))
+    return bytes(packed), offsets
+
+def _offsets_aad(offsets):
+    """
+    Encode message end offsets as the associated data of an authenticated batch.
+    
+    Little-endian 64-bit integers are used whatever the host's native layout,
+    so a batch encrypted on one machine verifies on any other.
+    
+    :param offsets: The end offset of each message.
+    :return: The encoded offsets.
+    """
+    return struct.pack(f'<{len(offsets)}Q', *offsets)
+
+def _unpack_messages(plaintext, offsets, block_size, raw):
+    """
+    Split a decrypted batch back into messages, removing per-message padding.
+    
+    :param plaintext: The decrypted packed buffer.
+    :param offsets: The end offset of each message.
+    :param block_size: Block size the messages were padded to, or None.
+    :param raw: Whether to return bytes instead of decoded strings.
+    :return: A list of plaintexts.
+    """
+    view = memoryview(plaintext)
+    messages = []
+    start = 0
+    for end in offsets:
+        message = bytes(view[start:end])
+        if block_size:
+            message = unpad(message, block_size)
+        messages.append(message if raw else message.decode('utf-8'))
+        start = end
+    return messages
+
+def _close_map(mapped, view, error=None):
+    """
+    Release a memoryview and close its memory map.
+    
+    A failed tag or padding check leaves slices of the view in the locals of
+    the frames it was raised through, and the map cannot be closed while they
+    are alive, so those frames are cleared first.
+    
+    :param mapped: The mmap object.
+    :param view: The memoryview over the map.
+    :param error: The exception leaving the mapped block, if any.
+    """
+    if error is not None:
+        traceback.clear_frames(error.__traceback__)
+    view.release()
+    mapped.close()
+
+@contextmanager
+def _map_input(path):
+    """
+    Map a file read-only and yield a memoryview over its contents.
+    
+    :param path: Path of the file to map.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files cannot be memory mapped
+            yield memoryview(b'')
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield view
+        except BaseException as error:
+            _close_map(mapped, view, error)
+            raise
+        _close_map(mapped, view)
+
+@contextmanager
+def _map_output(path, size):
+    """
+    Create a file preallocated to ``size`` bytes and yield a writable memoryview over it.
+    
+    :param path: Path of the file to create.
+    :param size: Size of the file in bytes.
+    """
+    with open(path, 'w+b') as file:
+        file.truncate(size)
+        if size == 0:
+            yield memoryview(bytearray())
+            return
+        mapped = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_WRITE)
+        view = memoryview(mapped)
+        try:
+            yield view
+        except BaseException as error:
+            _close_map(mapped, view, error)
+            raise
+        mapped.flush()
+        _close_map(mapped, view)
+
+def _cbc_encrypt_file(cipher, block_size, iv, src_path, dst_path):
+    """
+    Encrypt a memory-mapped file with a CBC cipher into IV || padded ciphertext.
+    
+    :param cipher: A fresh CBC cipher object using ``iv``.
+    :param block_size: Block size of the cipher in bytes.
+    :param iv: The IV to store at the start of the output.
+    :param src_path: Path of the plaintext file.
+    :param dst_path: Path of the encrypted file to create.
+    :return: The size of the encrypted file in bytes.
+    """
+    with _map_input(src_path) as src:
+        total = block_size + len(src) - len(src) % block_size + block_size
+        with _map_output(dst_path, total) as dst:
+            dst[:block_size] = iv
+            _cbc_encrypt_into(cipher, block_size, src, dst[block_size:])
+    return total
+
+def _cbc_decrypt_file(new_cipher, block_size, src_path, dst_path):
+    """
+    Decrypt a memory-mapped IV || ciphertext file and trim the padding from the output.
+    
+    :param new_cipher: Callable returning a fresh CBC cipher object for an IV.
+    :param block_size: Block size of the cipher in bytes.
+    :param src_path: Path of the encrypted file.
+    :param dst_path: Path of the plaintext file to create.
+    :return: The size of the plaintext file in bytes.
+    """
+    with _map_input(src_path) as src:
+        if len(src) < 2 * block_size:
+            raise ValueError("Encrypted file is too short")
+        cipher = new_cipher(bytes(src[:block_size]))
+        try:
+            with _map_output(dst_path, len(src) - block_size) as dst:
+                length = _cbc_decrypt_into(cipher, block_size, src[block_size:], dst)
+        except ValueError:
+            os.remove(dst_path)
+            raise
+    os.truncate(dst_path, length)
+    return length
+
+def _transform_chunks(transform, src, dst, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Run a cipher without output buffer support over ``src`` one chunk at a
+    time, so only one chunk is ever copied.
+    
+    :param transform: Bound cipher method such as ``cipher.encrypt``.
+    :param src: Bytes-like input.
+    :param dst: Writable buffer of the same length.
+    :param chunk_size: Number of bytes per chunk.
+    """
+    src = memoryview(src)
+    length = len(src)
+    for start in range(0, length, chunk_size):
+        end = min(start + chunk_size, length)
+        dst[start:end] = transform(src[start:end])
+
+def _readinto(reader, view):
+    """
+    Fill as much of a memoryview as one read provides.
+    
+    :param reader: Binary file-like object; ``readinto`` is used when available.
+    :param view: Writable memoryview to fill.
+    :return: The number of bytes read, 0 at the end of the stream.
+    """
+    readinto = getattr(reader, 'readinto', None)
+    if readinto is not None:
+        return readinto(view) or 0
+    chunk = reader.read(len(view))
+    view[:len(chunk)] = chunk
+    return len(chunk)
+
+def _stream_transform(transform, reader, writer, chunk_size, supports_output=True):
+    """
+    Pass a stream through a length-preserving cipher operation, reusing one
+    input buffer and one output buffer for every chunk.
+    
+    :param transform: Bound cipher method such as ``cipher.encrypt``.
+    :param reader: Binary file-like object to read from.
+    :param writer: Binary file-like object to write to.
+    :param chunk_size: Number of bytes to read per chunk.
+    :param supports_output: Whether ``transform`` accepts an ``output`` buffer.
+    """
+    view = memoryview(bytearray(chunk_size))
+    out = memoryview(bytearray(chunk_size))
+    while True:
+        length = _readinto(reader, view)
+        if not length:
+            break
+        if supports_output:
+            transform(view[:length], output=out[:length])
+            writer.write(out[:length])
+        else:
+            writer.write(transform(view[:length]))
+
+def _cbc_encrypt_into(cipher, block_size, src, dst):
+    """
+    Encrypt and PKCS#7 pad ``src`` into ``dst`` without copying the aligned part.
+    
+    :param cipher: A fresh CBC cipher object.
+    :param block_size: Block size of the cipher in bytes.
+    :param src: Bytes-like plaintext.
+    :param dst: Writable buffer of at least ``len(src) - len(src) % block_size + block_size`` bytes.
+    :return: The number of ciphertext bytes written.
+    """
+    src = memoryview(src)
+    dst = memoryview(dst)
+    aligned = len(src) - len(src) % block_size
+    total = aligned + block_size
+    if len(dst) < total:
+        raise ValueError(f"Output buffer too small: {total} bytes required")
+    if aligned:
+        cipher.encrypt(src[:aligned], output=dst[:aligned])
+    cipher.encrypt(pad(bytes(src[aligned:]), block_size), output=dst[aligned:total])
+    return total
+
+def _cbc_decrypt_into(cipher, block_size, src, dst):
+    """
+    Decrypt ``src`` into ``dst`` and validate the PKCS#7 padding in place.
+    
+    :param cipher: A fresh CBC cipher object.
+    :param block_size: Block size of the cipher in bytes.
+    :param src: Bytes-like ciphertext.
+    :param dst: Writable buffer of at least ``len(src)`` bytes.
+    :return: The number of plaintext bytes at the start of ``dst``.
+    """
+    length = len(src)
+    dst = memoryview(dst)
+    if length == 0 or length % block_size:
+        raise ValueError("Ciphertext length is not a multiple of the block size")
+    if len(dst) < length:
+        raise ValueError(f"Output buffer too small: {length} bytes required")
+    cipher.decrypt(src, output=dst[:length])
+    padding = dst[length - 1]
+    if not 1 <= padding <= block_size or dst[length - padding:length] != bytes([padding]) * padding:
+        raise ValueError("Padding is incorrect.")
+    return length - padding
+
+def _cbc_encrypt_stream(cipher, block_size, reader, writer, chunk_size):
+    """
+    Feed a CBC cipher whole blocks from a reader and pad the final block.
+    
+    :param cipher: A fresh CBC cipher object.
+    :param block_size: Block size of the cipher in bytes.
+    :param reader: Binary file-like object to read the plaintext from.
+    :param writer: Binary file-like object the ciphertext is written to.
+    :param chunk_size: Number of bytes to read per chunk.
+    """
+    view = memoryview(bytearray(chunk_size + block_size))
+    out = memoryview(bytearray(chunk_size + block_size))
+    filled = 0
+    while True:
+        length = _readinto(reader, view[filled:])
+        if not length:
+            break
+        filled += length
+        aligned = filled - filled % block_size
+        if aligned:
+            cipher.encrypt(view[:aligned], output=out[:aligned])
+            writer.write(out[:aligned])
+            view[:filled - aligned] = view[aligned:filled]
+            filled -= aligned
+    total = _cbc_encrypt_into(cipher, block_size, view[:filled], out)
+    writer.write(out[:total])
+
+def _cbc_decrypt_stream(cipher, block_size, reader, writer, chunk_size):
+    """
+    Decrypt whole blocks from a reader, holding back the last block until the
+    end of the stream so its padding can be removed.
+    
+    :param cipher: A fresh CBC cipher object.
+    :param block_size: Block size of the cipher in bytes.
+    :param reader: Binary file-like object to read the ciphertext from.
+    :param writer: Binary file-like object the plaintext is written to.
+    :param chunk_size: Number of bytes to read per chunk.
+    """
+    view = memoryview(bytearray(chunk_size + 2 * block_size))
+    out = memoryview(bytearray(chunk_size + 2 * block_size))
+    filled = 0
+    while True:
+        length = _readinto(reader, view[filled:])
+        if not length:
+            break
+        filled += length
+        ready = filled - filled % block_size - block_size
+        if ready > 0:
+            cipher.decrypt(view[:ready], output=out[:ready])
+            writer.write(out[:ready])
+            view[:filled - ready] = view[ready:filled]
+            filled -= ready
+    length = _cbc_decrypt_into(cipher, block_size, view[:filled], out)
+    writer.write(out[:length])
+
+def measure_time(func):
+    """
+    Decorator to measure the time taken by a function.
+    
+    :param func: The function to measure.
+    :return: The time taken and the function's result.
+    """
+    def wrapper(*args, **kwargs):
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        return end_time - start_time, result
+    return wrapper
+
+def calculate_mb_rate(time_taken, filename):
+    """Calculate MB/s rate from time and filename."""
+    try:
+        size_mb = int(filename.split('_')[0].replace('mb', ''))
+        return size_mb / time_taken if time_taken > 0 else 0
+    except:
+        return 0
+
+def save_results(algorithm, operation, key_size, file_name, time_taken, rate, backend=PYCRYPTODOME, mode=None):
+    """
+    Save the time taken and rate for an operation to a CSV file.
+    
+    :param algorithm: The name of the algorithm
+    :param operation: The operation performed
+    :param key_size: The size of the key
+    :param file_name: The name of the file used
+    :param time_taken: The time taken for the operation
+    :param rate: Processing rate in MB/s
+    :param backend: The library that performed the operation
+    :param mode: The mode of operation, or None for stream ciphers
+    """
+    with open(ANALYSIS_RESULTS_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([algorithm, operation, key_size, file_name, time_taken, rate, backend, mode])
+
+def _decrypt_args(params):
+    """
+    Turn the extra values returned by an encrypt call (tag, nonce, IV) into
+    positional arguments for the matching decrypt call.
+    
+    :param params: None, a single value or a tuple of values.
+    """
+    if params is None:
+        return ()
+    if isinstance(params, tuple):
+        return params
+    return (params,)
+
+def benchmark_oneshot(algorithm, cipher, key_size, file_name, data):
+    """
+    Time a single encrypt/decrypt call on the whole file and save the results.
+    
+    :param algorithm: The name of the algorithm
+    :param cipher: An instance of one of the encryption classes
+    :param key_size: The size of the key
+    :param file_name: The name of the file used
+    :param data: The plaintext read from the file
+    """
+    enc_time, result = measure_time(cipher.encrypt)(data)
+    rate = calculate_mb_rate(enc_time, file_name)
+    save_results(algorithm, 'encryption', key_size, file_name, enc_time, rate, cipher.backend, cipher.mode)
+
+    dec_time, _ = measure_time(cipher.decrypt)(*_decrypt_args(result))
+    rate = calculate_mb_rate(dec_time, file_name)
+    save_results(algorithm, 'decryption', key_size, file_name, dec_time, rate, cipher.backend, cipher.mode)
+
+def benchmark_into(algorithm, cipher, key_size, file_name, data, ciphertext_buffer, plaintext_buffer):
+    """
+    Time encrypt_into/decrypt_into with caller-supplied buffers and save the results.
+    
+    The buffers are allocated once per file by the caller and reused for every
+    algorithm and key size, so no ciphertext or plaintext objects are created.
+    
+    :param algorithm: The name of the algorithm
+    :param cipher: An instance of one of the encryption classes
+    :param key_size: The size of the key
+    :param file_name: The name of the file used
+    :param data: The plaintext as a bytes-like object
+    :param ciphertext_buffer: Reusable buffer large enough for the ciphertext
+    :param plaintext_buffer: Reusable buffer large enough for the ciphertext length
+    """
+    enc_time, result = measure_time(cipher.encrypt_into)(data, ciphertext_buffer)
+    rate = calculate_mb_rate(enc_time, file_name)
+    save_results(algorithm, 'encryption_into', key_size, file_name, enc_time, rate, cipher.backend, cipher.mode)
+
+    length, params = (result[0], result[1:]) if isinstance(result, tuple) else (result, ())
+    ciphertext = memoryview(ciphertext_buffer)[:length]
+    dec_time, _ = measure_time(cipher.decrypt_into)(ciphertext, plaintext_buffer, *params)
+    rate = calculate_mb_rate(dec_time, file_name)
+    save_results(algorithm, 'decryption_into', key_size, file_name, dec_time, rate, cipher.backend, cipher.mode)
+
+def load_small_messages(count=SMALL_MESSAGE_COUNT):
+    """
+    Build a list of small messages by cycling through the SMALL_MESSAGE_DIR samples.
+    
+    :param count: Number of messages to return
+    :return: A list of bytes messages
+    """
+    samples = []
+    for file_name in sorted(os.listdir(SMALL_MESSAGE_DIR)):
+        if file_name.endswith('.txt'):
+            with open(os.path.join(SMALL_MESSAGE_DIR, file_name), 'rb') as file:
+                samples.append(file.read())
+    return [samples[i % len(samples)] for i in range(count)]
+
+def save_message_rate(algorithm, operation, key_size, messages, time_taken, backend=PYCRYPTODOME, mode=None):
+    """
+    Save the messages per second achieved for an operation to a CSV file.
+    
+    :param algorithm: The name of the algorithm
+    :param operation: The operation performed
+    :param key_size: The size of the key
+    :param messages: The number of messages processed
+    :param time_taken: The time taken for the operation
+    :param backend: The library that performed the operation
+    :param mode: The mode of operation, or None for stream ciphers
+    :return: The rate in messages per second
+    """
+    rate = messages / time_taken if time_taken > 0 else 0
+    with open(SMALL_MESSAGE_RESULTS_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([algorithm, operation, key_size, messages, time_taken, rate, backend, mode])
+    return rate
+
+def benchmark_small_messages(algorithm, cipher, key_size, messages):
+    """
+    Compare per-message encrypt/decrypt calls with encrypt_many/decrypt_many.
+    
+    :param algorithm: The name of the algorithm
+    :param cipher: An instance of one of the encryption classes
+    :param key_size: The size of the key
+    :param messages: The list of messages to process
+    """
+    count = len(messages)
+    enc_time, encrypted = measure_time(lambda: [cipher.encrypt(message) for message in messages])()
+    save_message_rate(algorithm, 'encryption', key_size, count, enc_time, cipher.backend, cipher.mode)
+    dec_time, _ = measure_time(lambda: [cipher.decrypt(*_decrypt_args(result)) for result in encrypted])()
+    save_message_rate(algorithm, 'decryption', key_size, count, dec_time, cipher.backend, cipher.mode)
+
+    enc_time, batch = measure_time(cipher.encrypt_many)(messages)
+    rate = save_message_rate(algorithm, 'batch_encryption', key_size, count, enc_time, cipher.backend, cipher.mode)
+    dec_time, _ = measure_time(cipher.decrypt_many)(*batch)
+    save_message_rate(algorithm, 'batch_decryption', key_size, count, dec_time, cipher.backend, cipher.mode)
+    print(f"{algorithm}-{key_size} {cipher.mode or ''} ({cipher.backend}): {rate:.0f} messages/s with encrypt_many")
+
+def benchmark_file(algorithm, cipher, key_size, file_name):
+    """
+    Time memory-mapped file encryption and decryption of a sample file and save the results.
+    
+    :param algorithm: The name of the algorithm
+    :param cipher: An instance of one of the encryption classes
+    :param key_size: The size of the key
+    :param file_name: The name of the file in DATA_DIR to encrypt
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        encrypted_path = os.path.join(work_dir, 'encrypted.bin')
+        decrypted_path = os.path.join(work_dir, 'decrypted.bin')
+
+        enc_time, _ = measure_time(cipher.encrypt_file)(os.path.join(DATA_DIR, file_name), encrypted_path)
+        rate = calculate_mb_rate(enc_time, file_name)
+        save_results(algorithm, 'file_encryption', key_size, file_name, enc_time, rate, cipher.backend, cipher.mode)
+
+        dec_time, _ = measure_time(cipher.decrypt_file)(encrypted_path, decrypted_path)
+        rate = calculate_mb_rate(dec_time, file_name)
+        save_results(algorithm, 'file_decryption', key_size, file_name, dec_time, rate, cipher.backend, cipher.mode)
+
+def benchmark_stream(algorithm, cipher, key_size, file_name, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Measure sustained streaming throughput for a sample file and save the results.
+    
+    The ciphertext is spooled to a temporary file and the plaintext is discarded,
+    so memory use stays at roughly one chunk regardless of the file size.
+    
+    :param algorithm: The name of the algorithm
+    :param cipher: An instance of one of the encryption classes
+    :param key_size: The size of the key
+    :param file_name: The name of the file in DATA_DIR to stream
+    :param chunk_size: Number of bytes to read per chunk
+    """
+    with open(os.path.join(DATA_DIR, file_name), 'rb') as reader, tempfile.TemporaryFile() as encrypted:
+        enc_time, params = measure_time(cipher.encrypt_stream)(reader, encrypted, chunk_size)
+        rate = calculate_mb_rate(enc_time, file_name)
+        save_results(algorithm, 'stream_encryption', key_size, file_name, enc_time, rate, cipher.backend, cipher.mode)
+
+        encrypted.seek(0)
+        with open(os.devnull, 'wb') as sink:
+            dec_time, _ = measure_time(cipher.decrypt_stream)(encrypted, sink, *_decrypt_args(params), chunk_size=chunk_size)
+        rate = calculate_mb_rate(dec_time, file_name)
+        save_results(algorithm, 'stream_decryption', key_size, file_name, dec_time, rate, cipher.backend, cipher.mode)
+
+def measure_phases(cipher, data, repeats=PHASE_REPEATS):
+    """
+    Time key generation, key schedule and bulk encryption as separate phases.
+    
+    Key generation draws a key of the cipher's length, the key schedule builds
+    a cipher object from the existing key and the bulk phase encrypts ``data``
+    with an already scheduled object, so no phase includes another.
+    
+    :param cipher: An instance of one of the encryption classes
+    :param data: The plaintext used for the bulk phase
+    :param repeats: Number of runs averaged for the two setup phases
+    :return: A dictionary with the time of each phase in seconds
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        get_random_bytes(len(cipher.key))
+    key_generation_time = (time.perf_counter() - start_time) / repeats
+
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        scheduled = cipher.key_schedule()
+        if isinstance(scheduled, _OpenSSLCipher):
+            scheduled._get_context(True)  # OpenSSL only expands the key once the context exists
+    key_schedule_time = (time.perf_counter() - start_time) / repeats
+
+    # CBC cipher objects only take whole blocks; ciphertext_size(0) is one block for them and 0 otherwise
+    block_size = cipher.ciphertext_size(0)
+    if block_size:
+        data = data[:len(data) - len(data) % block_size]
+    scheduled = cipher.key_schedule()
+    bulk_encrypt = scheduled.encrypt_and_digest if cipher.mode == 'SIV' else scheduled.encrypt
+    start_time = time.perf_counter()
+    bulk_encrypt(data)
+    bulk_time = time.perf_counter() - start_time
+
+    return {
+        'key_generation_time': key_generation_time,
+        'key_schedule_time': key_schedule_time,
+        'bulk_time': bulk_time,
+        'bulk_bytes': len(data),
+    }
+
+def measure_message_cost(cipher, sizes=COST_MESSAGE_SIZES, repeats=5):
+    """
+    Fit encrypt() time to ``fixed_cost + per_byte_cost * size`` by least squares.
+    
+    The fastest of ``repeats`` runs is used for each size to keep scheduler
+    noise out of the fit, and each point is weighted by its inverse squared
+    time so the small messages that determine the fixed cost are not swamped
+    by the large ones. The fixed cost covers everything paid once per message
+    (nonce, key schedule, tag), the per-byte cost the bulk processing.
+    
+    :param cipher: An instance of one of the encryption classes
+    :param sizes: Message sizes in bytes to time
+    :param repeats: Runs per size
+    :return: A dictionary with the fixed cost in seconds and the cost per byte in seconds
+    """
+    sizes = tuple(sizes)
+    if len(set(sizes)) < 2:
+        raise ValueError("At least two distinct message sizes are needed to fit the message cost")
+    points = []
+    for size in sizes:
+        message = bytes(size)
+        best = None
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            cipher.encrypt(message)
+            elapsed = time.perf_counter() - start_time
+            best = elapsed if best is None else min(best, elapsed)
+        points.append((size, best))
+
+    weights = [1 / elapsed ** 2 if elapsed > 0 else 1 for _, elapsed in points]
+    total_weight = sum(weights)
+    mean_size = sum(w * size for w, (size, _) in zip(weights, points)) / total_weight
+    mean_time = sum(w * elapsed for w, (_, elapsed) in zip(weights, points)) / total_weight
+    spread = sum(w * (size - mean_size) ** 2 for w, (size, _) in zip(weights, points))
+    per_byte_cost = sum(w * (size - mean_size) * (elapsed - mean_time)
+                        for w, (size, elapsed) in zip(weights, points)) / spread
+    return {
+        'fixed_cost': mean_time - per_byte_cost * mean_size,
+        'per_byte_cost': per_byte_cost,
+    }
+
+def save_phase_results(algorithm, cipher, key_size, phases, cost):
+    """
+    Save the phase timings and fitted message cost of a cipher to a CSV file.
+    
+    :param algorithm: The name of the algorithm
+    :param cipher: The instance that was measured
+    :param key_size: The size of the key
+    :param phases: The dictionary returned by measure_phases
+    :param cost: The dictionary returned by measure_message_cost
+    """
+    bulk_rate = phases['bulk_bytes'] / (1024 * 1024) / phases['bulk_time'] if phases['bulk_time'] > 0 else 0
+    with open(PHASE_RESULTS_PATH, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([algorithm, key_size, cipher.backend, cipher.mode, phases['key_generation_time'],
+                         phases['key_schedule_time'], phases['bulk_time'], bulk_rate,
+                         cost['fixed_cost'], cost['per_byte_cost']])
+
+def cipher_variants(cipher_class, key_sizes, raw):
+    """
+    Yield an instance for every key size, backend and (for AES) mode to benchmark.
+    
+    :param cipher_class: One of the encryption classes
+    :param key_sizes: The key sizes to benchmark
+    :param raw: Whether raw output is enabled
+    :return: A generator of (key_size, cipher) pairs
+    """
+    cipher_modes = AES_NONCE_SIZES if cipher_class is AESEncryption else (None,)
+    for key_size in key_sizes:
+        for mode in cipher_modes:
+            for backend in cipher_class.SUPPORTED_BACKENDS:
+                if mode is None:
+                    yield key_size, cipher_class(key_size, raw=raw, backend=backend)
+                elif backend != CRYPTOGRAPHY or mode in OPENSSL_AES_MODES:
+                    yield key_size, cipher_class(key_size, raw=raw, backend=backend, mode=mode)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the symmetric ciphers against the sample files.")
+    parser.add_argument('--base64', action='store_true',
+                        help="Include base64 encoding of the outputs in the timings instead of using raw bytes.")
+    parser.add_argument('--small-messages', action='store_true',
+                        help="Measure messages per second on the small samples instead of the file benchmarks.")
+    parser.add_argument('--messages', type=int, default=SMALL_MESSAGE_COUNT,
+                        help="Number of messages per run in the small-message benchmark.")
+    parser.add_argument('--phases', action='store_true',
+                        help="Time key generation, key schedule and bulk encryption separately and fit "
+                             "fixed and per-byte cost instead of running the file benchmarks.")
+    args = parser.parse_args()
+    raw = not args.base64
+
+    # Test data files
+    sample_files = [f for f in os.listdir(DATA_DIR) if f.endswith('.txt')]
+    key_sizes = {
+        'AES': [16, 24, 32],  # Correct key sizes for AES
+        'DES': [8],
+        '3DES': [16, 24],  # Correct key sizes for 3DES
+        'RC2': [5, 8, 16],
+        'RC4': [5, 8, 16],
+        'Blowfish': [4, 8, 16, 24, 32],  # Correct key sizes for Blowfish
+        'CAST-128': [5, 10, 16],
+        'Twofish': [16, 24, 32],
+        'ChaCha20': [32],
+        'ChaCha20-Poly1305': [32],
+        'Salsa20': [16, 32]
+    }
+    cipher_classes = {
+        'AES': AESEncryption,
+        'DES': DESEncryption,
+        '3DES': DES3Encryption,
+        'RC2': RC2Encryption,
+        'RC4': RC4Encryption,
+        'Blowfish': BlowfishEncryption
+    }
+    # Ciphers without a hand-written one-shot block below
+    modern_classes = {
+        'CAST-128': CAST128Encryption,
+        'ChaCha20': ChaCha20Encryption,
+        'ChaCha20-Poly1305': ChaCha20Poly1305Encryption,
+        'Salsa20': Salsa20Encryption
+    }
+    if Twofish is not None:
+        modern_classes['Twofish'] = TwofishEncryption
+    else:
+        print("twofish package not installed, skipping Twofish")
+    cipher_classes.update(modern_classes)
+
+    if args.small_messages:
+        with open(SMALL_MESSAGE_RESULTS_PATH, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'operation', 'key_size', 'messages', 'time_taken', 'messages_per_second', 'backend', 'mode'])
+        messages = load_small_messages(args.messages)
+        for algorithm, cipher_class in cipher_classes.items():
+            for key_size, cipher in cipher_variants(cipher_class, key_sizes[algorithm], raw):
+                try:
+                    benchmark_small_messages(algorithm, cipher, key_size, messages)
+                except Exception as e:
+                    print(f"Error during {algorithm} ({cipher.backend}) small-message run with key size {key_size}: {e}")
+        sys.exit(0)
+
+    if args.phases:
+        with open(PHASE_RESULTS_PATH, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'key_size', 'backend', 'mode', 'key_generation_time', 'key_schedule_time',
+                             'bulk_time', 'bulk_rate', 'fixed_cost', 'per_byte_cost'])
+        bulk_data = bytes(COST_MESSAGE_SIZES[-1])
+        for algorithm, cipher_class in cipher_classes.items():
+            for key_size, cipher in cipher_variants(cipher_class, key_sizes[algorithm], raw=True):
+                try:
+                    phases = measure_phases(cipher, bulk_data)
+                    cost = measure_message_cost(cipher)
+                    save_phase_results(algorithm, cipher, key_size, phases, cost)
+                    print(f"{algorithm}-{key_size} {cipher.mode or ''} ({cipher.backend}): "
+                          f"key schedule {phases['key_schedule_time'] * 1e6:.1f} us, "
+                          f"fixed {cost['fixed_cost'] * 1e6:.1f} us/message, "
+                          f"{cost['per_byte_cost'] * 1e9:.2f} ns/byte")
+                except Exception as e:
+                    print(f"Error during {algorithm} ({cipher.backend}) phase timing with key size {key_size}: {e}")
+        sys.exit(0)
+
+    # Initialize results file
+    with open(ANALYSIS_RESULTS_PATH, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['algorithm', 'operation', 'key_size', 'file_name', 'time_taken', 'rate', 'backend', 'mode'])
+
+    for file_name in sample_files:
+        with open(os.path.join(DATA_DIR, file_name), 'rb' if raw else 'r') as file:
+            data = file.read()
+
+        # AES Tests, one run per mode
+        for key_size, aes in cipher_variants(AESEncryption, key_sizes['AES'], raw):
+            try:
+                # Encryption
+                enc_time, (ciphertext, tag, nonce) = measure_time(aes.encrypt)(data)
+                rate = calculate_mb_rate(enc_time, file_name)
+                save_results('AES', 'encryption', key_size, file_name, enc_time, rate, aes.backend, aes.mode)
+                
+                # Decryption
+                dec_time, _ = measure_time(aes.decrypt)(ciphertext, tag, nonce)
+                rate = calculate_mb_rate(dec_time, file_name)
+                save_results('AES', 'decryption', key_size, file_name, dec_time, rate, aes.backend, aes.mode)
+            except Exception as e:
+                print(f"Error during AES-{aes.mode} ({aes.backend}) operation with key size {key_size} and file {file_name}: {e}")
+
+        # DES Tests
+        des = DESEncryption(raw=raw)
+        
+        try:
+            # Encryption
             enc_time, (ciphertext, iv) = measure_time(des.encrypt)(data)
             rate = calculate_mb_rate(enc_time, file_name)
-            save_results('DES', 'encryption', 8, file_name, enc_time, rate)
+            save_results('DES', 'encryption', 8, file_name, enc_time, rate, des.backend, des.mode)
             
             # Decryption
             dec_time, _ = measure_time(des.decrypt)(ciphertext, iv)
             rate = calculate_mb_rate(dec_time, file_name)
-            save_results('DES', 'decryption', 8, file_name, dec_time, rate)
+            save_results('DES', 'decryption', 8, file_name, dec_time, rate, des.backend, des.mode)
         except Exception as e:
             print(f"Error during DES operation with file {file_name}: {e}")
 
         # 3DES Tests
         for key_size in key_sizes['3DES']:
-            triple_des = DES3Encryption(key_size)
+            for backend in DES3Encryption.SUPPORTED_BACKENDS:
+                triple_des = DES3Encryption(key_size, raw=raw, backend=backend)
             
-            try:
-                # Encryption
-                enc_time, (ciphertext, iv) = measure_time(triple_des.encrypt)(data)
-                rate = calculate_mb_rate(enc_time, file_name)
-                save_results('3DES', 'encryption', key_size, file_name, enc_time, rate)
+                try:
+                    # Encryption
+                    enc_time, (ciphertext, iv) = measure_time(triple_des.encrypt)(data)
+                    rate = calculate_mb_rate(enc_time, file_name)
+                    save_results('3DES', 'encryption', key_size, file_name, enc_time, rate, triple_des.backend, triple_des.mode)
                 
-                # Decryption
-                dec_time, _ = measure_time(triple_des.decrypt)(ciphertext, iv)
-                rate = calculate_mb_rate(dec_time, file_name)
-                save_results('3DES', 'decryption', key_size, file_name, dec_time, rate)
-            except Exception as e:
-                print(f"Error during 3DES operation with key size {key_size} and file {file_name}: {e}")
+                    # Decryption
+                    dec_time, _ = measure_time(triple_des.decrypt)(ciphertext, iv)
+                    rate = calculate_mb_rate(dec_time, file_name)
+                    save_results('3DES', 'decryption', key_size, file_name, dec_time, rate, triple_des.backend, triple_des.mode)
+                except Exception as e:
+                    print(f"Error during 3DES ({backend}) operation with key size {key_size} and file {file_name}: {e}")
 
         # RC2 Tests
         for key_size in key_sizes['RC2']:
-            rc2 = RC2Encryption(key_size)
+            rc2 = RC2Encryption(key_size, raw=raw)
             
             try:
                 # Encryption
                 enc_time, (ciphertext, iv) = measure_time(rc2.encrypt)(data)
                 rate = calculate_mb_rate(enc_time, file_name)
-                save_results('RC2', 'encryption', key_size, file_name, enc_time, rate)
+                save_results('RC2', 'encryption', key_size, file_name, enc_time, rate, rc2.backend, rc2.mode)
                 
                 # Decryption
                 dec_time, _ = measure_time(rc2.decrypt)(ciphertext, iv)
                 rate = calculate_mb_rate(dec_time, file_name)
-                save_results('RC2', 'decryption', key_size, file_name, dec_time, rate)
+                save_results('RC2', 'decryption', key_size, file_name, dec_time, rate, rc2.backend, rc2.mode)
             except Exception as e:
                 print(f"Error during RC2 operation with key size {key_size} and file {file_name}: {e}")
 
         # RC4 Tests
         for key_size in key_sizes['RC4']:
-            rc4 = RC4Encryption(key_size)
+            rc4 = RC4Encryption(key_size, raw=raw)
             
             try:
                 # Encryption
                 enc_time, ciphertext = measure_time(rc4.encrypt)(data)
                 rate = calculate_mb_rate(enc_time, file_name)
-                save_results('RC4', 'encryption', key_size, file_name, enc_time, rate)
+                save_results('RC4', 'encryption', key_size, file_name, enc_time, rate, rc4.backend, rc4.mode)
                 
                 # Decryption
                 dec_time, _ = measure_time(rc4.decrypt)(ciphertext)
                 rate = calculate_mb_rate(dec_time, file_name)
-                save_results('RC4', 'decryption', key_size, file_name, dec_time, rate)
+                save_results('RC4', 'decryption', key_size, file_name, dec_time, rate, rc4.backend, rc4.mode)
             except Exception as e:
                 print(f"Error during RC4 operation with key size {key_size} and file {file_name}: {e}")
 
         # Blowfish Tests
         for key_size in key_sizes['Blowfish']:
-            blowfish = BlowfishEncryption(key_size)
+            for backend in BlowfishEncryption.SUPPORTED_BACKENDS:
+                blowfish = BlowfishEncryption(key_size, raw=raw, backend=backend)
             
-            try:
-                # Encryption
-                enc_time, (ciphertext, iv) = measure_time(blowfish.encrypt)(data)
-                rate = calculate_mb_rate(enc_time, file_name)
-                save_results('Blowfish', 'encryption', key_size, file_name, enc_time, rate)
+                try:
+                    # Encryption
+                    enc_time, (ciphertext, iv) = measure_time(blowfish.encrypt)(data)
+                    rate = calculate_mb_rate(enc_time, file_name)
+                    save_results('Blowfish', 'encryption', key_size, file_name, enc_time, rate, blowfish.backend, blowfish.mode)
                 
-                # Decryption
-                dec_time, _ = measure_time(blowfish.decrypt)(ciphertext, iv)
-                rate = calculate_mb_rate(dec_time, file_name)
-                save_results('Blowfish', 'decryption', key_size, file_name, dec_time, rate)
-            except Exception as e:
-                print(f"Error during Blowfish operation with key size {key_size} and file {file_name}: {e}")
+                    # Decryption
+                    dec_time, _ = measure_time(blowfish.decrypt)(ciphertext, iv)
+                    rate = calculate_mb_rate(dec_time, file_name)
+                    save_results('Blowfish', 'decryption', key_size, file_name, dec_time, rate, blowfish.backend, blowfish.mode)
+                except Exception as e:
+                    print(f"Error during Blowfish ({backend}) operation with key size {key_size} and file {file_name}: {e}")
+
+        # CAST-128, Twofish, ChaCha20, ChaCha20-Poly1305 and Salsa20 Tests
+        for algorithm, cipher_class in modern_classes.items():
+            for key_size, cipher in cipher_variants(cipher_class, key_sizes[algorithm], raw):
+                try:
+                    benchmark_oneshot(algorithm, cipher, key_size, file_name, data)
+                except Exception as e:
+                    print(f"Error during {algorithm} ({cipher.backend}) operation with key size {key_size} and file {file_name}: {e}")
+
+        # Preallocated buffer Tests
+        payload = data if isinstance(data, bytes) else data.encode('utf-8')
+        ciphertext_buffer = bytearray(len(payload) + 64)
+        plaintext_buffer = bytearray(len(payload) + 64)
+        for algorithm, cipher_class in cipher_classes.items():
+            for key_size, cipher in cipher_variants(cipher_class, key_sizes[algorithm], raw):
+                try:
+                    benchmark_into(algorithm, cipher, key_size, file_name, payload, ciphertext_buffer, plaintext_buffer)
+                except Exception as e:
+                    print(f"Error during {algorithm} ({cipher.backend}) buffer reuse with key size {key_size} and file {file_name}: {e}")
+
+        # Streaming Tests
+        for algorithm, cipher_class in cipher_classes.items():
+            for key_size, cipher in cipher_variants(cipher_class, key_sizes[algorithm], raw):
+                if cipher.mode == 'SIV':
+                    continue  # SIV is two-pass and cannot be streamed
+                try:
+                    benchmark_stream(algorithm, cipher, key_size, file_name)
+                except Exception as e:
+                    print(f"Error during {algorithm} ({cipher.backend}) streaming with key size {key_size} and file {file_name}: {e}")
+
+        # Memory-mapped file Tests
+        for algorithm, cipher_class in cipher_classes.items():
+            for key_size, cipher in cipher_variants(cipher_class, key_sizes[algorithm], raw):
+                try:
+                    benchmark_file(algorithm, cipher, key_size, file_name)
+                except Exception as e:
+                    print(f"Error during {algorithm} ({cipher.backend}) file encryption with key size {key_size} and file {file_name}: {e}")
 
         print(f"Completed analysis for {file_name}")
@@ -27,20 +27,40 @@ RC4,encryption,8,10mb_text_data_faker.txt,0.19018149375915527,52.581351646464306
 RC4,decryption,8,10mb_text_data_faker.txt,0.15112686157226562,66.16957366786986
 RC4,encryption,16,10mb_text_data_faker.txt,0.1499009132385254,66.71073433747395
 '''
+# Backend whose results the estimates use when an algorithm was benchmarked on several
+DEFAULT_BACKEND = 'pycryptodome'
+# Mode whose results the estimates use for algorithms benchmarked in several modes (AES)
+DEFAULT_MODE = 'GCM'
+
+def _algorithms_with(data, column, value):
+    """Return the upper-cased algorithms that have rows with the given column value."""
+    if column not in data:
+        return set()
+    return set(data.loc[data[column] == value, 'algorithm'].str.upper())
+
 class SymmetricTimeCalculator:
-    def __init__(self):
+    def __init__(self, results_path=None, mode=DEFAULT_MODE):
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.base_path = os.path.join(project_root, 'analysis', 'data', 'results')
-        self.sym_data = pd.read_csv(os.path.join(self.base_path, 'symmetric_analysis_results.csv'))
+        self.sym_data = pd.read_csv(results_path or os.path.join(self.base_path, 'symmetric_analysis_results.csv'))
+        self.mode = mode
         self.rates = self.get_rates()
 
     def get_rates(self):
         """Extract rates from CSV data for all operations."""
         rates = {}
         operations = ['encryption', 'decryption']
+        # The results hold a row per key size, mode and backend; estimates use the pycryptodome
+        # rows and, for algorithms benchmarked in several modes, the rows of self.mode
+        has_default = _algorithms_with(self.sym_data, 'backend', DEFAULT_BACKEND)
+        has_mode = _algorithms_with(self.sym_data, 'mode', self.mode)
         
         for _, row in self.sym_data.iterrows():
             alg = row['algorithm'].upper()
+            if alg in has_default and row.get('backend', DEFAULT_BACKEND) != DEFAULT_BACKEND:
+                continue
+            if alg in has_mode and row.get('mode') != self.mode:
+                continue
             op = row['operation']
             if op in operations:
                 if alg not in rates:
@@ -50,9 +70,8 @@ class SymmetricTimeCalculator:
 
     def calculate_time(self, algorithm, file_size_kb, operation='encryption'):
         """Calculate time using rate from CSV."""
+        # Rates are keyed by the upper-cased CSV algorithm name (e.g. BLOWFISH, CHACHA20-POLY1305)
         algorithm = algorithm.upper()
-        if algorithm == 'BLOWFISH':
-            algorithm = 'Blowfish'
             
         file_size_mb = file_size_kb / 1024
         rate = self.rates.get(algorithm, {}).get(operation, 0)
@@ -81,20 +100,36 @@ class SymmetricTimeCalculator:
             'decryption': self.calculate_time(algorithm, file_size_kb, 'decryption')
         }
 
+# Largest plaintext PKCS1_OAEP (SHA-1) encrypts directly with a 2048-bit key: 256 - 2 * 20 - 2
+RSA_OAEP_MAX_BYTES = 214
+# Operations used for signature (DSA, ECC, Ed25519, Ed448) and key exchange (DH, X25519, ECDH)
+# algorithms, which have no encryption or decryption rate
+OPERATION_FALLBACKS = {
+    'encryption': ('signing', 'key_exchange'),
+    'decryption': ('verification', 'key_exchange'),
+}
+
 class AsymmetricTimeCalculator:
-    def __init__(self):
+    def __init__(self, results_path=None):
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.base_path = os.path.join(project_root, 'analysis', 'data', 'results')
-        self.asym_data = pd.read_csv(os.path.join(self.base_path, 'asymmetric_analysis_results.csv'))
+        self.asym_data = pd.read_csv(results_path or os.path.join(self.base_path, 'asymmetric_analysis_results.csv'))
         self.rates = self.get_rates()
 
     def get_rates(self):
         """Extract rates from CSV data for all operations."""
         rates = {}
-        operations = ['encryption', 'decryption', 'signing', 'verification', 'key_exchange']
+        operations = ['encryption', 'decryption', 'signing', 'verification', 'key_exchange',
+                      'envelope_encryption', 'envelope_decryption']
+        # Algorithms benchmarked on several backends are estimated from their pycryptodome rows;
+        # the others (DH, X25519, ECDH) only have rows for the backend that implements them
+        has_default = _algorithms_with(self.asym_data, 'backend', DEFAULT_BACKEND)
         
         for _, row in self.asym_data.iterrows():
             alg = row['algorithm'].upper()
+            backend = row.get('backend', DEFAULT_BACKEND)
+            if alg in has_default and backend != DEFAULT_BACKEND:
+                continue
             op = row['operation']
             if op in operations:
                 if alg not in rates:
@@ -110,6 +145,13 @@ class AsymmetricTimeCalculator:
             
         file_size_bytes = file_size_kb * 1024  # Convert KB to bytes
         rate = self.rates.get(algorithm, {}).get(operation, 0)
+        for fallback in OPERATION_FALLBACKS.get(operation, ()):
+            if rate:
+                break
+            rate = self.rates.get(algorithm, {}).get(fallback, 0)
+        # Files too large for RSA-OAEP alone are encrypted with an RSA-wrapped AES-GCM key
+        if operation in ('encryption', 'decryption') and file_size_bytes > RSA_OAEP_MAX_BYTES:
+            rate = self.rates.get(algorithm, {}).get('envelope_' + operation, rate)
         estimated_time = file_size_bytes / rate if rate > 0 else 0
         
         return {
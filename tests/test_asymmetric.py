@@ -1,11 +1,33 @@
 import unittest
-from src.asymmetric import RSAEncryption, DSAEncryption, DHEncryption, ECCEncryption
+import os
+import shutil
+import tempfile
+from unittest import mock
+from concurrent.futures import Future
+from src.asymmetric import (RSAEncryption, DSAEncryption, DHEncryption, ECCEncryption, EdDSAEncryption,
+                            X25519Encryption, ECDHEncryption, KeyStore, KeyPool, ParsedKeyCache, KEY_FORMATS,
+                            load_dh_parameters, export_key, import_key, measure_handshakes, measure_signing,
+                            deterministic_signing_supported)
 
 class TestAsymmetricEncryption(unittest.TestCase):
     """
     Test cases for asymmetric encryption and decryption classes.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create a temporary key store so the tests do not write to analysis/data/keys.
+        """
+        cls.key_store = KeyStore(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Remove the temporary key store.
+        """
+        shutil.rmtree(cls.key_store.directory)
+
     def setUp(self):
         """
         Set up a common plaintext message for all tests.
@@ -16,40 +38,302 @@ class TestAsymmetricEncryption(unittest.TestCase):
         """
         Test RSA encryption and decryption.
         """
-        rsa = RSAEncryption()
+        rsa = RSAEncryption(key_store=self.key_store)
         ciphertext = rsa.encrypt(self.plaintext)
         decrypted_text = rsa.decrypt(ciphertext)
         self.assertEqual(self.plaintext, decrypted_text)
 
+    def test_rsa_envelope_encryption(self):
+        """
+        Test RSA envelope encryption of a message too large for RSA-OAEP alone.
+        """
+        rsa = RSAEncryption(key_store=self.key_store)
+        plaintext = self.plaintext * 1000
+        wrapped_key, ciphertext, tag, nonce = rsa.encrypt_envelope(plaintext)
+        self.assertEqual(plaintext, rsa.decrypt_envelope(wrapped_key, ciphertext, tag, nonce))
+        with self.assertRaises(ValueError):
+            rsa.decrypt_envelope(wrapped_key, ciphertext, bytes(16), nonce)
+
     def test_dsa_signing(self):
         """
         Test DSA signing and verification.
         """
-        dsa = DSAEncryption()
+        dsa = DSAEncryption(key_store=self.key_store)
         signature = dsa.sign(self.plaintext)
         is_valid = dsa.verify(self.plaintext, signature)
         self.assertTrue(is_valid)
 
+    def test_key_pool(self):
+        """
+        Test taking pre-generated keys from the key pool and its metrics.
+        """
+        with KeyPool([('ECC', 'P-256')], depth=2, processes=1) as pool:
+            ecc = ECCEncryption(key_pool=pool)
+            other = ECCEncryption(key_pool=pool)
+            self.assertNotEqual(ecc.key, other.key)
+            self.assertTrue(ecc.verify(self.plaintext, ecc.sign(self.plaintext)))
+            metrics = pool.metrics()[('ECC', 'P-256')]
+            self.assertEqual(2, metrics['taken'])
+            self.assertGreaterEqual(metrics['generated'], 2)
+            self.assertIn('refill_rate', metrics)
+            self.assertIn('queue_depth', metrics)
+            with self.assertRaises(ValueError):
+                pool.take('RSA', 2048)
+
+    def test_key_pool_failures(self):
+        """
+        Test that a failed generation job is raised from take() and that a job finished on submit does not deadlock.
+        """
+        with KeyPool([('RSA', 512)], depth=1, processes=1) as pool:
+            with self.assertRaisesRegex(ValueError, 'modulus'):
+                pool.take('RSA', 512, timeout=30)
+            self.assertEqual(1, pool.metrics()[('RSA', 512)]['failed'])
+
+        class DoneExecutor:
+            def submit(self, function, *args):
+                future = Future()
+                future.set_result(function(*args))
+                return future
+
+        with KeyPool([('ECC', 'P-256')], depth=1, processes=1) as pool:
+            pool.take('ECC', 'P-256', timeout=30)
+            pool.executor, executor = DoneExecutor(), pool.executor
+            ecc = ECCEncryption(key_pool=pool)
+            self.assertTrue(ecc.verify(self.plaintext, ecc.sign(self.plaintext)))
+            pool.executor = executor
+
     def test_dh_key_exchange(self):
         """
         Test Diffie-Hellman key exchange.
-        
+        """
         dh1 = DHEncryption()
         dh2 = DHEncryption()
         shared_key1 = dh1.generate_shared_key(dh2.public_key)
         shared_key2 = dh2.generate_shared_key(dh1.public_key)
         self.assertEqual(shared_key1, shared_key2)
+
+    def test_dh_parameters(self):
+        """
+        Test the named DH groups and the generated parameter cache.
         """
-        pass
+        for group in ('ffdhe', 'modp'):
+            for key_size in (2048, 3072, 4096):
+                numbers = load_dh_parameters(key_size, group).parameter_numbers()
+                self.assertEqual(key_size, numbers.p.bit_length())
+                self.assertEqual(2, numbers.g)
+        with self.assertRaises(ValueError):
+            load_dh_parameters(1024, 'ffdhe')
+        with tempfile.TemporaryDirectory() as directory, tempfile.TemporaryDirectory() as other:
+            load_dh_parameters(512, 'generated', directory)
+            self.assertTrue(os.path.exists(os.path.join(directory, 'dh_512.pem')))
+            load_dh_parameters(512, 'generated', other)
+            self.assertTrue(os.path.exists(os.path.join(other, 'dh_512.pem')))
 
     def test_ecc_signing(self):
         """
         Test ECC signing and verification.
         """
-        ecc = ECCEncryption()
+        ecc = ECCEncryption(key_store=self.key_store)
         signature = ecc.sign(self.plaintext)
         is_valid = ecc.verify(self.plaintext, signature)
         self.assertTrue(is_valid)
 
+    def test_prepared_context(self):
+        """
+        Test that the prepared context reuses one public key and rejects bad signatures.
+        """
+        for signer in (RSAEncryption(key_store=self.key_store), DSAEncryption(key_store=self.key_store),
+                       ECCEncryption(key_store=self.key_store)):
+            self.assertEqual(signer.key.public_key(), signer.context.public_key)
+            signature = signer.sign(self.plaintext)
+            self.assertTrue(signer.verify(self.plaintext, signature))
+            self.assertTrue(signer.verify(self.plaintext, signature))
+            self.assertFalse(signer.verify(self.plaintext + ".", signature))
+
+    def test_verify_many(self):
+        """
+        Test batch verification on the calling thread and across worker processes.
+        """
+        for signer in (RSAEncryption(key_store=self.key_store), DSAEncryption(key_store=self.key_store),
+                       ECCEncryption(key_store=self.key_store)):
+            messages = [f"{self.plaintext} {i}" for i in range(10)]
+            pairs = [(message, signer.sign(message)) for message in messages]
+            pairs[3] = (messages[4], pairs[3][1])
+            expected = [1, 1, 1, 0, 1, 1, 1, 1, 1, 1]
+            self.assertEqual(expected, list(signer.verify_many(pairs, workers=1)))
+            self.assertEqual(expected, list(signer.verify_many(pairs, workers=2, chunk_size=3)))
+
+    def test_key_store(self):
+        """
+        Test that stored keys are reused per seed, fresh keys are not, and key files are private.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            store = KeyStore(directory)
+            first = ECCEncryption(key_store=store)
+            self.assertEqual(first.key, ECCEncryption(key_store=store).key)
+            self.assertNotEqual(first.key, ECCEncryption(seed=1, key_store=store).key)
+            self.assertNotEqual(first.key, ECCEncryption(fresh=True, key_store=store).key)
+            self.assertEqual(first.key, KeyStore(directory).load('ECC', 'P-256'))
+            self.assertEqual(0o600, os.stat(store.path('ECC', 'P-256')).st_mode & 0o777)
+
+    def test_key_serialization(self):
+        """
+        Test that every key format round-trips and that the parsed-key cache counts hits and evicts.
+        """
+        store = self.key_store
+        keys = {'RSA': RSAEncryption(key_store=store).key, 'DSA': DSAEncryption(key_store=store).key,
+                'ECC': ECCEncryption(key_store=store).key,
+                'DH': load_dh_parameters(2048).generate_private_key()}
+        key_sizes = {'RSA': 2048, 'DSA': 2048, 'ECC': 'P-256', 'DH': 2048}
+        for algorithm, key in keys.items():
+            for key_format in KEY_FORMATS[algorithm]:
+                encoded = export_key(algorithm, key, key_format)
+                parsed = import_key(algorithm, encoded, key_format, key_sizes[algorithm])
+                if key_format != 'raw':
+                    self.assertEqual(encoded, export_key(algorithm, parsed, key_format))
+                elif algorithm == 'ECC':
+                    self.assertEqual(encoded, parsed.export_key(format='raw'))
+                else:
+                    self.assertEqual(key.public_key().public_numbers().y, parsed.public_numbers().y)
+        with self.assertRaises(ValueError):
+            export_key('RSA', keys['RSA'], 'raw')
+
+        cache = ParsedKeyCache(capacity=1)
+        rsa_pem, ecc_pem = export_key('RSA', keys['RSA'], 'PEM'), export_key('ECC', keys['ECC'], 'PEM')
+        self.assertIs(cache.load('RSA', rsa_pem), cache.load('RSA', rsa_pem))
+        cache.load('ECC', ecc_pem)
+        cache.load('RSA', rsa_pem)
+        self.assertEqual({'hits': 1, 'misses': 3, 'hit_rate': 0.25, 'size': 1}, cache.metrics())
+        with tempfile.TemporaryDirectory() as directory:
+            store = KeyStore(directory, cache=ParsedKeyCache())
+            generated = store.load('ECC', 'P-256')
+            self.assertEqual(generated, store.load('ECC', 'P-256'))
+            self.assertIs(store.load('ECC', 'P-256'), store.load('ECC', 'P-256'))
+            self.assertEqual(2, store.cache.metrics()['hits'])
+
+    def test_file_signing(self):
+        """
+        Test signing and verifying a file in chunks and through a memory map.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'message.txt')
+            with open(path, 'w') as file:
+                file.write(self.plaintext * 100)
+            store = self.key_store
+            for signer in (RSAEncryption(key_store=store), DSAEncryption(key_store=store),
+                           ECCEncryption(key_store=store), EdDSAEncryption('Ed25519', key_store=store),
+                           EdDSAEncryption('Ed448', key_store=store)):
+                signature = signer.sign_file(path, chunk_size=100)
+                self.assertTrue(signer.verify_file(path, signature, use_mmap=True))
+                self.assertFalse(signer.verify_file(path, signature[::-1]))
+            rsa = RSAEncryption(key_store=self.key_store)
+            self.assertTrue(rsa.verify(self.plaintext * 100, rsa.sign_file(path)))
+
+    def test_eddsa_signing(self):
+        """
+        Test Ed25519 and Ed448 signing and verification.
+        """
+        for curve in ('Ed25519', 'Ed448'):
+            signer = EdDSAEncryption(curve, key_store=self.key_store)
+            signature = signer.sign(self.plaintext)
+            self.assertTrue(signer.verify(self.plaintext, signature))
+            self.assertFalse(signer.verify(self.plaintext + ".", signature))
+            self.assertEqual([1, 0], list(signer.verify_many([(self.plaintext, signature), ("", signature)])))
+
+    def test_elliptic_curve_key_exchange(self):
+        """
+        Test X25519 and ECDH key exchange.
+        """
+        for first, second in ((X25519Encryption(), X25519Encryption()),
+                              (ECDHEncryption('P-384'), ECDHEncryption('P-384'))):
+            self.assertEqual(first.generate_shared_key(second.public_key),
+                             second.generate_shared_key(first.public_key))
+            first.run()
+            self.assertGreater(first.execution_time, 0)
+
+    def test_handshake_throughput(self):
+        """
+        Test the ephemeral handshake throughput measurement on one and two workers.
+        """
+        for algorithm, key_size in (('DH', 2048), ('X25519', None), ('ECDH', 'P-256')):
+            for workers in (1, 2):
+                result = measure_handshakes(algorithm, key_size, count=5, workers=workers)
+                self.assertEqual(5, result['handshakes'])
+                self.assertGreater(result['handshakes_per_second'], 0)
+                self.assertLessEqual(result['p50'], result['p99'])
+        dh1 = DHEncryption()
+        self.assertEqual(32, len(dh1.handshake(DHEncryption().public_key)))
+
+    def test_openssl_backend(self):
+        """
+        Test that signatures made by either backend verify on the other and that RSA encrypts under OpenSSL.
+        """
+        for signer_class in (RSAEncryption, DSAEncryption, ECCEncryption):
+            pycryptodome = signer_class(key_store=self.key_store)
+            openssl = signer_class(backend='cryptography', key_store=self.key_store)
+            self.assertTrue(pycryptodome.verify(self.plaintext, openssl.sign(self.plaintext)))
+            self.assertTrue(openssl.verify(self.plaintext, pycryptodome.sign(self.plaintext)))
+            self.assertFalse(openssl.verify(self.plaintext + ".", openssl.sign(self.plaintext)))
+        rsa = RSAEncryption(backend='cryptography', key_store=self.key_store)
+        self.assertEqual(self.plaintext, rsa.decrypt(rsa.encrypt(self.plaintext)))
+        self.assertEqual(self.plaintext, rsa.decrypt_envelope(*rsa.encrypt_envelope(self.plaintext)))
+        with self.assertRaises(ValueError):
+            EdDSAEncryption('Ed25519', backend='cryptography', key_store=self.key_store)
+        with self.assertRaises(ValueError):
+            RSAEncryption(backend='openssl', key_store=self.key_store)
+
+    def test_rsa_paddings(self):
+        """
+        Test every RSA encryption padding and signature scheme on both backends.
+        """
+        for rsa_padding in ('oaep-sha1', 'oaep-sha256', 'oaep-sha256-mgf1-sha1', 'pkcs1v15'):
+            pycryptodome = RSAEncryption(rsa_padding=rsa_padding, key_store=self.key_store)
+            openssl = RSAEncryption(backend='cryptography', rsa_padding=rsa_padding, key_store=self.key_store)
+            self.assertEqual(self.plaintext, openssl.decrypt(pycryptodome.encrypt(self.plaintext)))
+            self.assertEqual(self.plaintext, pycryptodome.decrypt(openssl.encrypt(self.plaintext)))
+            for rsa in (pycryptodome, openssl):
+                rsa.encrypt(b'x' * rsa.max_message_size)
+                with self.assertRaises(ValueError):
+                    rsa.encrypt(b'x' * (rsa.max_message_size + 1))
+        self.assertEqual(190, RSAEncryption(rsa_padding='oaep-sha256', key_store=self.key_store).max_message_size)
+        for salt_length in (None, 0, 64):
+            pycryptodome = RSAEncryption(signature_scheme='pss', salt_length=salt_length, key_store=self.key_store)
+            openssl = RSAEncryption(backend='cryptography', signature_scheme='pss', salt_length=salt_length,
+                                    key_store=self.key_store)
+            self.assertTrue(openssl.verify(self.plaintext, pycryptodome.sign(self.plaintext)))
+            self.assertTrue(pycryptodome.verify(self.plaintext, openssl.sign(self.plaintext)))
+            pkcs1 = RSAEncryption(key_store=self.key_store)
+            self.assertFalse(pycryptodome.verify(self.plaintext, pkcs1.sign(self.plaintext)))
+            self.assertEqual([1, 0], list(pycryptodome.verify_many([(self.plaintext, openssl.sign(self.plaintext)),
+                                                                   ("", openssl.sign(self.plaintext))])))
+        with self.assertRaises(ValueError):
+            RSAEncryption(rsa_padding='oaep-md5', key_store=self.key_store)
+        with self.assertRaises(ValueError):
+            RSAEncryption(signature_scheme='x931', key_store=self.key_store)
+
+    def test_deterministic_signing(self):
+        """
+        Test that RFC 6979 signatures repeat, match across backends and verify like random-nonce ones.
+        """
+        for signer in (DSAEncryption(deterministic=True, key_store=self.key_store),
+                       ECCEncryption(deterministic=True, key_store=self.key_store)):
+            signature = signer.sign(self.plaintext)
+            self.assertEqual(signature, signer.sign(self.plaintext))
+            self.assertTrue(type(signer)(key_store=self.key_store).verify(self.plaintext, signature))
+        ecc = ECCEncryption(deterministic=True, key_store=self.key_store)
+        if deterministic_signing_supported('ECC', 'cryptography'):
+            openssl = ECCEncryption(backend='cryptography', deterministic=True, key_store=self.key_store)
+            self.assertEqual(ecc.sign(self.plaintext), openssl.sign(self.plaintext))
+        with mock.patch('src.asymmetric.deterministic_signing_supported', return_value=False):
+            with self.assertRaises(ValueError):
+                ECCEncryption(backend='cryptography', deterministic=True, key_store=self.key_store)
+        randomized = ECCEncryption(key_store=self.key_store)
+        self.assertNotEqual(randomized.sign(self.plaintext), randomized.sign(self.plaintext))
+        with self.assertRaises(ValueError):
+            DSAEncryption(backend='cryptography', deterministic=True, key_store=self.key_store)
+        result = measure_signing(ecc, self.plaintext, count=5, rng_processes=1)
+        self.assertEqual(5, result['signatures'])
+        self.assertLessEqual(result['p50'], result['p99'])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
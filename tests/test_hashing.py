@@ -2,7 +2,9 @@ import unittest
 import os
 import time
 import csv
-from src.hashing import SHA1Hash, SHA2Hash, MD5Hash, HMACHash
+import tempfile
+import io
+from src.hashing import SHA1Hash, SHA2Hash, SHA3Hash, SHAKEHash, MD5Hash, HMACHash, MultiDigest
 
 class TestHashingAlgorithms(unittest.TestCase):
     """
@@ -120,5 +122,42 @@ class TestHashingAlgorithms(unittest.TestCase):
             print(f"HMAC: {file_name} - Time taken: {time_taken:.6f} seconds")
             self.assertIsNotNone(hmac.hash(data))
 
+    def test_hash_file(self):
+        """
+        Test that hashing a file in chunks, through a memory map or as a stream matches hashing its contents.
+        """
+        data = b"Hashing a file in chunks." * 100
+        with tempfile.TemporaryDirectory() as work_dir:
+            file_path = os.path.join(work_dir, 'sample.txt')
+            with open(file_path, 'wb') as file:
+                file.write(data)
+            for hasher in (SHA1Hash(), SHA2Hash('SHA-512'), SHA3Hash('SHA3-256'),
+                           SHAKEHash('SHAKE256', 64), MD5Hash(), HMACHash()):
+                expected = hasher.hash(data)
+                self.assertEqual(expected, hasher.hash_file(file_path))
+                self.assertEqual(expected, hasher.hash_file(file_path, chunk_size=7))
+                self.assertEqual(expected, hasher.hash_file(file_path, use_mmap=True))
+                with open(file_path, 'rb') as file:
+                    self.assertEqual(expected, hasher.hash_stream(file, chunk_size=100))
+                self.assertEqual(hasher.hash(b''), hasher.hash_stream(io.BytesIO()))
+
+    def test_multi_digest(self):
+        """
+        Test that the single-pass engine produces the same digests as each hasher alone.
+        """
+        data = b"Hashing with every algorithm at once." * 1000
+        hashers = {'SHA-256': SHA2Hash('SHA-256'), 'SHA3-256': SHA3Hash('SHA3-256'), 'MD5': MD5Hash(),
+                   'SHAKE256': SHAKEHash('SHAKE256', 64), 'HMAC': HMACHash()}
+        expected = {name: hasher.hash(data) for name, hasher in hashers.items()}
+        engine = MultiDigest(hashers, workers=2)
+        self.assertEqual(expected, engine.hash(data))
+        with tempfile.TemporaryDirectory() as work_dir:
+            file_path = os.path.join(work_dir, 'sample.txt')
+            with open(file_path, 'wb') as file:
+                file.write(data)
+            self.assertEqual(expected, engine.hash_file(file_path, chunk_size=1000))
+            self.assertEqual(expected, engine.hash_file(file_path, chunk_size=4096))
+        self.assertEqual({name: hasher.hash(b'') for name, hasher in hashers.items()}, engine.hash(b''))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -22,6 +22,7 @@ class TestPerformanceAnalysis(unittest.TestCase):
         algo = AESEncryption
         averages = self.analyzer.analyze_algorithm("AESEncryption", algo, self.test_data, key_size)
         self.assertIsInstance(averages, dict)
+        self.assertIn("avg_setup_time", averages)
         self.assertIn("avg_time", averages)
         self.assertIn("avg_cpu", averages)
         self.assertIn("avg_ram", averages)
@@ -43,5 +44,12 @@ class TestPerformanceAnalysis(unittest.TestCase):
         self.assertIn("avg_cpu", averages)
         self.assertIn("avg_ram", averages)
 
+    def test_segmented_scaling(self):
+        results = self.analyzer.analyze_segmented_scaling(self.test_data * 100, max_workers=2, segment_size=1024, iterations=1)
+        self.assertEqual([1, 2], [result["workers"] for result in results])
+        for result in results:
+            self.assertIn("encrypt_mb_per_s", result)
+            self.assertIn("speedup", result)
+
 if __name__ == "__main__":
     unittest.main()
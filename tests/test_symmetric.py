@@ -1,5 +1,14 @@
+import base64
+import io
+import os
+import tempfile
+import mmap
 import unittest
-from src.symmetric import AESEncryption, DESEncryption, DES3Encryption, RC2Encryption, RC4Encryption, BlowfishEncryption
+from unittest import mock
+from src.symmetric import (AESEncryption, DESEncryption, DES3Encryption, RC2Encryption, RC4Encryption, BlowfishEncryption,
+                           CAST128Encryption, TwofishEncryption, ChaCha20Encryption, ChaCha20Poly1305Encryption,
+                           Salsa20Encryption, Twofish, CRYPTOGRAPHY, AES_NONCE_SIZES, AEAD_MODES,
+                           measure_phases, measure_message_cost)
 
 class TestSymmetricEncryption(unittest.TestCase):
     """
@@ -67,5 +76,296 @@ class TestSymmetricEncryption(unittest.TestCase):
         decrypted_text = blowfish.decrypt(ciphertext)
         self.assertEqual(self.plaintext, decrypted_text)
 
+    def test_aes_stream(self):
+        """
+        Test AES streaming encryption and decryption across several chunks.
+        """
+        aes = AESEncryption()
+        data = self.plaintext_bytes * 1000
+        encrypted = io.BytesIO()
+        tag, nonce = aes.encrypt_stream(io.BytesIO(data), encrypted, chunk_size=1000)
+        decrypted = io.BytesIO()
+        aes.decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, tag, nonce, chunk_size=1000)
+        self.assertEqual(data, decrypted.getvalue())
+
+    def test_block_cipher_stream(self):
+        """
+        Test streaming with the CBC ciphers, including block aligned input.
+        """
+        for cipher_class in (DESEncryption, DES3Encryption, RC2Encryption, BlowfishEncryption):
+            for size in (0, 8, 23, 4096):
+                with self.subTest(cipher=cipher_class.__name__, size=size):
+                    cipher = cipher_class()
+                    data = bytes(range(256)) * 16
+                    data = data[:size]
+                    encrypted = io.BytesIO()
+                    iv = cipher.encrypt_stream(io.BytesIO(data), encrypted, chunk_size=13)
+                    decrypted = io.BytesIO()
+                    cipher.decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, iv, chunk_size=13)
+                    self.assertEqual(data, decrypted.getvalue())
+
+    def test_rc4_stream(self):
+        """
+        Test RC4 streaming matches one-shot encryption.
+        """
+        rc4 = RC4Encryption()
+        encrypted = io.BytesIO()
+        rc4.encrypt_stream(io.BytesIO(self.plaintext_bytes), encrypted, chunk_size=5)
+        self.assertEqual(rc4.encrypt(self.plaintext), base64.b64encode(encrypted.getvalue()).decode('utf-8'))
+        decrypted = io.BytesIO()
+        rc4.decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, chunk_size=5)
+        self.assertEqual(self.plaintext_bytes, decrypted.getvalue())
+
+    def test_raw_output(self):
+        """
+        Test that raw mode returns bytes and accepts memoryviews for decryption.
+        """
+        aes = AESEncryption(raw=True)
+        ciphertext, tag, nonce = aes.encrypt(self.plaintext_bytes)
+        self.assertIsInstance(ciphertext, bytes)
+        self.assertEqual(len(self.plaintext_bytes), len(ciphertext))
+        self.assertEqual(self.plaintext_bytes, aes.decrypt(memoryview(ciphertext), tag, nonce))
+
+        blowfish = BlowfishEncryption(raw=True)
+        ciphertext, iv = blowfish.encrypt(self.plaintext_bytes)
+        self.assertEqual(self.plaintext_bytes, blowfish.decrypt(ciphertext, iv))
+
+        rc4 = RC4Encryption(raw=True)
+        self.assertEqual(self.plaintext_bytes, rc4.decrypt(rc4.encrypt(self.plaintext_bytes)))
+
+    def test_encrypt_into_reuses_buffers(self):
+        """
+        Test encrypt_into/decrypt_into with the same buffers for every cipher.
+        """
+        ciphertext_buffer = bytearray(64)
+        plaintext_buffer = bytearray(64)
+        for cipher in (AESEncryption(raw=True), DESEncryption(raw=True), DES3Encryption(raw=True),
+                       RC2Encryption(raw=True), RC4Encryption(raw=True), BlowfishEncryption(raw=True)):
+            with self.subTest(cipher=type(cipher).__name__):
+                result = cipher.encrypt_into(self.plaintext_bytes, ciphertext_buffer)
+                length, params = (result[0], result[1:]) if isinstance(result, tuple) else (result, ())
+                self.assertEqual(cipher.ciphertext_size(len(self.plaintext_bytes)), length)
+                ciphertext = bytes(ciphertext_buffer[:length])
+                written = cipher.decrypt_into(ciphertext, plaintext_buffer, *params)
+                self.assertEqual(self.plaintext_bytes, plaintext_buffer[:written])
+
+    def test_encrypt_into_small_buffer(self):
+        """
+        Test that a CBC cipher rejects an output buffer without room for padding.
+        """
+        des = DESEncryption()
+        with self.assertRaises(ValueError):
+            des.encrypt_into(b'12345678', bytearray(8))
+
+    def test_encrypt_many(self):
+        """
+        Test batch encryption and decryption round trips for every cipher.
+        """
+        messages = [self.plaintext, '', 'x' * 300, self.plaintext * 3]
+        for cipher in (AESEncryption(), DESEncryption(), DES3Encryption(),
+                       RC2Encryption(), RC4Encryption(), BlowfishEncryption()):
+            with self.subTest(cipher=type(cipher).__name__):
+                batch = cipher.encrypt_many(messages)
+                self.assertEqual(len(messages), len(batch[1]))
+                self.assertEqual(messages, cipher.decrypt_many(*batch))
+                if len(batch) > 2:
+                    # Every batch gets its own IV or nonce
+                    self.assertNotEqual(batch[-1], cipher.encrypt_many(messages)[-1])
+
+    def test_encrypt_many_authenticates_offsets(self):
+        """
+        Test that AES rejects a batch whose message boundaries were altered.
+        """
+        aes = AESEncryption(raw=True)
+        ciphertext, offsets, tag, nonce = aes.encrypt_many([b'first', b'second'])
+        self.assertEqual([b'first', b'second'], aes.decrypt_many(ciphertext, [5, 11], tag, nonce))
+        offsets[0] += 1
+        with self.assertRaises(ValueError):
+            aes.decrypt_many(ciphertext, offsets, tag, nonce)
+
+    def test_segmented_encryption(self):
+        """
+        Test segmented AES-GCM round trips and rejects reordered segments.
+        """
+        aes = AESEncryption(raw=True)
+        data = bytes(range(256)) * 40
+        ciphertext, tags, nonce, commitment = aes.encrypt_segmented(data, segment_size=1000, workers=3)
+        self.assertEqual(11 * 16, len(tags))
+        self.assertEqual(data, aes.decrypt_segmented(ciphertext, tags, nonce, commitment, segment_size=1000, workers=3))
+
+        swapped = bytes(ciphertext[1000:2000] + ciphertext[:1000] + ciphertext[2000:])
+        swapped_tags = tags[16:32] + tags[:16] + tags[32:]
+        with self.assertRaises(ValueError):
+            aes.decrypt_segmented(swapped, swapped_tags, nonce, commitment, segment_size=1000)
+
+    def test_file_encryption(self):
+        """
+        Test memory-mapped file encryption and decryption, including empty files.
+        """
+        with tempfile.TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir, 'plain.txt')
+            encrypted = os.path.join(work_dir, 'encrypted.bin')
+            decrypted = os.path.join(work_dir, 'decrypted.txt')
+            for data in (b'', self.plaintext_bytes * 50):
+                with open(source, 'wb') as file:
+                    file.write(data)
+                for cipher in (AESEncryption(), DES3Encryption(), RC4Encryption(), BlowfishEncryption()):
+                    with self.subTest(cipher=type(cipher).__name__, size=len(data)):
+                        size = cipher.encrypt_file(source, encrypted)
+                        self.assertEqual(os.path.getsize(encrypted), size)
+                        self.assertEqual(len(data), cipher.decrypt_file(encrypted, decrypted))
+                        with open(decrypted, 'rb') as file:
+                            self.assertEqual(data, file.read())
+
+    def test_file_tampering(self):
+        """
+        Test a tampered file is rejected, its output removed and both memory maps closed.
+        """
+        maps = []
+        new_map = mmap.mmap
+        def record(*args, **kwargs):
+            maps.append(new_map(*args, **kwargs))
+            return maps[-1]
+        with tempfile.TemporaryDirectory() as work_dir:
+            source = os.path.join(work_dir, 'plain.txt')
+            encrypted = os.path.join(work_dir, 'encrypted.bin')
+            decrypted = os.path.join(work_dir, 'decrypted.txt')
+            with open(source, 'wb') as file:
+                file.write(self.plaintext_bytes * 50)
+            for cipher in (AESEncryption(), AESEncryption(mode='SIV'), DES3Encryption(), ChaCha20Poly1305Encryption()):
+                with self.subTest(cipher=type(cipher).__name__):
+                    cipher.encrypt_file(source, encrypted)
+                    with open(encrypted, 'r+b') as file:
+                        file.seek(-1, os.SEEK_END)
+                        last = file.read(1)[0]
+                        file.seek(-1, os.SEEK_END)
+                        file.write(bytes([last ^ 1]))
+                    maps.clear()
+                    with mock.patch('src.symmetric.mmap.mmap', side_effect=record):
+                        with self.assertRaises(ValueError):
+                            cipher.decrypt_file(encrypted, decrypted)
+                    self.assertFalse(os.path.exists(decrypted))
+                    self.assertEqual(2, len(maps))
+                    self.assertTrue(all(mapped.closed for mapped in maps))
+
+    def test_cryptography_backend(self):
+        """
+        Test the cryptography backend round trips and interoperates with pycryptodome.
+        """
+        data = self.plaintext_bytes * 50
+        for cipher_class in (AESEncryption, DES3Encryption, BlowfishEncryption):
+            with self.subTest(cipher=cipher_class.__name__):
+                default = cipher_class(raw=True)
+                openssl = cipher_class(raw=True, backend=CRYPTOGRAPHY)
+                openssl.key = default.key
+                result = openssl.encrypt(data)
+                self.assertEqual(data, default.decrypt(*result))
+                result = default.encrypt(data)
+                self.assertEqual(data, openssl.decrypt(*result))
+
+                ciphertext_buffer = bytearray(openssl.ciphertext_size(len(data)))
+                length, *params = openssl.encrypt_into(data, ciphertext_buffer)
+                plaintext_buffer = bytearray(length)
+                size = openssl.decrypt_into(memoryview(ciphertext_buffer)[:length], plaintext_buffer, *params)
+                self.assertEqual(data, bytes(plaintext_buffer[:size]))
+
+                encrypted = io.BytesIO()
+                params = openssl.encrypt_stream(io.BytesIO(data), encrypted, chunk_size=100)
+                decrypted = io.BytesIO()
+                params = params if isinstance(params, tuple) else (params,)
+                openssl.decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, *params, chunk_size=100)
+                self.assertEqual(data, decrypted.getvalue())
+
+        aes = AESEncryption(raw=True, backend=CRYPTOGRAPHY)
+        ciphertext, tag, nonce = aes.encrypt(data)
+        with self.assertRaises(ValueError):
+            aes.decrypt(ciphertext, bytes(16), nonce)
+        with self.assertRaises(ValueError):
+            RC4Encryption(backend=CRYPTOGRAPHY)
+
+    def test_aes_modes(self):
+        """
+        Test every AES mode round trips and that only the AEAD modes return and check a tag.
+        """
+        data = self.plaintext_bytes * 50
+        for mode in AES_NONCE_SIZES:
+            with self.subTest(mode=mode):
+                aes = AESEncryption(raw=True, mode=mode)
+                ciphertext, tag, nonce = aes.encrypt(data)
+                self.assertEqual(AES_NONCE_SIZES[mode], len(nonce))
+                self.assertEqual(aes.ciphertext_size(len(data)), len(ciphertext))
+                self.assertEqual(data, aes.decrypt(ciphertext, tag, nonce))
+                if mode in AEAD_MODES:
+                    with self.assertRaises(ValueError):
+                        aes.decrypt(ciphertext, bytes(16), nonce)
+                else:
+                    self.assertIsNone(tag)
+
+                if mode != 'SIV':
+                    encrypted = io.BytesIO()
+                    tag, nonce = aes.encrypt_stream(io.BytesIO(data), encrypted, chunk_size=100)
+                    decrypted = io.BytesIO()
+                    aes.decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, tag, nonce, chunk_size=100)
+                    self.assertEqual(data, decrypted.getvalue())
+
+        with self.assertRaises(ValueError):
+            AESEncryption(mode='OCB', backend=CRYPTOGRAPHY)
+        with self.assertRaises(ValueError):
+            AESEncryption(mode='CTR').encrypt_segmented(data)
+
+    def test_modern_ciphers(self):
+        """
+        Test CAST-128, ChaCha20, ChaCha20-Poly1305, Salsa20 and Twofish round trips.
+        """
+        cipher_classes = [CAST128Encryption, ChaCha20Encryption, ChaCha20Poly1305Encryption, Salsa20Encryption]
+        if Twofish is not None:
+            cipher_classes.append(TwofishEncryption)
+        for cipher_class in cipher_classes:
+            with self.subTest(cipher=cipher_class.__name__):
+                cipher = cipher_class()
+                result = cipher.encrypt(self.plaintext)
+                args = result if isinstance(result, tuple) else (result,)
+                self.assertEqual(self.plaintext, cipher.decrypt(*args))
+
+                batch = cipher.encrypt_many([self.plaintext, '', self.plaintext * 3])
+                self.assertEqual([self.plaintext, '', self.plaintext * 3], cipher.decrypt_many(*batch))
+
+        chacha = ChaCha20Encryption(raw=True)
+        openssl = ChaCha20Encryption(raw=True, backend=CRYPTOGRAPHY)
+        openssl.key = chacha.key
+        self.assertEqual(self.plaintext_bytes, openssl.decrypt(*chacha.encrypt(self.plaintext_bytes)))
+
+        aead = ChaCha20Poly1305Encryption(raw=True)
+        ciphertext, tag, nonce = aead.encrypt(self.plaintext_bytes)
+        with self.assertRaises(ValueError):
+            aead.decrypt(ciphertext, bytes(16), nonce)
+
+    @unittest.skipIf(Twofish is None, "twofish package not installed")
+    def test_twofish_known_answer(self):
+        """
+        Test the Twofish CBC chaining against the published all-zero test vector.
+        """
+        twofish = TwofishEncryption(raw=True)
+        twofish.key = bytes(16)
+        twofish.iv = bytes(16)
+        ciphertext, _ = twofish.encrypt(bytes(16))
+        self.assertEqual('9f589f5cf6122c32b6bfec2f2ae8c35a', ciphertext[:16].hex())
+
+    def test_phase_timing(self):
+        """
+        Test key generation, key schedule and bulk timing and the fitted message cost.
+        """
+        for cipher in (AESEncryption(raw=True, mode='SIV'), BlowfishEncryption(raw=True), RC4Encryption(raw=True)):
+            with self.subTest(cipher=cipher.name):
+                phases = measure_phases(cipher, self.plaintext_bytes * 100, repeats=5)
+                for phase in ('key_generation_time', 'key_schedule_time', 'bulk_time'):
+                    self.assertGreater(phases[phase], 0)
+                self.assertEqual(0, phases['bulk_bytes'] % max(cipher.ciphertext_size(0), 1))
+
+                cost = measure_message_cost(cipher, sizes=(16, 4096, 65536), repeats=2)
+                self.assertGreater(cost['per_byte_cost'], 0)
+        with self.assertRaises(ValueError):
+            measure_message_cost(AESEncryption(), sizes=(1024, 1024, 1024))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+import unittest
+import os
+import csv
+import tempfile
+from src.time_gen import SymmetricTimeCalculator, AsymmetricTimeCalculator
+
+class TestAsymmetricTimeCalculator(unittest.TestCase):
+    """
+    Test cases for the asymmetric time estimates.
+    """
+
+    def setUp(self):
+        """
+        Write a results file with rows from both backends.
+        """
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.results_path = os.path.join(self.work_dir.name, 'asymmetric_analysis_results.csv')
+        rows = [
+            ['RSA', 'signing', 2048, '1mb.txt', 0.1, 1000, 'pycryptodome', '3'],
+            ['RSA', 'signing', 2048, '1mb.txt', 0.01, 9000, 'cryptography', '4'],
+            ['DH', 'key_exchange', 2048, '1mb.txt', 0.01, 500, 'cryptography', '4'],
+            ['X25519', 'key_exchange', 'Curve25519', '1mb.txt', 0.01, 700, 'cryptography', '4'],
+        ]
+        with open(self.results_path, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'operation', 'key_size', 'file_name', 'time_taken', 'rate', 'backend', 'version'])
+            writer.writerows(rows)
+
+    def tearDown(self):
+        """
+        Remove the results file.
+        """
+        self.work_dir.cleanup()
+
+    def test_backend_rates(self):
+        """
+        Test that pycryptodome rows are preferred and key exchange rows from other backends are kept.
+        """
+        calculator = AsymmetricTimeCalculator(self.results_path)
+        self.assertEqual(1000, calculator.rates['RSA']['signing'])
+        for algorithm in ('DH', 'X25519'):
+            estimate = calculator.calculate_time(algorithm, 1024, 'key_exchange')
+            self.assertGreater(estimate['estimated_time'], 0)
+
+class TestSymmetricTimeCalculator(unittest.TestCase):
+    """
+    Test cases for the symmetric time estimates.
+    """
+
+    def setUp(self):
+        """
+        Write a results file with rows from several modes and backends.
+        """
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.results_path = os.path.join(self.work_dir.name, 'symmetric_analysis_results.csv')
+        rows = [
+            ['AES', 'encryption', 32, '1mb.txt', 0.1, 100, 'pycryptodome', 'GCM'],
+            ['AES', 'encryption', 32, '1mb.txt', 0.1, 200, 'pycryptodome', 'CTR'],
+            ['AES', 'encryption', 32, '1mb.txt', 0.1, 300, 'cryptography', 'GCM'],
+            ['AES', 'encryption', 32, '1mb.txt', 0.1, 400, 'cryptography', 'CBC'],
+            ['ChaCha20', 'encryption', 32, '1mb.txt', 0.1, 500, 'pycryptodome', ''],
+            ['ChaCha20', 'encryption', 32, '1mb.txt', 0.1, 600, 'cryptography', ''],
+            ['Twofish', 'encryption', 16, '1mb.txt', 0.1, 700, 'twofish', 'CBC'],
+        ]
+        with open(self.results_path, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['algorithm', 'operation', 'key_size', 'file_name', 'time_taken', 'rate', 'backend', 'mode'])
+            writer.writerows(rows)
+
+    def tearDown(self):
+        """
+        Remove the results file.
+        """
+        self.work_dir.cleanup()
+
+    def test_backend_and_mode_rates(self):
+        """
+        Test that pycryptodome rows of the chosen mode are used whatever order the rows come in.
+        """
+        rates = SymmetricTimeCalculator(self.results_path).rates
+        self.assertEqual(100, rates['AES']['encryption'])
+        self.assertEqual(500, rates['CHACHA20']['encryption'])
+        self.assertEqual(700, rates['TWOFISH']['encryption'])
+        self.assertEqual(200, SymmetricTimeCalculator(self.results_path, mode='CTR').rates['AES']['encryption'])
+
+if __name__ == '__main__':
+    unittest.main()